@@ -0,0 +1,40 @@
+import numpy as np
+
+class BufferArena:
+    """Reusable scratch arrays keyed by name, shape and dtype.
+
+    Repeated ticks of the same size get the same arrays back, so the hot path
+    writes into them with out= instead of allocating. A buffer's contents last
+    until the next request for the same key; anything that must outlive the
+    tick is copied out of the arena.
+    """
+
+    def __init__(self):
+        self.buffers = {}  # (name, shape, dtype) -> array
+        self.allocations = 0
+        self.reuses = 0
+
+    def get(self, name, shape, dtype=np.float64, fill=None):
+        """Buffer for (name, shape, dtype), optionally filled with a value."""
+        shape = tuple(shape) if np.iterable(shape) else (int(shape),)
+        key = (name, shape, np.dtype(dtype).str)
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = self.buffers[key] = np.empty(shape, dtype=dtype)
+            self.allocations += 1
+        else:
+            self.reuses += 1
+        if fill is not None:
+            buffer.fill(fill)
+        return buffer
+
+    def clear(self):
+        self.buffers.clear()
+
+    def get_stats(self):
+        return {
+            "buffers": len(self.buffers),
+            "bytes": sum(buffer.nbytes for buffer in self.buffers.values()),
+            "allocations": self.allocations,
+            "reuses": self.reuses
+        }
@@ -0,0 +1,65 @@
+class ChangeBus:
+    """Parameter-change notifications with a dirty flag per parameter group.
+
+    notify() marks groups dirty and update() marks the groups whose values
+    differ from the last ones it saw. Dirty groups accumulate until the next
+    flush, which calls each listener once with the dirty groups it subscribed
+    to; listeners of untouched groups are not called. With a schedule
+    callable (e.g. a Qt single-shot timer) the flush is deferred, so a burst
+    of slider events costs one recompute; without one, notify() flushes at
+    once. Nothing runs while nothing changes.
+    """
+
+    def __init__(self, schedule=None):
+        self.schedule = schedule  # Callable(flush) deferring a flush, or None to flush immediately
+        self.listeners = {}  # Name -> (groups or None for every group, callback(dirty groups))
+        self.values = {}  # Group -> value last seen by update()
+        self.dirty = set()
+        self.pending = False
+        self.notifications = 0
+        self.flushes = 0
+
+    def subscribe(self, name, callback, groups=None):
+        if name in self.listeners:
+            raise ValueError(f"Listener already registered: {name}")
+        self.listeners[name] = (None if groups is None else frozenset(groups), callback)
+
+    def unsubscribe(self, name):
+        self.listeners.pop(name, None)
+
+    def notify(self, *groups):
+        """Mark groups dirty and make sure a flush follows."""
+        self.dirty.update(groups)
+        self.notifications += 1
+        if self.pending:
+            return
+        self.pending = True
+        if self.schedule is None:
+            self.flush()
+        else:
+            self.schedule(self.flush)
+
+    def update(self, values):
+        """Notify the groups of values (group -> comparable value) that changed since the last update."""
+        changed = [group for group, value in values.items()
+                   if group not in self.values or self.values[group] != value]
+        self.values.update(values)
+        if changed:
+            self.notify(*changed)
+        return changed
+
+    def flush(self):
+        """Deliver the dirty groups to the listeners that depend on them."""
+        dirty, self.dirty = self.dirty, set()
+        self.pending = False
+        if not dirty:
+            return
+        self.flushes += 1
+        for name, (groups, callback) in list(self.listeners.items()):
+            hit = dirty if groups is None else dirty & groups
+            if hit:
+                callback(frozenset(hit))
+
+    def get_stats(self):
+        return {"notifications": self.notifications, "flushes": self.flushes,
+                "listeners": len(self.listeners), "pending": self.pending}
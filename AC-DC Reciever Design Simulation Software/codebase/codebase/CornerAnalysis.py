@@ -0,0 +1,108 @@
+import itertools
+import numpy as np
+from ParameterSweep import ParameterSweep
+from MonteCarlo import MonteCarloAnalysis
+
+class CornerAnalysis:
+    """Worst-case metrics over the 2^N tolerance corners, with heuristic pruning or exhaustively.
+
+    One-at-a-time runs at ±tolerance give a separable estimate of every corner.
+    Corners are simulated in order of their estimate; once the largest
+    estimation error seen so far, times a safety factor, cannot lift any
+    remaining corner past the worst simulated one, the rest are pruned. The
+    observed error does not bound the interaction terms of unsimulated
+    corners, so a pruned run reports the worst corner found, not a guaranteed
+    bound; exhaustive=True simulates every corner.
+    """
+
+    # Metric -> +1 if the worst case is the largest value, -1 if it is the smallest
+    worst_sense = {"ripple_voltage": 1, "headroom": -1}
+
+    def __init__(self, model, tolerances=None, margin_factor=2.0, batch_size=8, settle_periods=30, exhaustive=False):
+        self.sweep = ParameterSweep(model)
+        self.tolerances = dict(MonteCarloAnalysis.default_tolerances if tolerances is None else tolerances)
+        if len(self.tolerances) > 20:
+            raise ValueError("Corner analysis is limited to 20 toleranced parameters")
+        self.nominal = {name: getattr(model, name) for name in self.tolerances}
+        self.margin_factor = margin_factor  # Heuristic safety factor on the observed estimation error
+        self.exhaustive = exhaustive  # Simulate all 2^N corners instead of pruning
+        self.batch_size = batch_size  # Corners simulated per vectorized batch
+        self.settle_periods = settle_periods  # Fallback settling when no periodic orbit is found
+        self.simulated = {}  # Corner index -> metrics of its full simulation
+        self.n_evaluations = 0
+
+    def get_values(self, signs):
+        """Parameter columns for rows of signs (-1 low, 0 nominal, +1 high)."""
+        return {name: self.nominal[name] * (1 + signs[:, k] * tolerance)
+                for k, (name, tolerance) in enumerate(self.tolerances.items())}
+
+    def evaluate(self, signs):
+        """Steady-state output ripple and regulator headroom for each row of signs."""
+        values = self.get_values(signs)
+        batch = self.sweep.build_batch(values, np.arange(len(signs)))
+        solver = batch.steady_state_solver
+        n_period, _ = solver.get_period()
+        waveforms = solver.simulate(1)
+        if not np.all(solver.converged):
+            # No periodic orbit (e.g. a saturating op-amp filter): measure the last period of a longer run
+            waveforms = solver.simulate(self.settle_periods + 1)
+        shape = (len(signs), len(waveforms["t"]))  # Rows that no parameter reaches come back unbatched
+        filtered = np.broadcast_to(waveforms["filtered"], shape)[:, -n_period:]
+        regulated = np.broadcast_to(waveforms["regulated"], shape)[:, -n_period:]
+        self.n_evaluations += len(signs)
+        return {
+            "ripple_voltage": np.ptp(regulated, axis=-1),
+            "headroom": np.min(filtered, axis=-1) - batch.linear_vref  # Margin above the regulator reference (V)
+        }
+
+    def run(self):
+        """Worst corner of every metric: value, corner parameters and how many corners were simulated.
+
+        "exhaustive" is True when every corner was simulated, so the value is the
+        worst corner; otherwise the heuristically pruned corners were not checked.
+        """
+        n = len(self.tolerances)
+        corners = np.array(list(itertools.product((-1, 1), repeat=n)))
+        self.simulated = {}
+        self.n_evaluations = 0
+
+        # Nominal point and one-at-a-time ±tolerance runs, as one batch
+        one_at_a_time = np.vstack((np.zeros((1, n)), np.eye(n), -np.eye(n)))
+        sensitivity = self.evaluate(one_at_a_time)
+
+        results = {}
+        for metric, sense in self.worst_sense.items():
+            nominal = sense * sensitivity[metric][0]
+            up = sense * sensitivity[metric][1:n + 1] - nominal
+            down = sense * sensitivity[metric][n + 1:] - nominal
+            estimate = nominal + np.sum(np.where(corners > 0, up, down), axis=1)
+
+            order = np.argsort(-estimate)
+            worst, worst_index, max_error, position = -np.inf, order[0], 0.0, 0
+            while position < len(order):
+                if (not self.exhaustive and position > 0 and
+                        estimate[order[position]] + self.margin_factor * max_error <= worst):
+                    break
+                candidates = order[position:position + self.batch_size]
+                missing = [index for index in candidates if index not in self.simulated]
+                if missing:
+                    metrics = self.evaluate(corners[missing])
+                    for row, index in enumerate(missing):
+                        self.simulated[index] = {name: value[row] for name, value in metrics.items()}
+                for index in candidates:
+                    value = sense * self.simulated[index][metric]
+                    max_error = max(max_error, abs(value - estimate[index]))
+                    if value > worst:
+                        worst, worst_index = value, index
+                position += len(candidates)
+
+            results[metric] = {
+                "worst_found": sense * worst,
+                "nominal": sense * nominal,
+                "corner": {name: float(v[0]) for name, v in self.get_values(corners[[worst_index]]).items()},
+                "simulated": position,
+                "heuristically_pruned": len(corners) - position,
+                "exhaustive": position == len(corners),
+                "max_estimate_error": max_error
+            }
+        return results
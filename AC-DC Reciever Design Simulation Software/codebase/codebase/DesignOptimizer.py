@@ -0,0 +1,159 @@
+import numpy as np
+from scipy.stats import qmc
+from MonteCarlo import run_chunk
+
+def pareto_ranks(cost, performance):
+    """Non-dominated sorting rank (0 = Pareto front) of points minimizing both objectives."""
+    ranks = np.full(len(cost), -1)
+    rank = 0
+    while np.any(ranks < 0):
+        remaining = np.flatnonzero(ranks < 0)
+        for i in remaining:
+            others = remaining[remaining != i]
+            dominated = np.any((cost[others] <= cost[i]) & (performance[others] <= performance[i]) &
+                               ((cost[others] < cost[i]) | (performance[others] < performance[i])))
+            if not dominated:
+                ranks[i] = rank
+        rank += 1
+    return ranks
+
+class DesignOptimizer:
+    """Spec-constrained search of filter parameters for minimum component cost.
+
+    Candidates lie on a logarithmic grid (steps_per_decade values per decade,
+    like an E-series), so repeated candidates are served from the evaluation
+    cache. A small evolutionary search evaluates each generation as one
+    vectorized sweep, ranks feasible designs by Pareto rank on (cost,
+    performance) and infeasible ones by spec violation, and the Pareto front
+    of every feasible design evaluated is reported.
+    """
+
+    # Parameter -> (cost coefficient, exponent): cost = coefficient * value**exponent
+    cost_model = {
+        "filter_capacitance": (1e4, 1),  # 100 µF costs 1 unit
+        "filter_inductance": (100, 1),  # 10 mH costs 1 unit
+        "active_filter_cutoff": (100, -1)  # A lower cutoff needs larger RC parts; 100 Hz costs 1 unit
+    }
+    default_bounds = {
+        "capacitive": {"filter_capacitance": (10e-6, 4700e-6)},
+        "inductive": {"filter_inductance": (1e-3, 1.0)},
+        "active": {"active_filter_cutoff": (1, 1000)}
+    }
+    # Metric -> +1 if smaller is better, -1 if larger is better
+    performance_sense = {"ripple_voltage": 1, "thd_n": 1, "efficiency": -1, "temperature": 1}
+
+    def __init__(self, model, specs, bounds=None, performance="ripple_voltage", population=32,
+                 generations=15, steps_per_decade=48, seed=None, t=None, stage="modulated"):
+        if performance not in self.performance_sense:
+            raise ValueError(f"Unknown performance metric: {performance}")
+        self.config = model.get_config()
+        self.specs = specs  # Metric -> (low, high)
+        self.bounds = dict(self.default_bounds[model.filter_type] if bounds is None else bounds)
+        for name in self.bounds:
+            if name not in self.cost_model:
+                raise ValueError(f"No cost model for parameter: {name}")
+        self.performance = performance
+        self.population = population
+        self.generations = generations
+        self.steps_per_decade = steps_per_decade
+        self.t = np.linspace(0, 0.1, 1000) if t is None else t
+        self.stage = stage
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+        self.grid_size = np.array([int(round(np.log10(high / low) * steps_per_decade))
+                                   for low, high in self.bounds.values()])
+        self.cache = {}  # Grid point -> metrics of its evaluation
+        self.cache_hits = 0
+
+    def get_values(self, grid):
+        """Parameter values of rows of grid indices."""
+        return {name: low * 10 ** (grid[:, k] / self.steps_per_decade)
+                for k, (name, (low, high)) in enumerate(self.bounds.items())}
+
+    def get_cost(self, values):
+        cost = 0
+        for name, value in values.items():
+            coefficient, exponent = self.cost_model[name]
+            cost = cost + coefficient * value ** exponent
+        return cost
+
+    def evaluate(self, grid):
+        """Metrics for rows of grid indices, simulating only points not already in the cache."""
+        keys = [tuple(row) for row in grid.tolist()]
+        missing = list(dict.fromkeys(key for key in keys if key not in self.cache))
+        self.cache_hits += len(keys) - len(missing)
+        if missing:
+            metrics = run_chunk(self.config, self.get_values(np.array(missing)), self.t, self.stage)
+            for row, key in enumerate(missing):
+                self.cache[key] = {name: metrics[name][row] for name in self.performance_sense}
+        return {name: np.array([self.cache[key][name] for key in keys]) for name in self.performance_sense}
+
+    def get_violation(self, metrics):
+        """Total relative spec violation of each candidate (0 when every spec is met)."""
+        violation = 0
+        for name, (low, high) in self.specs.items():
+            value = metrics[name]
+            scale = max([abs(bound) for bound in (low, high) if np.isfinite(bound)] + [1e-12])
+            excess = np.maximum(low - value, 0) + np.maximum(value - high, 0)
+            violation = violation + np.where(np.isfinite(value), excess / scale, np.inf)
+        return violation
+
+    def rank(self, grid):
+        """Order of candidates: feasible by Pareto rank then cost, then infeasible by violation."""
+        metrics = self.evaluate(grid)
+        cost = self.get_cost(self.get_values(grid))
+        performance = self.performance_sense[self.performance] * metrics[self.performance]
+        violation = self.get_violation(metrics)
+        feasible = violation == 0
+        ranks = np.full(len(grid), len(grid))
+        if np.any(feasible):
+            ranks[feasible] = pareto_ranks(cost[feasible], performance[feasible])
+        return np.lexsort((cost, ranks, violation))
+
+    def run(self):
+        """Search the design space; returns the cheapest feasible design and the Pareto front."""
+        n = len(self.bounds)
+        sampler = qmc.Sobol(n, scramble=True, seed=self.seed)
+        grid = np.round(sampler.random(self.population) * self.grid_size).astype(int)
+        for generation in range(self.generations):
+            order = self.rank(grid)
+            parents = grid[order[:self.population // 2]]
+            # Uniform crossover between random parent pairs, then a small step along the grid
+            pairs = self.rng.integers(0, len(parents), (self.population, 2))
+            mask = self.rng.random((self.population, n)) < 0.5
+            children = np.where(mask, parents[pairs[:, 0]], parents[pairs[:, 1]])
+            children += np.round(self.rng.normal(0, 0.05, children.shape) * self.grid_size).astype(int)
+            children = np.clip(children, 0, self.grid_size)
+            combined = np.unique(np.vstack((grid, children)), axis=0)
+            grid = combined[self.rank(combined)[:self.population]]
+        return self.get_results()
+
+    def get_results(self):
+        keys = list(self.cache)
+        grid = np.array(keys)
+        values = self.get_values(grid)
+        metrics = {name: np.array([self.cache[key][name] for key in keys]) for name in self.performance_sense}
+        cost = self.get_cost(values)
+        feasible = np.flatnonzero(self.get_violation(metrics) == 0)
+        designs = []
+        for i in feasible:
+            designs.append({
+                "parameters": {name: float(v[i]) for name, v in values.items()},
+                "cost": float(cost[i]),
+                "metrics": {name: float(v[i]) for name, v in metrics.items()}
+            })
+        designs.sort(key=lambda design: design["cost"])
+        # Pareto front: each costlier design must perform strictly better than every cheaper one
+        sense = self.performance_sense[self.performance]
+        front, best = [], np.inf
+        for design in designs:
+            performance = sense * design["metrics"][self.performance]
+            if performance < best:
+                front.append(design)
+                best = performance
+        return {
+            "best": designs[0] if designs else None,
+            "pareto_front": front,
+            "evaluations": len(self.cache),
+            "cache_hits": self.cache_hits
+        }
@@ -1,75 +1,101 @@
-import numpy as np
-
-class EMIAnalyzer:
-    def __init__(self, model):
-        self.model = model
-        self.conducted_emi = 0.0
-        self.radiated_emi = 0.0
-        self.emi_spectrum = []
-        self.freq_bands = np.logspace(np.log10(150e3), np.log10(1e9), 50)  # 150 kHz to 1 GHz
-        self.emi_filter_enabled = False
-        self.cispr_limits = self.generate_cispr_limits()
-
-    def generate_cispr_limits(self):
-        """Generate CISPR 22 Class B limits (dBµV)."""
-        limits = np.zeros_like(self.freq_bands)
-        for i, f in enumerate(self.freq_bands):
-            if f <= 30e6:  # Conducted (150 kHz–30 MHz)
-                limits[i] = 60 if f < 5e6 else 56
-            else:  # Radiated (30 MHz–1 GHz)
-                limits[i] = 40 if f < 230e6 else 47
-        return limits
-
-    def compute_emi(self, t, signal):
-        """Compute conducted and radiated EMI levels."""
-        if self.model.regulator_type != "switching" or not self.model.power_on:
-            self.conducted_emi = self.radiated_emi = 0.0
-            return
-        emi_freq = self.model.switching_freq
-        # Conducted EMI (150 kHz–30 MHz)
-        conducted_signal = 0.01 * np.sin(2 * np.pi * emi_freq * t) * np.max(np.abs(signal))
-        v_rms_conducted = np.sqrt(np.mean(conducted_signal ** 2))
-        conducted_dbuv = 20 * np.log10(v_rms_conducted * 1e6) if v_rms_conducted > 0 else 0.0
-        # Radiated EMI (30 MHz–1 GHz, scaled down)
-        radiated_signal = 0.005 * np.sin(2 * np.pi * emi_freq * 10 * t) * np.max(np.abs(signal))
-        v_rms_radiated = np.sqrt(np.mean(radiated_signal ** 2))
-        radiated_dbuv = 20 * np.log10(v_rms_radiated * 1e6) if v_rms_radiated > 0 else 0.0
-        # Apply EMI filter
-        filter_attenuation = 20 if self.emi_filter_enabled else 0
-        self.conducted_emi = max(0.0, min(conducted_dbuv - filter_attenuation, 120.0))
-        self.radiated_emi = max(0.0, min(radiated_dbuv - filter_attenuation, 120.0))
-
-    def compute_emi_spectrum(self, t, signal):
-        """Compute EMI spectrum."""
-        if self.model.regulator_type != "switching" or not self.model.power_on:
-            self.emi_spectrum = np.zeros(len(self.freq_bands))
-            return
-        emi_spectrum = []
-        for f in self.freq_bands:
-            emi_signal = 0.01 * np.sin(2 * np.pi * f * t) * np.max(np.abs(signal))
-            v_rms = np.sqrt(np.mean(emi_signal ** 2))
-            emi_dbuv = 20 * np.log10(v_rms * 1e6) if v_rms > 0 else 0.0
-            filter_attenuation = 20 if self.emi_filter_enabled else 0
-            emi_spectrum.append(max(0.0, min(emi_dbuv - filter_attenuation, 120.0)))
-        self.emi_spectrum = np.array(emi_spectrum)
-
-    def toggle_emi_filter(self, enabled):
-        """Toggle EMI filter."""
-        self.emi_filter_enabled = enabled
-
-    def update(self, t, signal):
-        """Update EMI levels and spectrum."""
-        self.compute_emi(t, signal)
-        self.compute_emi_spectrum(t, signal)
-
-    def get_conducted_emi(self):
-        """Return conducted EMI level."""
-        return self.conducted_emi
-
-    def get_radiated_emi(self):
-        """Return radiated EMI level."""
-        return self.radiated_emi
-
-    def get_emi_spectrum(self):
-        """Return EMI spectrum and CISPR limits."""
+import numpy as np
+from Precision import precision
+from BufferArena import BufferArena
+
+class EMIAnalyzer:
+    max_block_samples = 1 << 18  # Band x sample elements per tone_rms block (2 MiB of float64 phases)
+
+    def __init__(self, model):
+        self.model = model
+        self.conducted_emi = 0.0
+        self.radiated_emi = 0.0
+        self.emi_spectrum = []
+        self.freq_bands = np.logspace(np.log10(150e3), np.log10(1e9), 50)  # 150 kHz to 1 GHz
+        self.emi_filter_enabled = False
+        self.cispr_limits = self.generate_cispr_limits()
+        self.arena = BufferArena()
+
+    def generate_cispr_limits(self):
+        """Generate CISPR 22 Class B limits (dBµV)."""
+        limits = np.zeros_like(self.freq_bands)
+        for i, f in enumerate(self.freq_bands):
+            if f <= 30e6:  # Conducted (150 kHz–30 MHz)
+                limits[i] = 60 if f < 5e6 else 56
+            else:  # Radiated (30 MHz–1 GHz)
+                limits[i] = 40 if f < 230e6 else 47
+        return limits
+
+    def tone_rms(self, t, omega, amplitude, peak):
+        """RMS of amplitude * sin(omega * t) * peak for each angular frequency in omega.
+
+        Bands are evaluated together as rows of reused (bands, samples) buffers,
+        in blocks of at most max_block_samples elements.
+        """
+        omega = np.atleast_1d(omega)
+        n = len(t)
+        block = max(1, min(len(omega), self.max_block_samples // max(n, 1)))
+        phase = self.arena.get("phase", (block, n))
+        tone = self.arena.get("tone", (block, n), precision.get_dtype())
+        rms = np.empty(len(omega), dtype=tone.dtype)
+        for start in range(0, len(omega), block):
+            k = min(block, len(omega) - start)
+            np.multiply(omega[start:start + k, None], t, out=phase[:k])
+            np.sin(phase[:k], out=tone[:k])
+            tone[:k] *= amplitude
+            tone[:k] *= peak
+            np.square(tone[:k], out=tone[:k])
+            rms[start:start + k] = np.sqrt(np.mean(tone[:k], axis=1))
+        return rms
+
+    def compute_emi(self, t, signal):
+        """Compute conducted and radiated EMI levels."""
+        if self.model.regulator_type != "switching" or not self.model.power_on:
+            self.conducted_emi = self.radiated_emi = 0.0
+            return
+        emi_freq = self.model.switching_freq
+        peak = np.max(np.abs(signal))
+        # Phases stay in float64 (f * t reaches 1e8 cycles); the sine values are stored in the working precision
+        # Conducted EMI (150 kHz–30 MHz)
+        v_rms_conducted = self.tone_rms(t, 2 * np.pi * emi_freq, 0.01, peak)[0]
+        conducted_dbuv = 20 * np.log10(v_rms_conducted * 1e6) if v_rms_conducted > 0 else 0.0
+        # Radiated EMI (30 MHz–1 GHz, scaled down)
+        v_rms_radiated = self.tone_rms(t, 2 * np.pi * emi_freq * 10, 0.005, peak)[0]
+        radiated_dbuv = 20 * np.log10(v_rms_radiated * 1e6) if v_rms_radiated > 0 else 0.0
+        # Apply EMI filter
+        filter_attenuation = 20 if self.emi_filter_enabled else 0
+        self.conducted_emi = max(0.0, min(conducted_dbuv - filter_attenuation, 120.0))
+        self.radiated_emi = max(0.0, min(radiated_dbuv - filter_attenuation, 120.0))
+
+    def compute_emi_spectrum(self, t, signal):
+        """Compute EMI spectrum."""
+        if self.model.regulator_type != "switching" or not self.model.power_on:
+            self.emi_spectrum = np.zeros(len(self.freq_bands))
+            return
+        emi_spectrum = []
+        peak = np.max(np.abs(signal))
+        for v_rms in self.tone_rms(t, 2 * np.pi * self.freq_bands, 0.01, peak):
+            emi_dbuv = 20 * np.log10(v_rms * 1e6) if v_rms > 0 else 0.0
+            filter_attenuation = 20 if self.emi_filter_enabled else 0
+            emi_spectrum.append(max(0.0, min(emi_dbuv - filter_attenuation, 120.0)))
+        self.emi_spectrum = np.array(emi_spectrum)
+
+    def toggle_emi_filter(self, enabled):
+        """Toggle EMI filter."""
+        self.emi_filter_enabled = enabled
+
+    def update(self, t, signal):
+        """Update EMI levels and spectrum."""
+        self.compute_emi(t, signal)
+        self.compute_emi_spectrum(t, signal)
+
+    def get_conducted_emi(self):
+        """Return conducted EMI level."""
+        return self.conducted_emi
+
+    def get_radiated_emi(self):
+        """Return radiated EMI level."""
+        return self.radiated_emi
+
+    def get_emi_spectrum(self):
+        """Return EMI spectrum and CISPR limits."""
         return self.freq_bands, self.emi_spectrum, self.cispr_limits
\ No newline at end of file
@@ -0,0 +1,190 @@
+import numpy as np
+from scipy import signal
+from Kernels import kernels
+
+class FilterEngine:
+    """Block evaluation of the first-order filter recurrences used by ReceiverModel."""
+
+    def __init__(self):
+        self.min_segment = 8  # Samples in one mode before switching to block evaluation
+        self.block_size = 256  # Initial look-ahead window for a segment (samples)
+
+    def is_batch(self, x, *params):
+        """True when x or a coefficient carries a configuration axis (column parameters)."""
+        return np.ndim(x) > 1 or any(np.ndim(p) > 0 for p in params)
+
+    def get_rows(self, x, *params):
+        """x as [rows, n_samples] and each parameter as one float per row, plus the batch shape."""
+        x = np.asarray(x, dtype=float)
+        rows = np.broadcast_shapes(x.shape[:-1], *[np.shape(p)[:-1] for p in params if np.ndim(p) > 0])
+        shape = rows + x.shape[-1:]
+        x_rows = np.ascontiguousarray(np.broadcast_to(x, shape).reshape(-1, x.shape[-1]))
+        # Scalars or columns of shape (n_configs, 1): one value per row
+        p_rows = [np.ascontiguousarray(np.broadcast_to(p, rows + (1,)).reshape(-1), dtype=float) for p in params]
+        return x_rows, p_rows, shape
+
+    def get_output(self, out, shape):
+        """Output array of the given shape: out when the caller passes one, else a new array."""
+        return np.empty(shape) if out is None else out
+
+    def map_rows(self, func, x, *params, kernel=None, out=None):
+        """Apply a 1-D filter to every row of a [n_configs, n_samples] batch, writing into out.
+
+        With the JIT backend and a row kernel name, the whole batch runs in
+        that compiled kernel instead of one Python call per row.
+        """
+        x_rows, p_rows, shape = self.get_rows(x, *params)
+        y = self.get_output(out, shape)
+        y_rows = y.reshape(x_rows.shape)  # A view for the contiguous arrays and row slices the model passes
+        if kernel is not None and kernels.get_backend() == "jit":
+            kernels.get(kernel)(x_rows, *p_rows, y_rows)
+        else:
+            for k in range(len(x_rows)):
+                func(x_rows[k], *[float(p[k]) for p in p_rows], out=y_rows[k])
+        if not np.may_share_memory(y_rows, y):
+            y[...] = y_rows.reshape(shape)
+        return y
+
+    def first_order_lowpass(self, x, alpha, y0=0.0, out=None):
+        """y[i] = y[i-1] + alpha * (x[i] - y[i-1]), with y[-1] = y0, as one IIR block.
+
+        The JIT backend runs the same recurrence compiled, in lfilter's
+        operation order, writing straight into out.
+        """
+        if self.is_batch(x, alpha, y0):
+            if kernels.get_backend() == "jit":
+                return self.map_rows(self.first_order_lowpass, x, alpha, y0, kernel="first_order_lowpass_rows", out=out)
+            x_rows, (alpha, y0), shape = self.get_rows(x, alpha, y0)
+            y = self.get_output(out, shape)
+            y_rows = y.reshape(x_rows.shape)
+            for a in np.unique(alpha):
+                # One IIR call for all rows sharing a coefficient
+                rows = alpha == a
+                pole = 1 - a
+                y_rows[rows], _ = signal.lfilter([a], [1, -pole], x_rows[rows], axis=-1, zi=(pole * y0[rows])[:, None])
+            if not np.may_share_memory(y_rows, y):
+                y[...] = y_rows.reshape(shape)
+            return y
+        x = np.asarray(x, dtype=float)
+        if len(x) == 0:
+            return self.get_output(out, 0)
+        if kernels.get_backend() == "jit":
+            return kernels.get("first_order_lowpass")(x, float(alpha), float(y0), self.get_output(out, len(x)))
+        pole = 1 - alpha
+        y, _ = signal.lfilter([alpha], [1, -pole], x, zi=[pole * y0])
+        if out is None:
+            return y
+        out[...] = y
+        return out
+
+    def peak_detector(self, x, decay, y0=0.0, out=None):
+        """y[i] = max(x[i], decay * y[i-1]): ideal-diode charging, exact RC discharge between.
+
+        The diode conducts wherever the source exceeds the decayed capacitor
+        voltage, so y[i] = decay^(i+1) * max(y0, max_k x[k] / decay^(k+1)),
+        evaluated in blocks short enough for decay^-k to stay finite.
+        """
+        if self.is_batch(x, decay, y0):
+            return self.map_rows(self.peak_detector, x, decay, y0, kernel="peak_hold_rows", out=out)
+        x = np.ascontiguousarray(x, dtype=float)
+        n = len(x)
+        y = self.get_output(out, n)
+        if kernels.get_backend() == "jit":
+            # Compiled recurrence: one pass, no block rescaling
+            return kernels.get("peak_hold")(x, float(decay), float(y0), y)
+        rate = -np.log(decay) if decay > 0 else np.inf  # Discharge per sample (nepers)
+        block = n if rate == 0 else int(600 / rate)
+        prev = float(y0)
+        if block < self.min_segment:
+            # Discharge is nearly complete within one sample; step directly
+            return kernels.get("peak_hold")(x, float(decay), prev, y)
+        scale = decay ** np.arange(1, min(block, n) + 1)
+        for start in range(0, n, block):
+            seg = x[start:start + block]
+            s = scale[:len(seg)]
+            held = np.maximum.accumulate(seg / s)
+            y[start:start + len(seg)] = s * np.maximum(held, prev)
+            prev = y[start + len(seg) - 1]
+        return y
+
+    def clamped_lowpass(self, x, alpha, y0=0.0, out=None):
+        """y[i] = max(y[i-1] + alpha * (x[i] - y[i-1]), 0), stepped per sample."""
+        if self.is_batch(x, alpha, y0):
+            return self.map_rows(self.clamped_lowpass, x, alpha, y0, kernel="clamped_lowpass_rows", out=out)
+        x = np.ascontiguousarray(x, dtype=float)
+        return kernels.get("clamped_lowpass")(x, float(alpha), float(y0), self.get_output(out, len(x)))
+
+    def opamp_lowpass(self, x, alpha, gain, max_output, y0=0.0, out=None):
+        """y[i] = y[i-1] + alpha * clip(gain * (x[i] - y[i-1]), -max_output, max_output).
+
+        With the JIT backend the recurrence runs in the compiled opamp_lowpass
+        kernel. Otherwise runs of linear or saturated samples longer than
+        min_segment are evaluated as blocks (IIR or constant slew) and short
+        runs are stepped one sample at a time.
+        """
+        if self.is_batch(x, alpha, gain, max_output, y0):
+            return self.map_rows(self.opamp_lowpass, x, alpha, gain, max_output, y0, kernel="opamp_lowpass_rows",
+                                 out=out)
+        x = np.ascontiguousarray(x, dtype=float)
+        n = len(x)
+        y = self.get_output(out, n)
+        if kernels.get_backend() == "jit":
+            # Chattering (non-contracting) loops never form long runs; step them all compiled
+            return kernels.get("opamp_lowpass")(x, float(alpha), float(gain), float(max_output), float(y0), y)
+        xs = x.tolist()
+        slew = alpha * max_output  # Output change per saturated sample
+        contracting = abs(1 - alpha * gain) < 1  # Linear region does not amplify errors
+        prev = float(y0)
+        mode = None  # +1/-1 saturated, 0 linear
+        run = 0
+        i = 0
+        while i < n:
+            drive = gain * (xs[i] - prev)
+            if drive >= max_output:
+                m = 1
+            elif drive <= -max_output:
+                m = -1
+            else:
+                m = 0
+            run = run + 1 if m == mode else 1
+            mode = m
+            if run >= self.min_segment and (m != 0 or contracting):
+                i, prev = self._segment(x, y, i, prev, m, alpha, gain, max_output, slew)
+                mode = None
+                run = 0
+                continue
+            if m == 0:
+                prev = prev + alpha * drive
+            else:
+                prev = prev + m * slew
+            y[i] = prev
+            i += 1
+        return y
+
+    def _segment(self, x, y, i, prev, mode, alpha, gain, max_output, slew):
+        """Fill y from index i while the op-amp stays in one mode; return (next index, state)."""
+        n = len(x)
+        window = self.block_size
+        while i < n:
+            end = min(i + window, n)
+            if mode == 0:
+                seg = self.first_order_lowpass(x[i:end], alpha * gain, prev)
+                drive = gain * (x[i:end] - np.concatenate(([prev], seg[:-1])))
+                ok = np.abs(drive) < max_output
+            else:
+                # Saturated op-amp: output slews by a constant step per sample
+                ramp = np.cumsum(np.concatenate(([prev], np.full(end - i, mode * slew))))
+                seg = ramp[1:]
+                drive = gain * (x[i:end] - ramp[:-1])
+                ok = drive >= max_output if mode > 0 else drive <= -max_output
+            count = end - i if ok.all() else int(np.argmin(ok))
+            if count == 0:
+                break
+            y[i:i + count] = seg[:count]
+            prev = float(seg[count - 1])
+            if i + count < end:
+                i += count
+                break
+            i = end
+            window *= 2
+        return i, prev
@@ -0,0 +1,324 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None  # JIT backend unavailable; kernels run as NumPy/Python code
+
+class KernelRegistry:
+    """Sequential numeric kernels with an optional Numba JIT backend and a NumPy fallback.
+
+    Each kernel has a NumPy implementation and a plain-loop implementation that
+    Numba compiles (the same function when the NumPy one is already a loop).
+    The "auto" backend uses the JIT path when Numba is installed; "numpy" and
+    "jit" force one path for benchmarking and cross-validation.
+    """
+
+    backends = ("auto", "numpy", "jit")
+
+    def __init__(self):
+        self.kernels = {}  # Name -> (NumPy implementation, loop implementation for Numba)
+        self.compiled = {}  # Name -> compiled loop implementation
+        self.backend = "auto"
+
+    def register(self, name, numpy_impl, loop_impl=None):
+        self.kernels[name] = (numpy_impl, loop_impl if loop_impl is not None else numpy_impl)
+        self.compiled.pop(name, None)
+
+    def set_backend(self, backend):
+        backend = backend.lower()
+        if backend not in self.backends:
+            raise ValueError(f"Unknown kernel backend: {backend}")
+        if backend == "jit" and numba is None:
+            raise ValueError("The jit kernel backend requires Numba")
+        self.backend = backend
+
+    def get_backend(self):
+        """Backend in use after resolving "auto": "jit" or "numpy"."""
+        if self.backend == "numpy" or numba is None:
+            return "numpy"
+        return "jit"
+
+    def get(self, name, backend=None):
+        """Kernel function for the active backend, or for an explicitly requested one."""
+        if name not in self.kernels:
+            raise ValueError(f"Unknown kernel: {name}")
+        backend = self.get_backend() if backend is None else backend
+        if backend == "numpy":
+            return self.kernels[name][0]
+        if numba is None:
+            raise ValueError("The jit kernel backend requires Numba")
+        if name not in self.compiled:
+            self.compiled[name] = numba.njit(cache=True)(self.kernels[name][1])
+        return self.compiled[name]
+
+    def compare(self, name, *args):
+        """Largest absolute difference between the NumPy and JIT results for the same arguments.
+
+        Each backend gets its own copy of the array arguments, so kernels that
+        write into an output argument do not share it.
+        """
+        reference = self.get(name, "numpy")(*[np.copy(a) if isinstance(a, np.ndarray) else a for a in args])
+        result = self.get(name, "jit")(*[np.copy(a) if isinstance(a, np.ndarray) else a for a in args])
+        if not isinstance(reference, tuple):
+            reference, result = (reference,), (result,)
+        return max(float(np.max(np.abs(np.asarray(a) - np.asarray(b)))) for a, b in zip(reference, result))
+
+def first_order_lowpass(x, alpha, y0, y):
+    """y[i] = alpha * x[i] + (1 - alpha) * y[i-1], with y[-1] = y0, written into y.
+
+    Same operation order as scipy.signal.lfilter([alpha], [1, alpha - 1]), so both agree exactly.
+    """
+    pole = 1 - alpha
+    state = pole * y0
+    for i, value in enumerate(x.tolist()):
+        y[i] = state + alpha * value
+        state = pole * y[i]
+    return y
+
+def first_order_lowpass_loop(x, alpha, y0, y):
+    pole = 1 - alpha
+    state = pole * y0
+    for i in range(len(x)):
+        y[i] = state + alpha * x[i]
+        state = pole * y[i]
+    return y
+
+def clamped_lowpass(x, alpha, y0, y):
+    """y[i] = max(y[i-1] + alpha * (x[i] - y[i-1]), 0), with y[-1] = y0, written into y."""
+    prev = float(y0)
+    for i, value in enumerate(x.tolist()):
+        prev = max(prev + alpha * (value - prev), 0)
+        y[i] = prev
+    return y
+
+def clamped_lowpass_loop(x, alpha, y0, y):
+    prev = y0
+    for i in range(len(x)):
+        prev = max(prev + alpha * (x[i] - prev), 0.0)
+        y[i] = prev
+    return y
+
+def opamp_lowpass(x, alpha, gain, max_output, y0, y):
+    """y[i] = y[i-1] + alpha * clip(gain * (x[i] - y[i-1]), -max_output, max_output), with y[-1] = y0, written into y."""
+    prev = float(y0)
+    for i, value in enumerate(x.tolist()):
+        prev = prev + alpha * min(max(gain * (value - prev), -max_output), max_output)
+        y[i] = prev
+    return y
+
+def opamp_lowpass_loop(x, alpha, gain, max_output, y0, y):
+    prev = y0
+    for i in range(len(x)):
+        prev = prev + alpha * min(max(gain * (x[i] - prev), -max_output), max_output)
+        y[i] = prev
+    return y
+
+def first_order_lowpass_rows(x, alpha, y0, y):
+    """first_order_lowpass of every row of x, with one alpha and y0 per row."""
+    for k in range(len(x)):
+        first_order_lowpass(x[k], alpha[k], y0[k], y[k])
+    return y
+
+def first_order_lowpass_rows_loop(x, alpha, y0, y):
+    for k in range(x.shape[0]):
+        pole = 1 - alpha[k]
+        state = pole * y0[k]
+        for i in range(x.shape[1]):
+            y[k, i] = state + alpha[k] * x[k, i]
+            state = pole * y[k, i]
+    return y
+
+def clamped_lowpass_rows(x, alpha, y0, y):
+    """clamped_lowpass of every row of x, with one alpha and y0 per row."""
+    for k in range(len(x)):
+        clamped_lowpass(x[k], alpha[k], y0[k], y[k])
+    return y
+
+def clamped_lowpass_rows_loop(x, alpha, y0, y):
+    for k in range(x.shape[0]):
+        prev = y0[k]
+        for i in range(x.shape[1]):
+            prev = max(prev + alpha[k] * (x[k, i] - prev), 0.0)
+            y[k, i] = prev
+    return y
+
+def opamp_lowpass_rows(x, alpha, gain, max_output, y0, y):
+    """opamp_lowpass of every row of x, with one coefficient set and y0 per row."""
+    for k in range(len(x)):
+        opamp_lowpass(x[k], alpha[k], gain[k], max_output[k], y0[k], y[k])
+    return y
+
+def opamp_lowpass_rows_loop(x, alpha, gain, max_output, y0, y):
+    for k in range(x.shape[0]):
+        prev = y0[k]
+        for i in range(x.shape[1]):
+            prev = prev + alpha[k] * min(max(gain[k] * (x[k, i] - prev), -max_output[k]), max_output[k])
+            y[k, i] = prev
+    return y
+
+def peak_hold_rows(x, decay, y0, y):
+    """peak_hold of every row of x, with one decay and y0 per row."""
+    for k in range(len(x)):
+        peak_hold(x[k], decay[k], y0[k], y[k])
+    return y
+
+def peak_hold_rows_loop(x, decay, y0, y):
+    for k in range(x.shape[0]):
+        prev = y0[k]
+        for i in range(x.shape[1]):
+            prev = max(x[k, i], decay[k] * prev)
+            y[k, i] = prev
+    return y
+
+def peak_hold(x, decay, y0, y):
+    """y[i] = max(x[i], decay * y[i-1]), with y[-1] = y0, written into y."""
+    prev = float(y0)
+    for i, value in enumerate(x.tolist()):
+        prev = max(value, decay * prev)
+        y[i] = prev
+    return y
+
+def peak_hold_loop(x, decay, y0, y):
+    prev = y0
+    for i in range(len(x)):
+        prev = max(x[i], decay * prev)
+        y[i] = prev
+    return y
+
+def thermal_rc(diode_power, mosfet_power, diode_temp, mosfet_temp, ambient_temp,
+               r_diode, r_mosfet, c_diode, c_mosfet, coupling, delta_t,
+               diode_temp_data, mosfet_temp_data, system_temp_data):
+    """Coupled diode/MOSFET junction RC network, Euler-stepped once per power sample.
+
+    Writes the diode, MOSFET and system (average) temperature traces into the
+    given arrays and returns them.
+    """
+    n = len(diode_power)
+    for i in range(n):
+        # Diode temperature
+        coupling_heat = coupling * (mosfet_temp - diode_temp)
+        diode_temp += (diode_power[i] * r_diode + coupling_heat - (diode_temp - ambient_temp)) * delta_t / c_diode
+        diode_temp_data[i] = diode_temp
+
+        # MOSFET temperature
+        coupling_heat = coupling * (diode_temp - mosfet_temp)
+        mosfet_temp += (mosfet_power[i] * r_mosfet + coupling_heat - (mosfet_temp - ambient_temp)) * delta_t / c_mosfet
+        mosfet_temp_data[i] = mosfet_temp
+
+        # System temperature (average)
+        system_temp_data[i] = (diode_temp + mosfet_temp) / 2.0
+    return diode_temp_data, mosfet_temp_data, system_temp_data
+
+def switching_transients(t, period, duty_cycle, t_on, t_off, tau, v_gate, v_supply, i_load, r_on):
+    """Gate voltage, drain-source voltage and drain current of a hard-switched device.
+
+    Linear current/voltage ramps over t_on/t_off, with an RC gate charge of time constant tau.
+    """
+    t_cycle = t % period
+    t_high = duty_cycle * period
+    t_off_phase = t_cycle - t_high
+    on = t_cycle < t_high
+    turning_on = on & (t_cycle < t_on)
+    turning_off = ~on & (t_cycle < t_high + t_off)
+    fully_on = on & ~turning_on
+    states = [turning_on, fully_on, turning_off]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        v_g = np.select(states, [v_gate * (1 - np.exp(-t_cycle / tau)), v_gate, v_gate * np.exp(-t_off_phase / tau)], 0.0)
+        v_ds = np.select(states, [v_supply * (1 - t_cycle / t_on), i_load * r_on, v_supply * (t_off_phase / t_off)], v_supply)
+        i_ds = np.select(states, [i_load * (t_cycle / t_on), i_load, i_load * (1 - t_off_phase / t_off)], 0.0)
+    return v_g, v_ds, i_ds
+
+def switching_transients_loop(t, period, duty_cycle, t_on, t_off, tau, v_gate, v_supply, i_load, r_on):
+    n = len(t)
+    v_g = np.empty(n)
+    v_ds = np.empty(n)
+    i_ds = np.empty(n)
+    for i in range(n):
+        t_cycle = t[i] % period
+        if t_cycle < duty_cycle * period:
+            if t_cycle < t_on:
+                # Turn-on transient
+                v_g[i] = v_gate * (1 - np.exp(-t_cycle / tau))
+                v_ds[i] = v_supply * (1 - t_cycle / t_on)
+                i_ds[i] = i_load * (t_cycle / t_on)
+            else:
+                # Fully on
+                v_g[i] = v_gate
+                v_ds[i] = i_load * r_on
+                i_ds[i] = i_load
+        elif t_cycle < duty_cycle * period + t_off:
+            # Turn-off transient
+            t_off_phase = t_cycle - duty_cycle * period
+            v_g[i] = v_gate * np.exp(-t_off_phase / tau)
+            v_ds[i] = v_supply * (t_off_phase / t_off)
+            i_ds[i] = i_load * (1 - t_off_phase / t_off)
+        else:
+            # Fully off
+            v_g[i] = 0.0
+            v_ds[i] = v_supply
+            i_ds[i] = 0.0
+    return v_g, v_ds, i_ds
+
+def interpolate_uniform(x, scale, offset, values, slopes, gain):
+    """gain times the linear interpolation in a uniform-grid table, at index u = x * scale + offset.
+
+    slopes[k] = values[k + 1] - values[k]; outside the table u is clamped, so the
+    end values hold (the last slope must be 0).
+    """
+    u = np.clip(x * scale + offset, 0, len(values) - 1)
+    i = u.astype(np.intp)
+    return gain * (np.take(values, i) + np.take(slopes, i) * (u - i))
+
+def interpolate_uniform_loop(x, scale, offset, values, slopes, gain):
+    y = np.empty(len(x))
+    last = len(values) - 1.0
+    for k in range(len(x)):
+        u = min(max(x[k] * scale + offset, 0.0), last)
+        i = int(u)
+        y[k] = gain * (values[i] + slopes[i] * (u - i))
+    return y
+
+def jiles_atherton(h_field, magnetization, M_s, H_c):
+    """One step of the simplified Jiles-Atherton hysteresis model; returns the new magnetization (A/m)."""
+    a = H_c / 2  # Domain wall pinning constant
+    alpha = 1e-3  # Inter-domain coupling
+    k = H_c  # Domain wall pinning constant
+    c = 0.1  # Reversible magnetization coefficient
+
+    # Effective field
+    H_eff = h_field + alpha * magnetization
+
+    # Anhysteretic magnetization (Langevin function approximation)
+    # Avoid division by zero in the Langevin function
+    if abs(H_eff / a) < 1e-6:
+        M_an = M_s * (H_eff / (3 * a))
+    else:
+        M_an = M_s * (1 / np.tanh(H_eff / a) - a / H_eff)
+
+    # Differential equation for magnetization (simplified)
+    delta_M = M_an - magnetization
+    if abs(k - alpha * delta_M) < 1e-6:
+        dM_dH = 0.0
+    else:
+        dM_dH = delta_M / (k - alpha * delta_M)
+    delta = 1 if h_field > 0 else -1
+    dM_dH = dM_dH * (1 - c) + c * delta_M / a
+    magnetization += dM_dH * delta
+
+    # Limit magnetization to saturation
+    return max(-M_s, min(M_s, magnetization))
+
+kernels = KernelRegistry()
+kernels.register("first_order_lowpass", first_order_lowpass, first_order_lowpass_loop)
+kernels.register("clamped_lowpass", clamped_lowpass, clamped_lowpass_loop)
+kernels.register("peak_hold", peak_hold, peak_hold_loop)
+kernels.register("opamp_lowpass", opamp_lowpass, opamp_lowpass_loop)
+kernels.register("first_order_lowpass_rows", first_order_lowpass_rows, first_order_lowpass_rows_loop)
+kernels.register("clamped_lowpass_rows", clamped_lowpass_rows, clamped_lowpass_rows_loop)
+kernels.register("opamp_lowpass_rows", opamp_lowpass_rows, opamp_lowpass_rows_loop)
+kernels.register("peak_hold_rows", peak_hold_rows, peak_hold_rows_loop)
+kernels.register("thermal_rc", thermal_rc)
+kernels.register("switching_transients", switching_transients, switching_transients_loop)
+kernels.register("jiles_atherton", jiles_atherton)
+kernels.register("interpolate_uniform", interpolate_uniform, interpolate_uniform_loop)
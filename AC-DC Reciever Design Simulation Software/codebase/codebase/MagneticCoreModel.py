@@ -0,0 +1,85 @@
+import numpy as np
+from Kernels import kernels
+
+class MagneticCoreModel:
+    def __init__(self, model):
+        self.model = model
+        self.core_material = "Ferrite"  # Default material
+        self.h_field_base = 100.0  # Base magnetic field intensity (A/m) set by user
+        self.h_field = 0.0  # Current magnetic field intensity (A/m), will vary with simulation
+        self.b_field = 0.0  # Magnetic flux density (T)
+        self.magnetization = 0.0  # Magnetization (A/m)
+        self.saturation_percent = 0.0  # |B| relative to B_sat (%)
+        self.time = 0.0  # Simulation time
+        self.h_history = []  # History of H values for hysteresis loop
+        self.b_history = []  # History of B values for hysteresis loop
+        self.max_history = 200  # Number of points to store for the hysteresis loop
+        self.update_core_properties()
+
+    def set_core_material(self, material):
+        self.core_material = material
+        self.update_core_properties()
+
+    def set_magnetic_field(self, h_field_base):
+        self.h_field_base = h_field_base
+
+    def update_core_properties(self):
+        # Material properties (simplified for demonstration)
+        # B_sat: Saturation flux density (T)
+        # mu_r: Relative permeability
+        # H_c: Coercivity (A/m)
+        # M_s: Saturation magnetization (A/m)
+        self.material_properties = {
+            "Ferrite": {"B_sat": 0.4, "mu_r": 2000, "H_c": 20, "M_s": 3e5},
+            "Iron Powder": {"B_sat": 1.0, "mu_r": 100, "H_c": 50, "M_s": 8e5},
+            "Silicon Steel": {"B_sat": 1.5, "mu_r": 4000, "H_c": 10, "M_s": 1.2e6}
+        }
+        self.B_sat = self.material_properties[self.core_material]["B_sat"]
+        self.mu_r = self.material_properties[self.core_material]["mu_r"]
+        self.H_c = self.material_properties[self.core_material]["H_c"]
+        self.M_s = self.material_properties[self.core_material]["M_s"]
+        self.mu_0 = 4 * np.pi * 1e-7  # Permeability of free space (H/m)
+
+    def step(self, dt=0.05):
+        """Advance the Jiles-Atherton hysteresis model by one time step."""
+        # Increment simulation time
+        self.time += dt
+
+        # Get the frequency from the model (in Hz)
+        freq = self.model.frequency
+
+        # Compute a time-varying H field: H(t) = H_base * sin(2πft)
+        self.h_field = self.h_field_base * np.sin(2 * np.pi * freq * self.time)
+
+        # Simplified Jiles-Atherton model for hysteresis, limited to saturation
+        self.magnetization = kernels.get("jiles_atherton")(
+            float(self.h_field), float(self.magnetization), float(self.M_s), float(self.H_c))
+
+        # Magnetic flux density B = mu_0 * (H + M)
+        self.b_field = self.mu_0 * (self.h_field + self.magnetization)
+
+        # Limit B to saturation
+        self.b_field = max(-self.B_sat, min(self.B_sat, self.b_field))
+
+        # Calculate saturation percentage
+        self.saturation_percent = (abs(self.b_field) / self.B_sat) * 100
+
+        # Update history for hysteresis loop
+        self.h_history.append(self.h_field)
+        self.b_history.append(self.b_field)
+        if len(self.h_history) > self.max_history:
+            self.h_history.pop(0)
+            self.b_history.pop(0)
+
+    def get_metrics(self):
+        """Return the current field values of the core."""
+        return {
+            "h_field": self.h_field,
+            "b_field": self.b_field,
+            "magnetization": self.magnetization,
+            "saturation": self.saturation_percent
+        }
+
+    def get_hysteresis_loop(self):
+        # Return the history of H and B values for plotting
+        return np.array(self.h_history), np.array(self.b_history)
\ No newline at end of file
@@ -1,1163 +1,1209 @@
-import sys
-import numpy as np
-import pyqtgraph as pg
-from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
-    QLineEdit, QComboBox, QPushButton, QSlider, QSplitter, QApplication,
-    QScrollArea, QTabWidget, QGridLayout
-)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QDoubleValidator, QFont
-from ReceiverModel import ReceiverModel
-from StabilityAnalysis import StabilityAnalyzer
-from HarmonicAnalysis import HarmonicAnalyzer
-from PowerFactorCorrection import PowerFactorCorrection
-from SNR_Analysis import SNRAnalyzer
-from THD_Analysis import THDAnalyzer
-from EMI_Analysis import EMIAnalyzer
-from ThermalModeling import ThermalAnalyzer
-import time
-
-# Import the new magnetic core modeling classes
-from MagneticCoreModeling import MagneticCoreModeling
-from MagneticCoreAnalyzer import MagneticCoreAnalyzer
-
-class CollapsibleGroupBox(QGroupBox):
-    def __init__(self, title):
-        super().__init__(title)
-        self.setObjectName("panel")
-        self.toggle_button = QPushButton(f"{title}: ▼")
-        self.toggle_button.setCheckable(True)
-        self.toggle_button.setChecked(True)
-        self.toggle_button.clicked.connect(self.toggle_content)
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout()
-        self.content_widget.setLayout(self.content_layout)
-        self.main_layout = QVBoxLayout()
-        self.main_layout.addWidget(self.toggle_button)
-        self.main_layout.addWidget(self.content_widget)
-        self.setLayout(self.main_layout)
-
-    def toggle_content(self, checked):
-        self.content_widget.setVisible(checked)
-        self.toggle_button.setText(f"{self.title()}: {'▼' if checked else '▶'}")
-
-class ControlPanel(QWidget):
-    def __init__(self, model, update_callback, parent=None):
-        super().__init__(parent)
-        self.model = model
-        self.update_callback = update_callback
-        self.dynamic_mode = False
-        self.noise_level = 0.0
-        self.dynamic_start_time = None
-        self.init_ui()
-
-    def init_ui(self):
-        content_widget = QWidget()
-        layout = QVBoxLayout()
-        layout.setSpacing(10)
-        layout.setContentsMargins(15, 15, 15, 15)
-
-        # Receiver Controls
-        receiver_group = CollapsibleGroupBox("RECEIVER CONTROLS")
-        receiver_layout = receiver_group.content_layout
-
-        # Frequency control
-        freq_group = QGroupBox("FREQUENCY (Hz)")
-        freq_group.setObjectName("panel")
-        freq_layout = QHBoxLayout()
-        freq_label = QLabel("FREQ:")
-        freq_label.setObjectName("led-label")
-        self.freq_value = QLabel("1000")
-        self.freq_value.setObjectName("led-display")
-        self.freq_slider = QSlider(Qt.Horizontal)
-        self.freq_slider.setRange(100, 10000)
-        self.freq_slider.setValue(1000)
-        self.freq_slider.setMinimumWidth(300)
-        self.freq_slider.valueChanged.connect(self.update_frequency)
-        freq_layout.addWidget(freq_label)
-        freq_layout.addWidget(self.freq_slider)
-        freq_layout.addWidget(self.freq_value)
-        freq_group.setLayout(freq_layout)
-        receiver_layout.addWidget(freq_group)
-
-        # Gain control
-        gain_group = QGroupBox("GAIN (dB)")
-        gain_group.setObjectName("panel")
-        gain_layout = QHBoxLayout()
-        gain_label = QLabel("GAIN:")
-        gain_label.setObjectName("led-label")
-        self.gain_value = QLabel("0")
-        self.gain_value.setObjectName("led-display")
-        self.gain_slider = QSlider(Qt.Horizontal)
-        self.gain_slider.setRange(-20, 20)
-        self.gain_slider.setValue(0)
-        self.gain_slider.setMinimumWidth(300)
-        self.gain_slider.valueChanged.connect(self.update_gain)
-        gain_layout.addWidget(gain_label)
-        gain_layout.addWidget(self.gain_slider)
-        gain_layout.addWidget(self.gain_value)
-        gain_group.setLayout(gain_layout)
-        receiver_layout.addWidget(gain_group)
-
-        # Signal mode control
-        signal_group = QGroupBox("SIGNAL MODE")
-        signal_group.setObjectName("panel")
-        signal_layout = QHBoxLayout()
-        self.signal_combo = QComboBox()
-        self.signal_combo.addItems(["Analog", "Digital", "Mixed"])
-        self.signal_combo.currentTextChanged.connect(self.update_signal_mode)
-        signal_layout.addWidget(self.signal_combo)
-        signal_group.setLayout(signal_layout)
-        receiver_layout.addWidget(signal_group)
-
-        # Modulation control
-        mod_group = QGroupBox("MODULATION")
-        mod_group.setObjectName("panel")
-        mod_layout = QHBoxLayout()
-        self.mod_button_am = QPushButton("AM")
-        self.mod_button_am.setCheckable(True)
-        self.mod_button_am.clicked.connect(lambda: self.update_modulation("AM"))
-        self.mod_button_fm = QPushButton("FM")
-        self.mod_button_fm.setCheckable(True)
-        self.mod_button_fm.clicked.connect(lambda: self.update_modulation("FM"))
-        mod_layout.addWidget(self.mod_button_am)
-        mod_layout.addWidget(self.mod_button_fm)
-        mod_layout.addStretch()
-        mod_group.setLayout(mod_layout)
-        receiver_layout.addWidget(mod_group)
-
-        # Analysis mode control
-        analysis_group = QGroupBox("ANALYSIS MODE")
-        analysis_group.setObjectName("panel")
-        analysis_layout = QHBoxLayout()
-        self.analysis_combo = QComboBox()
-        self.analysis_combo.addItems(["Transient", "Steady-State", "Frequency"])
-        self.analysis_combo.currentTextChanged.connect(self.update_analysis_mode)
-        analysis_layout.addWidget(self.analysis_combo)
-        analysis_group.setLayout(analysis_layout)
-        receiver_layout.addWidget(analysis_group)
-
-        layout.addWidget(receiver_group)
-
-        # Filter/Regulator Controls
-        filter_reg_group = CollapsibleGroupBox("FILTER/REGULATOR")
-        filter_reg_layout = filter_reg_group.content_layout
-
-        # Rectifier control
-        rect_group = QGroupBox("RECTIFIER")
-        rect_group.setObjectName("panel")
-        rect_layout = QHBoxLayout()
-        self.rect_combo = QComboBox()
-        self.rect_combo.addItems(["Half-Wave", "Full-Wave", "Bridge"])
-        self.rect_combo.currentTextChanged.connect(self.update_rectifier)
-        rect_layout.addWidget(self.rect_combo)
-        rect_group.setLayout(rect_layout)
-        filter_reg_layout.addWidget(rect_group)
-
-        # Filter control
-        filter_group = QGroupBox("FILTER TYPE")
-        filter_group.setObjectName("panel")
-        filter_layout = QHBoxLayout()
-        self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["Capacitive", "Inductive", "Active"])
-        self.filter_combo.currentTextChanged.connect(self.update_filter_type)
-        filter_layout.addWidget(self.filter_combo)
-        filter_group.setLayout(filter_layout)
-        filter_reg_layout.addWidget(filter_group)
-
-        # Filter parameters
-        filter_params_group = QGroupBox("FILTER PARAMETERS")
-        filter_params_group.setObjectName("panel")
-        filter_params_layout = QVBoxLayout()
-        self.cap_input = QLineEdit("100")
-        self.cap_input.setValidator(QDoubleValidator(0, 1000, 2))
-        self.cap_input.textChanged.connect(self.update_capacitance)
-        filter_params_layout.addWidget(QLabel("CAP (µF):").setObjectName("led-label"))
-        filter_params_layout.addWidget(self.cap_input)
-        self.inductance_input = QLineEdit("10")
-        self.inductance_input.setValidator(QDoubleValidator(0.1, 100, 2))
-        self.inductance_input.textChanged.connect(self.update_inductance)
-        filter_params_layout.addWidget(QLabel("IND (mH):").setObjectName("led-label"))
-        filter_params_layout.addWidget(self.inductance_input)
-        self.active_cutoff_input = QLineEdit("100")
-        self.active_cutoff_input.setValidator(QDoubleValidator(10, 1000, 2))
-        self.active_cutoff_input.textChanged.connect(self.update_active_cutoff)
-        filter_params_layout.addWidget(QLabel("CUTOFF (Hz):").setObjectName("led-label"))
-        filter_params_layout.addWidget(self.active_cutoff_input)
-        filter_params_group.setLayout(filter_params_layout)
-        filter_reg_layout.addWidget(filter_params_group)
-
-        # Regulator control
-        reg_group = QGroupBox("REGULATOR")
-        reg_group.setObjectName("panel")
-        reg_layout = QHBoxLayout()
-        self.reg_combo = QComboBox()
-        self.reg_combo.addItems(["None", "Linear", "Switching"])
-        self.reg_combo.currentTextChanged.connect(self.update_regulator_type)
-        reg_layout.addWidget(self.reg_combo)
-        reg_group.setLayout(reg_layout)
-        filter_reg_layout.addWidget(reg_group)
-
-        # Regulator parameters
-        reg_params_group = QGroupBox("REGULATOR PARAMETERS")
-        reg_params_group.setObjectName("panel")
-        reg_params_layout = QVBoxLayout()
-        self.vref_input = QLineEdit("5.0")
-        self.vref_input.setValidator(QDoubleValidator(1.0, 20.0, 2))
-        self.vref_input.textChanged.connect(self.update_vref)
-        reg_params_layout.addWidget(QLabel("VREF (V):").setObjectName("led-label"))
-        reg_params_layout.addWidget(self.vref_input)
-        self.switching_freq_input = QLineEdit("10000")
-        self.switching_freq_input.setValidator(QDoubleValidator(1000, 50000, 2))
-        self.switching_freq_input.textChanged.connect(self.update_switching_freq)
-        reg_params_layout.addWidget(QLabel("SW FREQ (Hz):").setObjectName("led-label"))
-        reg_params_layout.addWidget(self.switching_freq_input)
-        reg_params_group.setLayout(reg_params_layout)
-        filter_reg_layout.addWidget(reg_params_group)
-
-        layout.addWidget(filter_reg_group)
-
-        # Nonlinear/PFC Controls
-        nonlinear_pfc_group = CollapsibleGroupBox("NONLINEAR/PFC")
-        nonlinear_pfc_layout = nonlinear_pfc_group.content_layout
-
-        # Transformer turns ratio control
-        turns_group = QGroupBox("TRANSFORMER")
-        turns_group.setObjectName("panel")
-        turns_layout = QVBoxLayout()
-        self.turns_input = QLineEdit("1.0")
-        self.turns_input.setValidator(QDoubleValidator(0.1, 10.0, 2))
-        self.turns_input.textChanged.connect(self.update_turns_ratio)
-        turns_layout.addWidget(QLabel("TURNS RATIO:").setObjectName("led-label"))
-        turns_layout.addWidget(self.turns_input)
-        turns_group.setLayout(turns_layout)
-        nonlinear_pfc_layout.addWidget(turns_group)
-
-        # Coil inductance control
-        coil_group = QGroupBox("COIL")
-        coil_group.setObjectName("panel")
-        coil_layout = QVBoxLayout()
-        self.coil_inductance_input = QLineEdit("1.0")
-        self.coil_inductance_input.setValidator(QDoubleValidator(0.1, 10.0, 2))
-        self.coil_inductance_input.textChanged.connect(self.update_coil_inductance)
-        coil_layout.addWidget(QLabel("IND (mH):").setObjectName("led-label"))
-        coil_layout.addWidget(self.coil_inductance_input)
-        coil_group.setLayout(coil_layout)
-        nonlinear_pfc_layout.addWidget(coil_group)
-
-        # Nonlinear device parameters
-        nonlinear_group = QGroupBox("NONLINEAR DEVICES")
-        nonlinear_group.setObjectName("panel")
-        nonlinear_layout = QVBoxLayout()
-        self.diode_is_input = QLineEdit("1e-12")
-        self.diode_is_input.setValidator(QDoubleValidator(1e-15, 1e-9, 15))
-        self.diode_is_input.textChanged.connect(self.update_diode_is)
-        nonlinear_layout.addWidget(QLabel("DIODE Is (A):").setObjectName("led-label"))
-        nonlinear_layout.addWidget(self.diode_is_input)
-        self.mosfet_vth_input = QLineEdit("2.0")
-        self.mosfet_vth_input.setValidator(QDoubleValidator(0.5, 5.0, 2))
-        self.mosfet_vth_input.textChanged.connect(self.update_mosfet_vth)
-        nonlinear_layout.addWidget(QLabel("MOSFET Vth (V):").setObjectName("led-label"))
-        nonlinear_layout.addWidget(self.mosfet_vth_input)
-        nonlinear_layout.setAlignment(Qt.AlignTop)
-        nonlinear_group.setLayout(nonlinear_layout)
-        nonlinear_pfc_layout.addWidget(nonlinear_group)
-
-        # Power factor correction control
-        pfc_group = QGroupBox("POWER FACTOR CORRECTION")
-        pfc_group.setObjectName("panel")
-        pfc_layout = QHBoxLayout()
-        self.pfc_button = QPushButton("PFC: OFF")
-        self.pfc_button.setCheckable(True)
-        self.pfc_button.clicked.connect(self.toggle_pfc)
-        self.pfc_combo = QComboBox()
-        self.pfc_combo.addItems(["None", "Active Boost", "Passive"])
-        self.pfc_combo.currentTextChanged.connect(self.update_pfc_type)
-        self.emi_filter_button = QPushButton("EMI FILTER: OFF")
-        self.emi_filter_button.setCheckable(True)
-        self.emi_filter_button.clicked.connect(self.toggle_emi_filter)
-        pfc_layout.addWidget(self.pfc_button)
-        pfc_layout.addWidget(self.pfc_combo)
-        pfc_layout.addWidget(self.emi_filter_button)
-        pfc_group.setLayout(pfc_layout)
-        nonlinear_pfc_layout.addWidget(pfc_group)
-
-        layout.addWidget(nonlinear_pfc_group)
-
-        # Magnetic Core Modeling Controls
-        magnetic_group = CollapsibleGroupBox("MAGNETIC CORE MODELING")
-        magnetic_layout = magnetic_group.content_layout
-
-        # Core Material Selection
-        core_material_group = QGroupBox("CORE MATERIAL")
-        core_material_group.setObjectName("panel")
-        core_material_layout = QHBoxLayout()
-        self.core_material_combo = QComboBox()
-        self.core_material_combo.addItems(["Ferrite", "Iron Powder", "Silicon Steel"])
-        self.core_material_combo.currentTextChanged.connect(self.update_core_material)
-        core_material_layout.addWidget(self.core_material_combo)
-        core_material_group.setLayout(core_material_layout)
-        magnetic_layout.addWidget(core_material_group)
-
-        # Magnetic Field Intensity
-        magnetic_field_group = QGroupBox("MAGNETIC FIELD (A/m)")
-        magnetic_field_group.setObjectName("panel")
-        magnetic_field_layout = QVBoxLayout()
-        self.h_field_input = QLineEdit("100.0")
-        self.h_field_input.setValidator(QDoubleValidator(0.0, 1000.0, 2))
-        self.h_field_input.textChanged.connect(self.update_magnetic_field)
-        magnetic_field_layout.addWidget(QLabel("H_FIELD (A/m):").setObjectName("led-label"))
-        magnetic_field_layout.addWidget(self.h_field_input)
-        magnetic_field_group.setLayout(magnetic_field_layout)
-        magnetic_layout.addWidget(magnetic_field_group)
-
-        layout.addWidget(magnetic_group)
-
-        # Add Launch Magnetic Core Analysis Button
-        self.magnetic_core_button = QPushButton("Magnetic Core Analysis")
-        if self.parent() and hasattr(self.parent(), 'launch_magnetic_core_window'):
-            self.magnetic_core_button.clicked.connect(self.parent().launch_magnetic_core_window)
-        else:
-            print("Warning: ControlPanel parent not set or lacks launch_magnetic_core_window method")
-        layout.addWidget(self.magnetic_core_button)
-
-        # Dynamic mode toggle
-        dynamic_group = QGroupBox("DYNAMIC SIMULATION")
-        dynamic_group.setObjectName("panel")
-        dynamic_layout = QHBoxLayout()
-        self.dynamic_button = QPushButton("DYNAMIC: OFF")
-        self.dynamic_button.setCheckable(True)
-        self.dynamic_button.clicked.connect(self.toggle_dynamic_mode)
-        dynamic_layout.addWidget(self.dynamic_button)
-        dynamic_group.setLayout(dynamic_layout)
-        layout.addWidget(dynamic_group)
-
-        # Noise level control
-        noise_group = QGroupBox("NOISE LEVEL")
-        noise_group.setObjectName("panel")
-        noise_layout = QHBoxLayout()
-        noise_label = QLabel("NOISE:")
-        noise_label.setObjectName("led-label")
-        self.noise_slider = QSlider(Qt.Horizontal)
-        self.noise_slider.setRange(0, 100)
-        self.noise_slider.setValue(0)
-        self.noise_slider.setMinimumWidth(300)
-        self.noise_slider.valueChanged.connect(self.update_noise_level)
-        self.noise_value = QLabel("0.00")
-        self.noise_value.setObjectName("led-display")
-        noise_layout.addWidget(noise_label)
-        noise_layout.addWidget(self.noise_slider)
-        noise_layout.addWidget(self.noise_value)
-        noise_group.setLayout(noise_layout)
-        layout.addWidget(noise_group)
-
-        # Power toggle
-        self.power_button = QPushButton("POWER")
-        self.power_button.setCheckable(True)
-        self.power_button.clicked.connect(self.toggle_power)
-        layout.addWidget(self.power_button)
-
-        # Analysis results
-        analysis_group = QGroupBox("ANALYSIS DISPLAY")
-        analysis_group.setObjectName("panel")
-        analysis_layout = QVBoxLayout()
-
-        # SNR Metrics
-        snr_group = QGroupBox("SNR METRICS")
-        snr_group.setObjectName("panel")
-        snr_layout = QGridLayout()
-        self.snr_label = QLabel("SNR: 0.00 dB")
-        self.snr_label.setObjectName("led-display")
-        self.noise_floor_label = QLabel("NOISE FLOOR: 0.00 dB")
-        self.noise_floor_label.setObjectName("led-display")
-        snr_layout.addWidget(QLabel("SNR:").setObjectName("led-label"), 0, 0)
-        snr_layout.addWidget(self.snr_label, 0, 1)
-        snr_layout.addWidget(QLabel("NOISE FLOOR:").setObjectName("led-label"), 1, 0)
-        snr_layout.addWidget(self.noise_floor_label, 1, 1)
-        snr_group.setLayout(snr_layout)
-        analysis_layout.addWidget(snr_group)
-
-        # THD Metrics
-        thd_group = QGroupBox("THD METRICS")
-        thd_group.setObjectName("panel")
-        thd_layout = QGridLayout()
-        self.thd_label = QLabel("THD: 0.00 %")
-        self.thd_label.setObjectName("led-display")
-        self.thdp_label = QLabel("THD-P: 0.00 %")
-        self.thdp_label.setObjectName("led-display")
-        self.h2_h3_label = QLabel("H2/H3: 0.00/0.00 %")
-        self.h2_h3_label.setObjectName("led-display")
-        thd_layout.addWidget(QLabel("THD:").setObjectName("led-label"), 0, 0)
-        thd_layout.addWidget(self.thd_label, 0, 1)
-        thd_layout.addWidget(QLabel("THD-P:").setObjectName("led-label"), 1, 0)
-        thd_layout.addWidget(self.thdp_label, 1, 1)
-        thd_layout.addWidget(QLabel("H2/H3:").setObjectName("led-label"), 2, 0)
-        thd_layout.addWidget(self.h2_h3_label, 2, 1)
-        thd_group.setLayout(thd_layout)
-        analysis_layout.addWidget(thd_group)
-
-        # EMI Metrics
-        emi_group = QGroupBox("EMI METRICS")
-        emi_group.setObjectName("panel")
-        emi_layout = QGridLayout()
-        self.emi_conducted_label = QLabel("EMI COND: 0.00 dBµV")
-        self.emi_conducted_label.setObjectName("led-display")
-        self.emi_radiated_label = QLabel("EMI RAD: 0.00 dBµV")
-        self.emi_radiated_label.setObjectName("led-display")
-        emi_layout.addWidget(QLabel("EMI COND:").setObjectName("led-label"), 0, 0)
-        emi_layout.addWidget(self.emi_conducted_label, 0, 1)
-        emi_layout.addWidget(QLabel("EMI RAD:").setObjectName("led-label"), 1, 0)
-        emi_layout.addWidget(self.emi_radiated_label, 1, 1)
-        emi_group.setLayout(emi_layout)
-        analysis_layout.addWidget(emi_group)
-
-        # Other Metrics
-        other_group = QGroupBox("OTHER METRICS")
-        other_group.setObjectName("panel")
-        other_layout = QGridLayout()
-        self.ripple_label = QLabel("RIPPLE: 0.00 V")
-        self.ripple_label.setObjectName("led-display")
-        self.avg_voltage_label = QLabel("AVG V: 0.00 V")
-        self.avg_voltage_label.setObjectName("led-display")
-        self.phase_label = QLabel("PHASE: 0.00 °")
-        self.phase_label.setObjectName("led-display")
-        self.power_label = QLabel("POWER: 0.00 W")
-        self.power_label.setObjectName("led-display")
-        self.temp_label = QLabel("TEMP: 25.00 °C")
-        self.temp_label.setObjectName("led-display")
-        self.eff_label = QLabel("EFF: 100.00 %")
-        self.eff_label.setObjectName("led-display")
-        self.pf_label = QLabel("PF: 1.00")
-        self.pf_label.setObjectName("led-display")
-        other_layout.addWidget(QLabel("RIPPLE:").setObjectName("led-label"), 0, 0)
-        other_layout.addWidget(self.ripple_label, 0, 1)
-        other_layout.addWidget(QLabel("AVG V:").setObjectName("led-label"), 1, 0)
-        other_layout.addWidget(self.avg_voltage_label, 1, 1)
-        other_layout.addWidget(QLabel("PHASE:").setObjectName("led-label"), 2, 0)
-        other_layout.addWidget(self.phase_label, 2, 1)
-        other_layout.addWidget(QLabel("POWER:").setObjectName("led-label"), 3, 0)
-        other_layout.addWidget(self.power_label, 3, 1)
-        other_layout.addWidget(QLabel("TEMP:").setObjectName("led-label"), 4, 0)
-        other_layout.addWidget(self.temp_label, 4, 1)
-        other_layout.addWidget(QLabel("EFF:").setObjectName("led-label"), 5, 0)
-        other_layout.addWidget(self.eff_label, 5, 1)
-        other_layout.addWidget(QLabel("PF:").setObjectName("led-label"), 6, 0)
-        other_layout.addWidget(self.pf_label, 6, 1)
-        other_group.setLayout(other_layout)
-        analysis_layout.addWidget(other_group)
-
-        analysis_group.setLayout(analysis_layout)
-        layout.addWidget(analysis_group)
-
-        layout.addStretch()
-        content_widget.setLayout(layout)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidget(content_widget)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: #2E2E2E;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: #2E2E2E;
-                width: 16px;
-                margin: 0px;
-                border: 1px solid #5C5C5C;
-            }
-            QScrollBar::handle:vertical {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
-                border: 1px solid #5C5C5C;
-                border-radius: 3px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                background: #3A3A3A;
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: #2E2E2E;
-            }
-        """)
-
-        main_layout = QVBoxLayout()
-        main_layout.addWidget(scroll_area)
-        self.setLayout(main_layout)
-
-        content_widget.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2E2E2E;
-                color: #FFFFFF;
-                font-family: 'Courier New';
-            }
-            QGroupBox#panel {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #4A4A4A, stop:1 #2E2E2E);
-                border: 3px outset #5C5C5C;
-                border-radius: 5px;
-                margin-top: 15px;
-                padding: 10px;
-                font: bold 12pt 'Courier New';
-                color: #FFFFFF;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
-                border: 2px outset #5C5C5C;
-                border-radius: 3px;
-                color: #FFFFFF;
-                font: bold 12pt 'Courier New';
-            }
-            QLineEdit, QComboBox {
-                background: #1A1A1A;
-                border: 2px inset #5C5C5C;
-                border-radius: 3px;
-                padding: 4px;
-                color: #FFFF99;
-                font: 12pt 'Courier New';
-            }
-            QComboBox::drop-down {
-                border: 2px outset #5C5C5C;
-                background: #3A3A3A;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #FFFFFF;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
-                border: 3px outset #6C6C6C;
-                border-radius: 5px;
-                padding: 6px;
-                color: #FFFFFF;
-                font: bold 12pt 'Courier New';
-                min-width: 80px;
-                min-height: 30px;
-            }
-            QPushButton:checked, QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3A3A3A, stop:1 #2E2E2E);
-                border: 3px inset #6C6C6C;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
-            }
-            QSlider {
-                background: #1A1A1A;
-                border: 2px inset #5C5C5C;
-                border-radius: 3px;
-                height: 20px;
-            }
-            QSlider::groove:horizontal {
-                background: #2E2E2E;
-                height: 8px;
-                margin: 2px 0;
-            }
-            QSlider::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
-                border: 2px outset #5C5C5C;
-                width: 20px;
-                margin: -8px 0;
-                border-radius: 5px;
-            }
-            QLabel#led-label {
-                background: transparent;
-                color: #FFFFFF;
-                font: bold 12pt 'Courier New';
-            }
-            QLabel#led-display {
-                background: #1A1A1A;
-                border: 2px inset #5C5C5C;
-                border-radius: 3px;
-                padding: 4px;
-                color: #FFFF99;
-                font: 12pt 'Courier New';
-            }
-        """)
-
-    def update_frequency(self, value):
-        try:
-            self.model.set_frequency(int(value))
-            self.freq_value.setText(str(value))
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_gain(self, value):
-        try:
-            self.model.set_gain(int(value))
-            self.gain_value.setText(str(value))
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_signal_mode(self, text):
-        self.model.set_signal_mode(text.lower())
-        self.update_callback()
-
-    def update_modulation(self, mod_type):
-        self.model.set_modulation(mod_type)
-        self.mod_button_am.setChecked(mod_type == "AM")
-        self.mod_button_fm.setChecked(mod_type == "FM")
-        self.update_callback()
-
-    def update_analysis_mode(self, text):
-        self.model.set_analysis_mode(text.replace("-", "_").lower())
-        self.update_callback()
-
-    def update_rectifier(self, text):
-        rectifier_map = {"Half-Wave": "half_wave", "Full-Wave": "full_wave", "Bridge": "bridge"}
-        self.model.rectifier_type = rectifier_map[text]
-        self.update_callback()
-
-    def update_filter_type(self, text):
-        self.model.set_filter_type(text.lower())
-        self.update_callback()
-
-    def update_capacitance(self):
-        try:
-            cap = float(self.cap_input.text()) * 1e-6
-            self.model.filter_capacitance = cap
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_inductance(self):
-        try:
-            inductance = float(self.inductance_input.text()) * 1e-3
-            self.model.set_filter_inductance(inductance)
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_active_cutoff(self):
-        try:
-            cutoff = float(self.active_cutoff_input.text())
-            self.model.set_active_filter_cutoff(cutoff)
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_regulator_type(self, text):
-        self.model.set_regulator_type(text.lower())
-        self.update_callback()
-
-    def update_vref(self):
-        try:
-            vref = float(self.vref_input.text())
-            self.model.set_linear_vref(vref)
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_switching_freq(self):
-        try:
-            freq = float(self.switching_freq_input.text())
-            self.model.set_switching_freq(freq)
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_turns_ratio(self):
-        try:
-            ratio = float(self.turns_input.text())
-            if ratio > 5:
-                from PyQt5.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "Warning", "High turns ratio may cause numerical instability.")
-            self.model.turns_ratio = ratio
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_coil_inductance(self):
-        try:
-            inductance = float(self.coil_inductance_input.text()) * 1e-3
-            self.model.set_coil_inductance(inductance)
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_diode_is(self):
-        try:
-            diode_is = float(self.diode_is_input.text())
-            self.model.diode_is = diode_is
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_mosfet_vth(self):
-        try:
-            vth = float(self.mosfet_vth_input.text())
-            self.model.mosfet_vth = vth
-            self.update_callback()
-        except ValueError:
-            pass
-
-    def update_core_material(self, text):
-        try:
-            if hasattr(self, 'magnetic_core_modeling'):
-                self.magnetic_core_modeling.set_core_material(text)
-                self.update_callback()
-        except Exception as e:
-            print(f"Error updating core material: {e}")
-
-    def update_magnetic_field(self):
-        try:
-            h_field = float(self.h_field_input.text())
-            if hasattr(self, 'magnetic_core_modeling'):
-                self.magnetic_core_modeling.set_magnetic_field(h_field)
-                self.update_callback()
-        except ValueError as e:
-            print(f"Error updating magnetic field: {e}")
-
-    def toggle_power(self, checked):
-        self.model.set_power(checked)
-        self.power_button.setText(f"POWER: {'ON' if checked else 'OFF'}")
-        if not checked:
-            self.dynamic_start_time = None
-        self.update_callback()
-
-    def toggle_dynamic_mode(self, checked):
-        self.dynamic_mode = checked
-        self.dynamic_button.setText(f"DYNAMIC: {'ON' if checked else 'OFF'}")
-        if checked and self.model.power_on:
-            self.dynamic_start_time = time.time()
-        else:
-            self.dynamic_start_time = None
-        self.update_callback()
-
-    def update_noise_level(self, value):
-        self.noise_level = value / 100.0
-        self.noise_value.setText(f"{self.noise_level:.2f}")
-        self.update_callback()
-
-    def toggle_pfc(self, checked):
-        self.pfc_enabled = checked
-        self.pfc_button.setText(f"PFC: {'ON' if checked else 'OFF'}")
-        pfc_type = self.pfc_combo.currentText().replace(" ", "_").lower()
-        self.pfc.set_pfc(checked, pfc_type)
-        self.update_callback()
-
-    def update_pfc_type(self, text):
-        pfc_type = text.replace(" ", "_").lower()
-        self.pfc.set_pfc(self.pfc_enabled, pfc_type)
-        self.update_callback()
-
-    def toggle_emi_filter(self, checked):
-        self.emi_analyzer.toggle_emi_filter(checked)
-        self.emi_filter_button.setText(f"EMI FILTER: {'ON' if checked else 'OFF'}")
-        self.update_callback()
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.model = ReceiverModel()
-        self.stability_analyzer = StabilityAnalyzer(self.model)
-        self.harmonic_analyzer = HarmonicAnalyzer(self.model)
-        self.pfc = PowerFactorCorrection(self.model)
-        self.snr_analyzer = SNRAnalyzer(self.model)
-        self.thd_analyzer = THDAnalyzer(self.model)
-        self.emi_analyzer = EMIAnalyzer(self.model)
-        self.magnetic_core_modeling = MagneticCoreModeling(self.model)
-        self.init_ui()
-        self.add_thermal_button()
-        self.add_magnetic_core_button()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_plots)
-        self.timer.start(50)
-
-    def init_ui(self):
-        self.setWindowTitle("AC/DC Receiver Simulator")
-        self.setGeometry(100, 100, 1600, 1000)
-
-        splitter = QSplitter(Qt.Horizontal)
-        self.control_panel = ControlPanel(self.model, self.update_plots, self)
-        self.control_panel.pfc = self.pfc
-        self.control_panel.pfc_enabled = False
-        self.control_panel.emi_analyzer = self.emi_analyzer
-        self.control_panel.magnetic_core_modeling = self.magnetic_core_modeling
-        splitter.addWidget(self.control_panel)
-
-        plot_container = QWidget()
-        plot_layout = QVBoxLayout()
-
-        # Tabbed plot interface
-        tab_widget = QTabWidget()
-        tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                background: #1A1A1A;
-                border: 2px inset #4A4A4A;
-                border-radius: 3px;
-            }
-            QTabBar::tab {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3A3A3A, stop:1 #1A1A1A);
-                border: 2px inset #4A4A4A;
-                border-bottom: none;
-                border-top-left-radius: 3px;
-                border-top-right-radius: 3px;
-                color: #FFFFFF;
-                padding: 8px 16px;
-                font: bold 12pt 'Courier New';
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #4A4A4A, stop:1 #2E2E2E);
-                border: 2px inset #4A4A4A;
-                border-bottom: 2px solid #1A1A1A;
-            }
-            QTabBar::tab:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
-            }
-        """)
-
-        # Waveforms Tab
-        waveform_widget = QWidget()
-        waveform_layout = QVBoxLayout()
-        self.ac_label = QLabel("AC INPUT")
-        self.ac_label.setObjectName("led-label")
-        waveform_layout.addWidget(self.ac_label)
-        self.ac_plot = pg.PlotWidget()
-        self.ac_plot.setBackground("#0A0A0A")
-        self.ac_plot.setTitle("AC Waveform", color="#FFFF99", size="12pt")
-        self.ac_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.ac_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.ac_plot.showGrid(x=True, y=True, alpha=0.3)
-        waveform_layout.addWidget(self.ac_plot)
-
-        self.rect_label = QLabel("RECTIFIED")
-        self.rect_label.setObjectName("led-label")
-        waveform_layout.addWidget(self.rect_label)
-        self.rect_plot = pg.PlotWidget()
-        self.rect_plot.setBackground("#0A0A0A")
-        self.rect_plot.setTitle("Rectified Waveform", color="#FFFF99", size="12pt")
-        self.rect_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.rect_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.rect_plot.showGrid(x=True, y=True, alpha=0.3)
-        waveform_layout.addWidget(self.rect_plot)
-
-        self.waveform_label = QLabel("MODULATED")
-        self.waveform_label.setObjectName("led-label")
-        waveform_layout.addWidget(self.waveform_label)
-        self.waveform_plot = pg.PlotWidget()
-        self.waveform_plot.setBackground("#0A0A0A")
-        self.waveform_plot.setTitle("Waveform", color="#FFFF99", size="12pt")
-        self.waveform_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.waveform_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.waveform_plot.showGrid(x=True, y=True, alpha=0.3)
-        waveform_layout.addWidget(self.waveform_plot)
-        waveform_widget.setLayout(waveform_layout)
-        tab_widget.addTab(waveform_widget, "1")
-
-        # Spectrum Tab
-        spectrum_widget = QWidget()
-        spectrum_layout = QVBoxLayout()
-        self.spectrum_label = QLabel("SPECTRUM")
-        self.spectrum_label.setObjectName("led-label")
-        spectrum_layout.addWidget(self.spectrum_label)
-        self.spectrum_plot = pg.PlotWidget()
-        self.spectrum_plot.setBackground("#0A0A0A")
-        self.spectrum_plot.setTitle("Spectrum", color="#FFFF99", size="12pt")
-        self.spectrum_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.spectrum_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.spectrum_plot.showGrid(x=True, y=True, alpha=0.3)
-        spectrum_layout.addWidget(self.spectrum_plot)
-
-        self.snr_spectrum_label = QLabel("SNR SPECTRUM")
-        self.snr_spectrum_label.setObjectName("led-label")
-        spectrum_layout.addWidget(self.snr_spectrum_label)
-        self.snr_spectrum_plot = pg.PlotWidget()
-        self.snr_spectrum_plot.setBackground("#0A0A0A")
-        self.snr_spectrum_plot.setTitle("SNR vs. Frequency", color="#FFFF99", size="12pt")
-        self.snr_spectrum_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.snr_spectrum_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.snr_spectrum_plot.showGrid(x=True, y=True, alpha=0.3)
-        self.snr_spectrum_plot.setLogMode(x=True, y=False)
-        spectrum_layout.addWidget(self.snr_spectrum_plot)
-        spectrum_widget.setLayout(spectrum_layout)
-        tab_widget.addTab(spectrum_widget, "2")
-
-        # Analysis Tab
-        analysis_widget = QWidget()
-        analysis_layout = QVBoxLayout()
-        self.harmonic_bar_label = QLabel("HARMONIC ANALYSIS")
-        self.harmonic_bar_label.setObjectName("led-label")
-        analysis_layout.addWidget(self.harmonic_bar_label)
-        self.harmonic_bar_plot = pg.PlotWidget()
-        self.harmonic_bar_plot.setBackground("#0A0A0A")
-        self.harmonic_bar_plot.setTitle("Harmonic Amplitudes", color="#FFFF99", size="12pt")
-        self.harmonic_bar_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.harmonic_bar_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.harmonic_bar_plot.showGrid(x=True, y=True, alpha=0.3)
-        analysis_layout.addWidget(self.harmonic_bar_plot)
-
-        self.emi_spectrum_label = QLabel("EMI SPECTRUM")
-        self.emi_spectrum_label.setObjectName("led-label")
-        analysis_layout.addWidget(self.emi_spectrum_label)
-        self.emi_spectrum_plot = pg.PlotWidget()
-        self.emi_spectrum_plot.setBackground("#0A0A0A")
-        self.emi_spectrum_plot.setTitle("EMI Spectrum", color="#FFFF99", size="12pt")
-        self.emi_spectrum_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
-        self.emi_spectrum_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
-        self.emi_spectrum_plot.showGrid(x=True, y=True, alpha=0.3)
-        self.emi_spectrum_plot.setLogMode(x=True, y=False)
-        analysis_layout.addWidget(self.emi_spectrum_plot)
-        analysis_widget.setLayout(analysis_layout)
-        tab_widget.addTab(analysis_widget, "3")
-
-        plot_layout.addWidget(tab_widget)
-
-        plot_container.setLayout(plot_layout)
-        splitter.addWidget(plot_container)
-
-        analysis_container = QWidget()
-        analysis_layout = QVBoxLayout()
-        analysis_layout.addWidget(self.stability_analyzer.get_widget())
-        analysis_layout.addWidget(self.harmonic_analyzer.get_widget())
-        analysis_container.setLayout(analysis_layout)
-        splitter.addWidget(analysis_container)
-
-        splitter.setSizes([400, 600, 600])
-
-        self.setCentralWidget(splitter)
-
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #4A4A4A, stop:1 #2E2E2E);
-            }
-            QLabel#led-label {
-                background: transparent;
-                color: #FFFFFF;
-                font: bold 12pt 'Courier New';
-            }
-        """)
-
-    def add_thermal_button(self):
-        self.thermal_button = QPushButton("Launch Thermal Analysis")
-        self.thermal_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
-                border: 3px outset #6C6C6C;
-                border-radius: 5px;
-                padding: 6px;
-                color: #FFFFFF;
-                font: bold 12pt 'Courier New';
-                min-width: 150px;
-                min-height: 30px;
-            }
-            QPushButton:checked, QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3A3A3A, stop:1 #2E2E2E);
-                border: 3px inset #6C6C6C;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
-            }
-        """)
-        self.thermal_button.clicked.connect(self.launch_thermal_window)
-        self.control_panel.layout().insertWidget(self.control_panel.layout().count() - 1, self.thermal_button)
-
-    def add_magnetic_core_button(self):
-        self.magnetic_core_button = QPushButton("Launch Magnetic Core Analysis")
-        self.magnetic_core_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
-                border: 3px outset #6C6C6C;
-                border-radius: 5px;
-                padding: 6px;
-                color: #FFFFFF;
-                font: bold 12pt 'Courier New';
-                min-width: 150px;
-                min-height: 30px;
-            }
-            QPushButton:checked, QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #3A3A3A, stop:1 #2E2E2E);
-                border: 3px inset #6C6C6C;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
-            }
-        """)
-        self.magnetic_core_button.clicked.connect(self.launch_magnetic_core_window)
-
-    def launch_thermal_window(self):
-        self.thermal_analyzer = ThermalAnalyzer(self.model)
-        self.thermal_analyzer.show()
-
-    def launch_magnetic_core_window(self):
-        self.magnetic_core_analyzer = MagneticCoreAnalyzer(self.magnetic_core_modeling)
-        self.magnetic_core_analyzer.show()
-
-    def update_plots(self):
-        if not self.model.power_on:
-            self.ac_plot.clear()
-            self.rect_plot.clear()
-            self.waveform_plot.clear()
-            self.spectrum_plot.clear()
-            self.snr_spectrum_plot.clear()
-            self.harmonic_bar_plot.clear()
-            self.emi_spectrum_plot.clear()
-            self.stability_analyzer.update_plots()
-            self.harmonic_analyzer.update_plots()
-            self.control_panel.ripple_label.setText("RIPPLE: 0.00 V")
-            self.control_panel.avg_voltage_label.setText("AVG V: 0.00 V")
-            self.control_panel.thd_label.setText("THD: 0.00 %")
-            self.control_panel.thdp_label.setText("THD-P: 0.00 %")
-            self.control_panel.h2_h3_label.setText("H2/H3: 0.00/0.00 %")
-            self.control_panel.snr_label.setText("SNR: 0.00 dB")
-            self.control_panel.noise_floor_label.setText("NOISE FLOOR: 0.00 dB")
-            self.control_panel.emi_conducted_label.setText("EMI COND: 0.00 dBµV")
-            self.control_panel.emi_radiated_label.setText("EMI RAD: 0.00 dBµV")
-            self.control_panel.phase_label.setText("PHASE: 0.00 °")
-            self.control_panel.power_label.setText("POWER: 0.00 W")
-            self.control_panel.temp_label.setText("TEMP: 25.00 °C")
-            self.control_panel.eff_label.setText("EFF: 100.00 %")
-            self.control_panel.pf_label.setText("PF: 1.00")
-            return
-
-        # Apply dynamic parameters
-        if self.control_panel.dynamic_mode and self.control_panel.dynamic_start_time is not None:
-            elapsed_time = time.time() - self.control_panel.dynamic_start_time
-            base_freq = int(self.control_panel.freq_value.text())
-            freq_variation = 0.1 * base_freq * np.sin(0.1 * elapsed_time)
-            dynamic_freq = max(100, min(10000, base_freq + freq_variation))
-            self.model.set_frequency(int(dynamic_freq))
-            self.control_panel.freq_value.setText(f"{int(dynamic_freq)}")
-
-            base_gain = int(self.control_panel.gain_value.text())
-            gain_variation = 5 * np.sin(0.05 * elapsed_time)
-            dynamic_gain = max(-20, min(20, base_gain + gain_variation))
-            self.model.set_gain(int(dynamic_gain))
-            self.control_panel.gain_value.setText(f"{int(dynamic_gain)}")
-
-        # Generate waveform data
-        t = np.linspace(0, 0.1, 1000)
-        fs = 1000 / 0.1  # Sampling frequency (10 kHz)
-        ac_signal, rectified_signal, modulated_signal = self.model.generate_waveform(t)
-
-        # Simulate input current
-        input_current = np.sin(2 * np.pi * self.model.frequency * t - np.pi / 6) * np.max(np.abs(ac_signal)) / 10
-
-        # Apply PFC
-        corrected_current = self.pfc.apply_pfc(t, ac_signal, input_current)
-        if self.pfc.pfc_enabled:
-            modulation_factor = np.abs(corrected_current) / (np.max(np.abs(input_current)) + 1e-6)
-            modulated_signal *= modulation_factor
-
-        # Store clean signal for analysis
-        clean_signal = modulated_signal.copy()
-
-        # Add environmental noise
-        if self.control_panel.noise_level > 0:
-            noise = np.random.normal(0, self.control_panel.noise_level * np.std(modulated_signal), len(modulated_signal))
-            modulated_signal += noise
-
-        # Update analyzers
-        self.harmonic_analyzer.update_plots()
-        self.snr_analyzer.update(clean_signal, self.control_panel.noise_level, fs)
-        self.thd_analyzer.update(clean_signal, fs)
-        self.emi_analyzer.update(t, modulated_signal)
-
-        # Analyze waveform for metrics
-        analysis = self.model.analyze_waveform(modulated_signal, t)
-
-        # Update waveform plots
-        self.ac_plot.clear()
-        self.ac_plot.plot(t, ac_signal, pen=pg.mkPen(color="#FFFF99", width=2))
-        self.ac_plot.plot(t, corrected_current * 10, pen=pg.mkPen(color="#FF5555", width=1))
-
-        self.rect_plot.clear()
-        self.rect_plot.plot(t, rectified_signal, pen=pg.mkPen(color="#FFFF99", width=2))
-
-        self.waveform_plot.clear()
-        self.waveform_plot.plot(t, modulated_signal, pen=pg.mkPen(color="#FFFF99", width=2))
-
-        self.spectrum_plot.clear()
-        fft = np.abs(np.fft.fft(modulated_signal))[:len(modulated_signal)//2]
-        freqs = np.fft.fftfreq(len(modulated_signal), 0.1/1000)[:len(modulated_signal)//2]
-        self.spectrum_plot.plot(freqs, fft, pen=pg.mkPen(color="#FFFF99", width=2))
-
-        # Update SNR spectrum plot
-        self.snr_spectrum_plot.clear()
-        freqs_snr, snr_spectrum = self.snr_analyzer.get_snr_spectrum()
-        self.snr_spectrum_plot.plot(freqs_snr, snr_spectrum, pen=pg.mkPen(color="#55FF55", width=2))
-
-        # Update harmonic bar plot
-        self.harmonic_bar_plot.clear()
-        harmonics = self.thd_analyzer.get_harmonics()
-        x = np.arange(2, 11)  # Harmonics H2 to H10
-        bar = pg.BarGraphItem(x=x, height=harmonics, width=0.4, brush="#FFFF99")
-        self.harmonic_bar_plot.addItem(bar)
-        self.harmonic_bar_plot.getAxis("bottom").setTicks([[(i, f"H{i}") for i in range(2, 11)]])
-
-        # Update EMI spectrum plot
-        self.emi_spectrum_plot.clear()
-        freqs_emi, emi_spectrum, cispr_limits = self.emi_analyzer.get_emi_spectrum()
-        self.emi_spectrum_plot.plot(freqs_emi, emi_spectrum, pen=pg.mkPen(color="#FF5555", width=2))
-        self.emi_spectrum_plot.plot(freqs_emi, cispr_limits, pen=pg.mkPen(color="#55FF55", width=1, style=Qt.DashLine))
-
-        # Update stability plots
-        self.stability_analyzer.update_plots()
-
-        # Update analysis display
-        try:
-            ripple = analysis.get('ripple_voltage', 0)
-            avg_voltage = analysis.get('avg_voltage', 0)
-            phase = analysis.get('phase', 0)
-            power = analysis.get('power', 0)
-            thd_n = float(self.harmonic_analyzer.thd_label.text().split(': ')[1].strip('%'))
-            thd_p = self.thd_analyzer.get_thd()
-            harmonics = self.thd_analyzer.get_harmonics()
-            h2, h3 = harmonics[0], harmonics[1]
-            snr = self.snr_analyzer.get_snr()
-            noise_floor = self.snr_analyzer.get_noise_floor()
-            emi_conducted = self.emi_analyzer.get_conducted_emi()
-            emi_radiated = self.emi_analyzer.get_radiated_emi()
-            temperature = self.model.temperature
-            efficiency = self.pfc.adjust_efficiency(self.model.efficiency) * 100
-            power_factor = self.pfc.get_power_factor()
-        except (ValueError, AttributeError, IndexError):
-            ripple = avg_voltage = phase = power = thd_n = thd_p = h2 = h3 = snr = noise_floor = 0.0
-            emi_conducted = emi_radiated = 0.0
-            temperature = 25.00
-            efficiency = 100.00
-            power_factor = 1.00
-
-        self.control_panel.ripple_label.setText(f"RIPPLE: {ripple:.2f} V")
-        self.control_panel.avg_voltage_label.setText(f"AVG V: {avg_voltage:.2f} V")
-        self.control_panel.thd_label.setText(f"THD: {thd_n:.2f} %")
-        self.control_panel.thdp_label.setText(f"THD-P: {thd_p:.2f} %")
-        self.control_panel.h2_h3_label.setText(f"H2/H3: {h2:.2f}/{h3:.2f} %")
-        self.control_panel.snr_label.setText(f"SNR: {snr:.2f} dB")
-        self.control_panel.noise_floor_label.setText(f"NOISE FLOOR: {noise_floor:.2f} dB")
-        self.control_panel.emi_conducted_label.setText(f"EMI COND: {emi_conducted:.2f} dBµV")
-        self.control_panel.emi_radiated_label.setText(f"EMI RAD: {emi_radiated:.2f} dBµV")
-        self.control_panel.phase_label.setText(f"PHASE: {phase:.2f} °")
-        self.control_panel.power_label.setText(f"POWER: {power:.2f} W")
-        self.control_panel.temp_label.setText(f"TEMP: {temperature:.2f} °C")
-        self.control_panel.eff_label.setText(f"EFF: {efficiency:.2f} %")
-        self.control_panel.pf_label.setText(f"PF: {power_factor:.2f}")
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec_())
+import sys
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
+    QLineEdit, QComboBox, QPushButton, QSlider, QSplitter, QApplication,
+    QScrollArea, QTabWidget, QGridLayout
+)
+from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal
+from PyQt5.QtGui import QDoubleValidator, QFont
+from ReceiverModel import ReceiverModel
+from StabilityAnalysis import StabilityAnalyzer
+from HarmonicAnalysis import HarmonicAnalyzer
+from PowerFactorCorrection import PowerFactorCorrection
+from EMI_Analysis import EMIAnalyzer
+from ThermalModeling import ThermalAnalyzer
+from SimulationWorker import SimulationWorker
+from TickOrchestrator import TickOrchestrator
+from ChangeBus import ChangeBus
+from PlotDecimation import DecimatedCurve
+import time
+
+# Import the new magnetic core modeling classes
+from MagneticCoreModeling import MagneticCoreModeling
+from MagneticCoreAnalyzer import MagneticCoreAnalyzer
+
+class CollapsibleGroupBox(QGroupBox):
+    def __init__(self, title):
+        super().__init__(title)
+        self.setObjectName("panel")
+        self.toggle_button = QPushButton(f"{title}: ▼")
+        self.toggle_button.setCheckable(True)
+        self.toggle_button.setChecked(True)
+        self.toggle_button.clicked.connect(self.toggle_content)
+        self.content_widget = QWidget()
+        self.content_layout = QVBoxLayout()
+        self.content_widget.setLayout(self.content_layout)
+        self.main_layout = QVBoxLayout()
+        self.main_layout.addWidget(self.toggle_button)
+        self.main_layout.addWidget(self.content_widget)
+        self.setLayout(self.main_layout)
+
+    def toggle_content(self, checked):
+        self.content_widget.setVisible(checked)
+        self.toggle_button.setText(f"{self.title()}: {'▼' if checked else '▶'}")
+
+class ControlPanel(QWidget):
+    def __init__(self, model, update_callback, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.update_callback = update_callback
+        self.dynamic_mode = False
+        self.noise_level = 0.0
+        self.auto_sampling = False  # Planned sample rate and record length instead of the fixed 10 kHz grid
+        self.dynamic_start_time = None
+        self.init_ui()
+
+    def init_ui(self):
+        content_widget = QWidget()
+        layout = QVBoxLayout()
+        layout.setSpacing(10)
+        layout.setContentsMargins(15, 15, 15, 15)
+
+        # Receiver Controls
+        receiver_group = CollapsibleGroupBox("RECEIVER CONTROLS")
+        receiver_layout = receiver_group.content_layout
+
+        # Frequency control
+        freq_group = QGroupBox("FREQUENCY (Hz)")
+        freq_group.setObjectName("panel")
+        freq_layout = QHBoxLayout()
+        freq_label = QLabel("FREQ:")
+        freq_label.setObjectName("led-label")
+        self.freq_value = QLabel("1000")
+        self.freq_value.setObjectName("led-display")
+        self.freq_slider = QSlider(Qt.Horizontal)
+        self.freq_slider.setRange(100, 10000)
+        self.freq_slider.setValue(1000)
+        self.freq_slider.setMinimumWidth(300)
+        self.freq_slider.valueChanged.connect(self.update_frequency)
+        freq_layout.addWidget(freq_label)
+        freq_layout.addWidget(self.freq_slider)
+        freq_layout.addWidget(self.freq_value)
+        freq_group.setLayout(freq_layout)
+        receiver_layout.addWidget(freq_group)
+
+        # Gain control
+        gain_group = QGroupBox("GAIN (dB)")
+        gain_group.setObjectName("panel")
+        gain_layout = QHBoxLayout()
+        gain_label = QLabel("GAIN:")
+        gain_label.setObjectName("led-label")
+        self.gain_value = QLabel("0")
+        self.gain_value.setObjectName("led-display")
+        self.gain_slider = QSlider(Qt.Horizontal)
+        self.gain_slider.setRange(-20, 20)
+        self.gain_slider.setValue(0)
+        self.gain_slider.setMinimumWidth(300)
+        self.gain_slider.valueChanged.connect(self.update_gain)
+        gain_layout.addWidget(gain_label)
+        gain_layout.addWidget(self.gain_slider)
+        gain_layout.addWidget(self.gain_value)
+        gain_group.setLayout(gain_layout)
+        receiver_layout.addWidget(gain_group)
+
+        # Signal mode control
+        signal_group = QGroupBox("SIGNAL MODE")
+        signal_group.setObjectName("panel")
+        signal_layout = QHBoxLayout()
+        self.signal_combo = QComboBox()
+        self.signal_combo.addItems(["Analog", "Digital", "Mixed"])
+        self.signal_combo.currentTextChanged.connect(self.update_signal_mode)
+        signal_layout.addWidget(self.signal_combo)
+        signal_group.setLayout(signal_layout)
+        receiver_layout.addWidget(signal_group)
+
+        # Modulation control
+        mod_group = QGroupBox("MODULATION")
+        mod_group.setObjectName("panel")
+        mod_layout = QHBoxLayout()
+        self.mod_button_am = QPushButton("AM")
+        self.mod_button_am.setCheckable(True)
+        self.mod_button_am.clicked.connect(lambda: self.update_modulation("AM"))
+        self.mod_button_fm = QPushButton("FM")
+        self.mod_button_fm.setCheckable(True)
+        self.mod_button_fm.clicked.connect(lambda: self.update_modulation("FM"))
+        mod_layout.addWidget(self.mod_button_am)
+        mod_layout.addWidget(self.mod_button_fm)
+        mod_layout.addStretch()
+        mod_group.setLayout(mod_layout)
+        receiver_layout.addWidget(mod_group)
+
+        # Analysis mode control
+        analysis_group = QGroupBox("ANALYSIS MODE")
+        analysis_group.setObjectName("panel")
+        analysis_layout = QHBoxLayout()
+        self.analysis_combo = QComboBox()
+        self.analysis_combo.addItems(["Transient", "Steady-State", "Frequency"])
+        self.analysis_combo.currentTextChanged.connect(self.update_analysis_mode)
+        analysis_layout.addWidget(self.analysis_combo)
+        self.integration_combo = QComboBox()
+        self.integration_combo.addItems(["Fixed", "Adaptive"])
+        self.integration_combo.currentTextChanged.connect(self.update_integration)
+        analysis_layout.addWidget(self.integration_combo)
+        self.sampling_combo = QComboBox()
+        self.sampling_combo.addItems(["10 kHz", "Auto Fs"])
+        self.sampling_combo.currentTextChanged.connect(self.update_sampling)
+        analysis_layout.addWidget(self.sampling_combo)
+        analysis_group.setLayout(analysis_layout)
+        receiver_layout.addWidget(analysis_group)
+
+        layout.addWidget(receiver_group)
+
+        # Filter/Regulator Controls
+        filter_reg_group = CollapsibleGroupBox("FILTER/REGULATOR")
+        filter_reg_layout = filter_reg_group.content_layout
+
+        # Rectifier control
+        rect_group = QGroupBox("RECTIFIER")
+        rect_group.setObjectName("panel")
+        rect_layout = QHBoxLayout()
+        self.rect_combo = QComboBox()
+        self.rect_combo.addItems(["Half-Wave", "Full-Wave", "Bridge"])
+        self.rect_combo.currentTextChanged.connect(self.update_rectifier)
+        rect_layout.addWidget(self.rect_combo)
+        self.diode_solver_combo = QComboBox()
+        self.diode_solver_combo.addItems(["Exact", "Table"])
+        self.diode_solver_combo.currentTextChanged.connect(self.update_diode_solver)
+        rect_layout.addWidget(self.diode_solver_combo)
+        rect_group.setLayout(rect_layout)
+        filter_reg_layout.addWidget(rect_group)
+
+        # Filter control
+        filter_group = QGroupBox("FILTER TYPE")
+        filter_group.setObjectName("panel")
+        filter_layout = QHBoxLayout()
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems(["Capacitive", "Inductive", "Active"])
+        self.filter_combo.currentTextChanged.connect(self.update_filter_type)
+        filter_layout.addWidget(self.filter_combo)
+        self.cap_solver_combo = QComboBox()
+        self.cap_solver_combo.addItems(["Euler", "Analytic"])
+        self.cap_solver_combo.currentTextChanged.connect(self.update_capacitor_solver)
+        filter_layout.addWidget(self.cap_solver_combo)
+        filter_group.setLayout(filter_layout)
+        filter_reg_layout.addWidget(filter_group)
+
+        # Filter parameters
+        filter_params_group = QGroupBox("FILTER PARAMETERS")
+        filter_params_group.setObjectName("panel")
+        filter_params_layout = QVBoxLayout()
+        self.cap_input = QLineEdit("100")
+        self.cap_input.setValidator(QDoubleValidator(0, 1000, 2))
+        self.cap_input.textChanged.connect(self.update_capacitance)
+        filter_params_layout.addWidget(QLabel("CAP (µF):").setObjectName("led-label"))
+        filter_params_layout.addWidget(self.cap_input)
+        self.inductance_input = QLineEdit("10")
+        self.inductance_input.setValidator(QDoubleValidator(0.1, 100, 2))
+        self.inductance_input.textChanged.connect(self.update_inductance)
+        filter_params_layout.addWidget(QLabel("IND (mH):").setObjectName("led-label"))
+        filter_params_layout.addWidget(self.inductance_input)
+        self.active_cutoff_input = QLineEdit("100")
+        self.active_cutoff_input.setValidator(QDoubleValidator(10, 1000, 2))
+        self.active_cutoff_input.textChanged.connect(self.update_active_cutoff)
+        filter_params_layout.addWidget(QLabel("CUTOFF (Hz):").setObjectName("led-label"))
+        filter_params_layout.addWidget(self.active_cutoff_input)
+        filter_params_group.setLayout(filter_params_layout)
+        filter_reg_layout.addWidget(filter_params_group)
+
+        # Regulator control
+        reg_group = QGroupBox("REGULATOR")
+        reg_group.setObjectName("panel")
+        reg_layout = QHBoxLayout()
+        self.reg_combo = QComboBox()
+        self.reg_combo.addItems(["None", "Linear", "Switching"])
+        self.reg_combo.currentTextChanged.connect(self.update_regulator_type)
+        reg_layout.addWidget(self.reg_combo)
+        self.switching_model_combo = QComboBox()
+        self.switching_model_combo.addItems(["Switched", "Averaged"])
+        self.switching_model_combo.currentTextChanged.connect(self.update_switching_model)
+        reg_layout.addWidget(self.switching_model_combo)
+        reg_group.setLayout(reg_layout)
+        filter_reg_layout.addWidget(reg_group)
+
+        # Regulator parameters
+        reg_params_group = QGroupBox("REGULATOR PARAMETERS")
+        reg_params_group.setObjectName("panel")
+        reg_params_layout = QVBoxLayout()
+        self.vref_input = QLineEdit("5.0")
+        self.vref_input.setValidator(QDoubleValidator(1.0, 20.0, 2))
+        self.vref_input.textChanged.connect(self.update_vref)
+        reg_params_layout.addWidget(QLabel("VREF (V):").setObjectName("led-label"))
+        reg_params_layout.addWidget(self.vref_input)
+        self.switching_freq_input = QLineEdit("10000")
+        self.switching_freq_input.setValidator(QDoubleValidator(1000, 50000, 2))
+        self.switching_freq_input.textChanged.connect(self.update_switching_freq)
+        reg_params_layout.addWidget(QLabel("SW FREQ (Hz):").setObjectName("led-label"))
+        reg_params_layout.addWidget(self.switching_freq_input)
+        reg_params_group.setLayout(reg_params_layout)
+        filter_reg_layout.addWidget(reg_params_group)
+
+        layout.addWidget(filter_reg_group)
+
+        # Nonlinear/PFC Controls
+        nonlinear_pfc_group = CollapsibleGroupBox("NONLINEAR/PFC")
+        nonlinear_pfc_layout = nonlinear_pfc_group.content_layout
+
+        # Transformer turns ratio control
+        turns_group = QGroupBox("TRANSFORMER")
+        turns_group.setObjectName("panel")
+        turns_layout = QVBoxLayout()
+        self.turns_input = QLineEdit("1.0")
+        self.turns_input.setValidator(QDoubleValidator(0.1, 10.0, 2))
+        self.turns_input.textChanged.connect(self.update_turns_ratio)
+        turns_layout.addWidget(QLabel("TURNS RATIO:").setObjectName("led-label"))
+        turns_layout.addWidget(self.turns_input)
+        turns_group.setLayout(turns_layout)
+        nonlinear_pfc_layout.addWidget(turns_group)
+
+        # Coil inductance control
+        coil_group = QGroupBox("COIL")
+        coil_group.setObjectName("panel")
+        coil_layout = QVBoxLayout()
+        self.coil_inductance_input = QLineEdit("1.0")
+        self.coil_inductance_input.setValidator(QDoubleValidator(0.1, 10.0, 2))
+        self.coil_inductance_input.textChanged.connect(self.update_coil_inductance)
+        coil_layout.addWidget(QLabel("IND (mH):").setObjectName("led-label"))
+        coil_layout.addWidget(self.coil_inductance_input)
+        coil_group.setLayout(coil_layout)
+        nonlinear_pfc_layout.addWidget(coil_group)
+
+        # Nonlinear device parameters
+        nonlinear_group = QGroupBox("NONLINEAR DEVICES")
+        nonlinear_group.setObjectName("panel")
+        nonlinear_layout = QVBoxLayout()
+        self.diode_is_input = QLineEdit("1e-12")
+        self.diode_is_input.setValidator(QDoubleValidator(1e-15, 1e-9, 15))
+        self.diode_is_input.textChanged.connect(self.update_diode_is)
+        nonlinear_layout.addWidget(QLabel("DIODE Is (A):").setObjectName("led-label"))
+        nonlinear_layout.addWidget(self.diode_is_input)
+        self.mosfet_vth_input = QLineEdit("2.0")
+        self.mosfet_vth_input.setValidator(QDoubleValidator(0.5, 5.0, 2))
+        self.mosfet_vth_input.textChanged.connect(self.update_mosfet_vth)
+        nonlinear_layout.addWidget(QLabel("MOSFET Vth (V):").setObjectName("led-label"))
+        nonlinear_layout.addWidget(self.mosfet_vth_input)
+        nonlinear_layout.setAlignment(Qt.AlignTop)
+        nonlinear_group.setLayout(nonlinear_layout)
+        nonlinear_pfc_layout.addWidget(nonlinear_group)
+
+        # Power factor correction control
+        pfc_group = QGroupBox("POWER FACTOR CORRECTION")
+        pfc_group.setObjectName("panel")
+        pfc_layout = QHBoxLayout()
+        self.pfc_button = QPushButton("PFC: OFF")
+        self.pfc_button.setCheckable(True)
+        self.pfc_button.clicked.connect(self.toggle_pfc)
+        self.pfc_combo = QComboBox()
+        self.pfc_combo.addItems(["None", "Active Boost", "Passive"])
+        self.pfc_combo.currentTextChanged.connect(self.update_pfc_type)
+        self.emi_filter_button = QPushButton("EMI FILTER: OFF")
+        self.emi_filter_button.setCheckable(True)
+        self.emi_filter_button.clicked.connect(self.toggle_emi_filter)
+        pfc_layout.addWidget(self.pfc_button)
+        pfc_layout.addWidget(self.pfc_combo)
+        pfc_layout.addWidget(self.emi_filter_button)
+        pfc_group.setLayout(pfc_layout)
+        nonlinear_pfc_layout.addWidget(pfc_group)
+
+        layout.addWidget(nonlinear_pfc_group)
+
+        # Magnetic Core Modeling Controls
+        magnetic_group = CollapsibleGroupBox("MAGNETIC CORE MODELING")
+        magnetic_layout = magnetic_group.content_layout
+
+        # Core Material Selection
+        core_material_group = QGroupBox("CORE MATERIAL")
+        core_material_group.setObjectName("panel")
+        core_material_layout = QHBoxLayout()
+        self.core_material_combo = QComboBox()
+        self.core_material_combo.addItems(["Ferrite", "Iron Powder", "Silicon Steel"])
+        self.core_material_combo.currentTextChanged.connect(self.update_core_material)
+        core_material_layout.addWidget(self.core_material_combo)
+        core_material_group.setLayout(core_material_layout)
+        magnetic_layout.addWidget(core_material_group)
+
+        # Magnetic Field Intensity
+        magnetic_field_group = QGroupBox("MAGNETIC FIELD (A/m)")
+        magnetic_field_group.setObjectName("panel")
+        magnetic_field_layout = QVBoxLayout()
+        self.h_field_input = QLineEdit("100.0")
+        self.h_field_input.setValidator(QDoubleValidator(0.0, 1000.0, 2))
+        self.h_field_input.textChanged.connect(self.update_magnetic_field)
+        magnetic_field_layout.addWidget(QLabel("H_FIELD (A/m):").setObjectName("led-label"))
+        magnetic_field_layout.addWidget(self.h_field_input)
+        magnetic_field_group.setLayout(magnetic_field_layout)
+        magnetic_layout.addWidget(magnetic_field_group)
+
+        layout.addWidget(magnetic_group)
+
+        # Add Launch Magnetic Core Analysis Button
+        self.magnetic_core_button = QPushButton("Magnetic Core Analysis")
+        if self.parent() and hasattr(self.parent(), 'launch_magnetic_core_window'):
+            self.magnetic_core_button.clicked.connect(self.parent().launch_magnetic_core_window)
+        else:
+            print("Warning: ControlPanel parent not set or lacks launch_magnetic_core_window method")
+        layout.addWidget(self.magnetic_core_button)
+
+        # Dynamic mode toggle
+        dynamic_group = QGroupBox("DYNAMIC SIMULATION")
+        dynamic_group.setObjectName("panel")
+        dynamic_layout = QHBoxLayout()
+        self.dynamic_button = QPushButton("DYNAMIC: OFF")
+        self.dynamic_button.setCheckable(True)
+        self.dynamic_button.clicked.connect(self.toggle_dynamic_mode)
+        dynamic_layout.addWidget(self.dynamic_button)
+        dynamic_group.setLayout(dynamic_layout)
+        layout.addWidget(dynamic_group)
+
+        # Noise level control
+        noise_group = QGroupBox("NOISE LEVEL")
+        noise_group.setObjectName("panel")
+        noise_layout = QHBoxLayout()
+        noise_label = QLabel("NOISE:")
+        noise_label.setObjectName("led-label")
+        self.noise_slider = QSlider(Qt.Horizontal)
+        self.noise_slider.setRange(0, 100)
+        self.noise_slider.setValue(0)
+        self.noise_slider.setMinimumWidth(300)
+        self.noise_slider.valueChanged.connect(self.update_noise_level)
+        self.noise_value = QLabel("0.00")
+        self.noise_value.setObjectName("led-display")
+        noise_layout.addWidget(noise_label)
+        noise_layout.addWidget(self.noise_slider)
+        noise_layout.addWidget(self.noise_value)
+        noise_group.setLayout(noise_layout)
+        layout.addWidget(noise_group)
+
+        # Power toggle
+        self.power_button = QPushButton("POWER")
+        self.power_button.setCheckable(True)
+        self.power_button.clicked.connect(self.toggle_power)
+        layout.addWidget(self.power_button)
+
+        # Analysis results
+        analysis_group = QGroupBox("ANALYSIS DISPLAY")
+        analysis_group.setObjectName("panel")
+        analysis_layout = QVBoxLayout()
+
+        # SNR Metrics
+        snr_group = QGroupBox("SNR METRICS")
+        snr_group.setObjectName("panel")
+        snr_layout = QGridLayout()
+        self.snr_label = QLabel("SNR: 0.00 dB")
+        self.snr_label.setObjectName("led-display")
+        self.noise_floor_label = QLabel("NOISE FLOOR: 0.00 dB")
+        self.noise_floor_label.setObjectName("led-display")
+        snr_layout.addWidget(QLabel("SNR:").setObjectName("led-label"), 0, 0)
+        snr_layout.addWidget(self.snr_label, 0, 1)
+        snr_layout.addWidget(QLabel("NOISE FLOOR:").setObjectName("led-label"), 1, 0)
+        snr_layout.addWidget(self.noise_floor_label, 1, 1)
+        snr_group.setLayout(snr_layout)
+        analysis_layout.addWidget(snr_group)
+
+        # THD Metrics
+        thd_group = QGroupBox("THD METRICS")
+        thd_group.setObjectName("panel")
+        thd_layout = QGridLayout()
+        self.thd_label = QLabel("THD: 0.00 %")
+        self.thd_label.setObjectName("led-display")
+        self.thdp_label = QLabel("THD-P: 0.00 %")
+        self.thdp_label.setObjectName("led-display")
+        self.h2_h3_label = QLabel("H2/H3: 0.00/0.00 %")
+        self.h2_h3_label.setObjectName("led-display")
+        thd_layout.addWidget(QLabel("THD:").setObjectName("led-label"), 0, 0)
+        thd_layout.addWidget(self.thd_label, 0, 1)
+        thd_layout.addWidget(QLabel("THD-P:").setObjectName("led-label"), 1, 0)
+        thd_layout.addWidget(self.thdp_label, 1, 1)
+        thd_layout.addWidget(QLabel("H2/H3:").setObjectName("led-label"), 2, 0)
+        thd_layout.addWidget(self.h2_h3_label, 2, 1)
+        thd_group.setLayout(thd_layout)
+        analysis_layout.addWidget(thd_group)
+
+        # EMI Metrics
+        emi_group = QGroupBox("EMI METRICS")
+        emi_group.setObjectName("panel")
+        emi_layout = QGridLayout()
+        self.emi_conducted_label = QLabel("EMI COND: 0.00 dBµV")
+        self.emi_conducted_label.setObjectName("led-display")
+        self.emi_radiated_label = QLabel("EMI RAD: 0.00 dBµV")
+        self.emi_radiated_label.setObjectName("led-display")
+        emi_layout.addWidget(QLabel("EMI COND:").setObjectName("led-label"), 0, 0)
+        emi_layout.addWidget(self.emi_conducted_label, 0, 1)
+        emi_layout.addWidget(QLabel("EMI RAD:").setObjectName("led-label"), 1, 0)
+        emi_layout.addWidget(self.emi_radiated_label, 1, 1)
+        emi_group.setLayout(emi_layout)
+        analysis_layout.addWidget(emi_group)
+
+        # Other Metrics
+        other_group = QGroupBox("OTHER METRICS")
+        other_group.setObjectName("panel")
+        other_layout = QGridLayout()
+        self.ripple_label = QLabel("RIPPLE: 0.00 V")
+        self.ripple_label.setObjectName("led-display")
+        self.avg_voltage_label = QLabel("AVG V: 0.00 V")
+        self.avg_voltage_label.setObjectName("led-display")
+        self.phase_label = QLabel("PHASE: 0.00 °")
+        self.phase_label.setObjectName("led-display")
+        self.power_label = QLabel("POWER: 0.00 W")
+        self.power_label.setObjectName("led-display")
+        self.temp_label = QLabel("TEMP: 25.00 °C")
+        self.temp_label.setObjectName("led-display")
+        self.eff_label = QLabel("EFF: 100.00 %")
+        self.eff_label.setObjectName("led-display")
+        self.pf_label = QLabel("PF: 1.00")
+        self.pf_label.setObjectName("led-display")
+        other_layout.addWidget(QLabel("RIPPLE:").setObjectName("led-label"), 0, 0)
+        other_layout.addWidget(self.ripple_label, 0, 1)
+        other_layout.addWidget(QLabel("AVG V:").setObjectName("led-label"), 1, 0)
+        other_layout.addWidget(self.avg_voltage_label, 1, 1)
+        other_layout.addWidget(QLabel("PHASE:").setObjectName("led-label"), 2, 0)
+        other_layout.addWidget(self.phase_label, 2, 1)
+        other_layout.addWidget(QLabel("POWER:").setObjectName("led-label"), 3, 0)
+        other_layout.addWidget(self.power_label, 3, 1)
+        other_layout.addWidget(QLabel("TEMP:").setObjectName("led-label"), 4, 0)
+        other_layout.addWidget(self.temp_label, 4, 1)
+        other_layout.addWidget(QLabel("EFF:").setObjectName("led-label"), 5, 0)
+        other_layout.addWidget(self.eff_label, 5, 1)
+        other_layout.addWidget(QLabel("PF:").setObjectName("led-label"), 6, 0)
+        other_layout.addWidget(self.pf_label, 6, 1)
+        other_group.setLayout(other_layout)
+        analysis_layout.addWidget(other_group)
+
+        analysis_group.setLayout(analysis_layout)
+        layout.addWidget(analysis_group)
+
+        layout.addStretch()
+        content_widget.setLayout(layout)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidget(content_widget)
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setStyleSheet("""
+            QScrollArea {
+                background: #2E2E2E;
+                border: none;
+            }
+            QScrollBar:vertical {
+                background: #2E2E2E;
+                width: 16px;
+                margin: 0px;
+                border: 1px solid #5C5C5C;
+            }
+            QScrollBar::handle:vertical {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
+                border: 1px solid #5C5C5C;
+                border-radius: 3px;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                background: #3A3A3A;
+                height: 0px;
+            }
+            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+                background: #2E2E2E;
+            }
+        """)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(scroll_area)
+        self.setLayout(main_layout)
+
+        content_widget.setStyleSheet("""
+            QMainWindow, QWidget {
+                background-color: #2E2E2E;
+                color: #FFFFFF;
+                font-family: 'Courier New';
+            }
+            QGroupBox#panel {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #4A4A4A, stop:1 #2E2E2E);
+                border: 3px outset #5C5C5C;
+                border-radius: 5px;
+                margin-top: 15px;
+                padding: 10px;
+                font: bold 12pt 'Courier New';
+                color: #FFFFFF;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                subcontrol-position: top left;
+                padding: 5px 10px;
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
+                border: 2px outset #5C5C5C;
+                border-radius: 3px;
+                color: #FFFFFF;
+                font: bold 12pt 'Courier New';
+            }
+            QLineEdit, QComboBox {
+                background: #1A1A1A;
+                border: 2px inset #5C5C5C;
+                border-radius: 3px;
+                padding: 4px;
+                color: #FFFF99;
+                font: 12pt 'Courier New';
+            }
+            QComboBox::drop-down {
+                border: 2px outset #5C5C5C;
+                background: #3A3A3A;
+            }
+            QComboBox::down-arrow {
+                image: none;
+                border-left: 5px solid transparent;
+                border-right: 5px solid transparent;
+                border-top: 5px solid #FFFFFF;
+            }
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
+                border: 3px outset #6C6C6C;
+                border-radius: 5px;
+                padding: 6px;
+                color: #FFFFFF;
+                font: bold 12pt 'Courier New';
+                min-width: 80px;
+                min-height: 30px;
+            }
+            QPushButton:checked, QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #3A3A3A, stop:1 #2E2E2E);
+                border: 3px inset #6C6C6C;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
+            }
+            QSlider {
+                background: #1A1A1A;
+                border: 2px inset #5C5C5C;
+                border-radius: 3px;
+                height: 20px;
+            }
+            QSlider::groove:horizontal {
+                background: #2E2E2E;
+                height: 8px;
+                margin: 2px 0;
+            }
+            QSlider::handle:horizontal {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
+                border: 2px outset #5C5C5C;
+                width: 20px;
+                margin: -8px 0;
+                border-radius: 5px;
+            }
+            QLabel#led-label {
+                background: transparent;
+                color: #FFFFFF;
+                font: bold 12pt 'Courier New';
+            }
+            QLabel#led-display {
+                background: #1A1A1A;
+                border: 2px inset #5C5C5C;
+                border-radius: 3px;
+                padding: 4px;
+                color: #FFFF99;
+                font: 12pt 'Courier New';
+            }
+        """)
+
+    def update_frequency(self, value):
+        try:
+            self.model.set_frequency(int(value))
+            self.freq_value.setText(str(value))
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_gain(self, value):
+        try:
+            self.model.set_gain(int(value))
+            self.gain_value.setText(str(value))
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_signal_mode(self, text):
+        self.model.set_signal_mode(text.lower())
+        self.update_callback()
+
+    def update_modulation(self, mod_type):
+        self.model.set_modulation(mod_type)
+        self.mod_button_am.setChecked(mod_type == "AM")
+        self.mod_button_fm.setChecked(mod_type == "FM")
+        self.update_callback()
+
+    def update_analysis_mode(self, text):
+        self.model.set_analysis_mode(text.replace("-", "_").lower())
+        self.update_callback()
+
+    def update_integration(self, text):
+        self.model.set_integration(text.lower())
+        self.update_callback()
+
+    def update_sampling(self, text):
+        self.auto_sampling = text == "Auto Fs"
+        self.update_callback()
+
+    def update_rectifier(self, text):
+        rectifier_map = {"Half-Wave": "half_wave", "Full-Wave": "full_wave", "Bridge": "bridge"}
+        self.model.rectifier_type = rectifier_map[text]
+        self.update_callback()
+
+    def update_diode_solver(self, text):
+        self.model.set_diode_solver(text.lower())
+        self.update_callback()
+
+    def update_filter_type(self, text):
+        self.model.set_filter_type(text.lower())
+        self.update_callback()
+
+    def update_capacitor_solver(self, text):
+        self.model.set_capacitor_solver(text.lower())
+        self.update_callback()
+
+    def update_capacitance(self):
+        try:
+            cap = float(self.cap_input.text()) * 1e-6
+            self.model.filter_capacitance = cap
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_inductance(self):
+        try:
+            inductance = float(self.inductance_input.text()) * 1e-3
+            self.model.set_filter_inductance(inductance)
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_active_cutoff(self):
+        try:
+            cutoff = float(self.active_cutoff_input.text())
+            self.model.set_active_filter_cutoff(cutoff)
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_regulator_type(self, text):
+        self.model.set_regulator_type(text.lower())
+        self.update_callback()
+
+    def update_switching_model(self, text):
+        self.model.set_switching_model(text.lower())
+        self.update_callback()
+
+    def update_vref(self):
+        try:
+            vref = float(self.vref_input.text())
+            self.model.set_linear_vref(vref)
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_switching_freq(self):
+        try:
+            freq = float(self.switching_freq_input.text())
+            self.model.set_switching_freq(freq)
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_turns_ratio(self):
+        try:
+            ratio = float(self.turns_input.text())
+            if ratio > 5:
+                from PyQt5.QtWidgets import QMessageBox
+                QMessageBox.warning(self, "Warning", "High turns ratio may cause numerical instability.")
+            self.model.turns_ratio = ratio
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_coil_inductance(self):
+        try:
+            inductance = float(self.coil_inductance_input.text()) * 1e-3
+            self.model.set_coil_inductance(inductance)
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_diode_is(self):
+        try:
+            diode_is = float(self.diode_is_input.text())
+            self.model.diode_is = diode_is
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_mosfet_vth(self):
+        try:
+            vth = float(self.mosfet_vth_input.text())
+            self.model.mosfet_vth = vth
+            self.update_callback()
+        except ValueError:
+            pass
+
+    def update_core_material(self, text):
+        try:
+            if hasattr(self, 'magnetic_core_modeling'):
+                self.magnetic_core_modeling.set_core_material(text)
+                self.update_callback()
+        except Exception as e:
+            print(f"Error updating core material: {e}")
+
+    def update_magnetic_field(self):
+        try:
+            h_field = float(self.h_field_input.text())
+            if hasattr(self, 'magnetic_core_modeling'):
+                self.magnetic_core_modeling.set_magnetic_field(h_field)
+                self.update_callback()
+        except ValueError as e:
+            print(f"Error updating magnetic field: {e}")
+
+    def toggle_power(self, checked):
+        self.model.set_power(checked)
+        self.power_button.setText(f"POWER: {'ON' if checked else 'OFF'}")
+        if not checked:
+            self.dynamic_start_time = None
+        self.update_callback()
+
+    def toggle_dynamic_mode(self, checked):
+        self.dynamic_mode = checked
+        self.dynamic_button.setText(f"DYNAMIC: {'ON' if checked else 'OFF'}")
+        if checked and self.model.power_on:
+            self.dynamic_start_time = time.time()
+        else:
+            self.dynamic_start_time = None
+        self.update_callback()
+
+    def update_noise_level(self, value):
+        self.noise_level = value / 100.0
+        self.noise_value.setText(f"{self.noise_level:.2f}")
+        self.update_callback()
+
+    def toggle_pfc(self, checked):
+        self.pfc_enabled = checked
+        self.pfc_button.setText(f"PFC: {'ON' if checked else 'OFF'}")
+        pfc_type = self.pfc_combo.currentText().replace(" ", "_").lower()
+        self.pfc.set_pfc(checked, pfc_type)
+        self.update_callback()
+
+    def update_pfc_type(self, text):
+        pfc_type = text.replace(" ", "_").lower()
+        self.pfc.set_pfc(self.pfc_enabled, pfc_type)
+        self.update_callback()
+
+    def toggle_emi_filter(self, checked):
+        self.emi_analyzer.toggle_emi_filter(checked)
+        self.emi_filter_button.setText(f"EMI FILTER: {'ON' if checked else 'OFF'}")
+        self.update_callback()
+
+class SnapshotNotifier(QObject):
+    """Carries the worker's "snapshot published" callback onto the GUI thread (queued signal)."""
+    published = pyqtSignal()
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.model = ReceiverModel()
+        self.stability_analyzer = StabilityAnalyzer(self.model)
+        self.harmonic_analyzer = HarmonicAnalyzer(self.model, self.parameters_changed)
+        # PFC and EMI-filter settings live here; the worker's own analyzers do the computation
+        self.pfc = PowerFactorCorrection(self.model)
+        self.emi_analyzer = EMIAnalyzer(self.model)
+        self.magnetic_core_modeling = MagneticCoreModeling(self.model)
+        # Changed parameter groups are marked dirty; a burst within coalesce_interval becomes one recompute
+        self.coalesce_interval = 30  # ms
+        self.bus = ChangeBus(lambda flush: QTimer.singleShot(self.coalesce_interval, flush))
+        # Simulation and analysis run on a worker thread that idles once the receiver settles;
+        # the GUI thread renders each snapshot when it is published instead of polling
+        self.notifier = SnapshotNotifier()
+        self.notifier.published.connect(self.render_latest)
+        self.worker = SimulationWorker(interval=0.05, on_publish=self.notifier.published.emit)
+        self.bus.subscribe("worker", self.submit_settings)
+        # Each snapshot is fanned out to the main plots and any open analysis windows
+        self.orchestrator = TickOrchestrator()
+        self.orchestrator.subscribe("main", self.render_snapshot)
+        self.orchestrator.subscribe("stability", self.stability_analyzer.update_response)
+        self.orchestrator.subscribe("harmonic", self.harmonic_analyzer.update_results)
+        self.init_ui()
+        self.add_thermal_button()
+        self.add_magnetic_core_button()
+        # Only dynamic mode changes parameters over time, so only it runs a periodic timer
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.apply_dynamic_parameters)
+        self.bus.update(self.get_settings())
+        self.bus.flush()  # Submit the first settings now rather than after the coalescing delay
+        self.worker.start()
+
+    def init_ui(self):
+        self.setWindowTitle("AC/DC Receiver Simulator")
+        self.setGeometry(100, 100, 1600, 1000)
+
+        splitter = QSplitter(Qt.Horizontal)
+        self.control_panel = ControlPanel(self.model, self.parameters_changed, self)
+        self.control_panel.pfc = self.pfc
+        self.control_panel.pfc_enabled = False
+        self.control_panel.emi_analyzer = self.emi_analyzer
+        self.control_panel.magnetic_core_modeling = self.magnetic_core_modeling
+        splitter.addWidget(self.control_panel)
+
+        plot_container = QWidget()
+        plot_layout = QVBoxLayout()
+
+        # Tabbed plot interface
+        tab_widget = QTabWidget()
+        tab_widget.setStyleSheet("""
+            QTabWidget::pane {
+                background: #1A1A1A;
+                border: 2px inset #4A4A4A;
+                border-radius: 3px;
+            }
+            QTabBar::tab {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #3A3A3A, stop:1 #1A1A1A);
+                border: 2px inset #4A4A4A;
+                border-bottom: none;
+                border-top-left-radius: 3px;
+                border-top-right-radius: 3px;
+                color: #FFFFFF;
+                padding: 8px 16px;
+                font: bold 12pt 'Courier New';
+                margin-right: 2px;
+            }
+            QTabBar::tab:selected {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #4A4A4A, stop:1 #2E2E2E);
+                border: 2px inset #4A4A4A;
+                border-bottom: 2px solid #1A1A1A;
+            }
+            QTabBar::tab:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
+            }
+        """)
+
+        # Waveforms Tab
+        waveform_widget = QWidget()
+        waveform_layout = QVBoxLayout()
+        self.ac_label = QLabel("AC INPUT")
+        self.ac_label.setObjectName("led-label")
+        waveform_layout.addWidget(self.ac_label)
+        self.ac_plot = pg.PlotWidget()
+        self.ac_plot.setBackground("#0A0A0A")
+        self.ac_plot.setTitle("AC Waveform", color="#FFFF99", size="12pt")
+        self.ac_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.ac_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.ac_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.ac_curve = self.ac_plot.plot(pen=pg.mkPen(color="#FFFF99", width=2))
+        self.current_curve = self.ac_plot.plot(pen=pg.mkPen(color="#FF5555", width=1))
+        waveform_layout.addWidget(self.ac_plot)
+
+        self.rect_label = QLabel("RECTIFIED")
+        self.rect_label.setObjectName("led-label")
+        waveform_layout.addWidget(self.rect_label)
+        self.rect_plot = pg.PlotWidget()
+        self.rect_plot.setBackground("#0A0A0A")
+        self.rect_plot.setTitle("Rectified Waveform", color="#FFFF99", size="12pt")
+        self.rect_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.rect_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.rect_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.rect_curve = self.rect_plot.plot(pen=pg.mkPen(color="#FFFF99", width=2))
+        waveform_layout.addWidget(self.rect_plot)
+
+        self.waveform_label = QLabel("MODULATED")
+        self.waveform_label.setObjectName("led-label")
+        waveform_layout.addWidget(self.waveform_label)
+        self.waveform_plot = pg.PlotWidget()
+        self.waveform_plot.setBackground("#0A0A0A")
+        self.waveform_plot.setTitle("Waveform", color="#FFFF99", size="12pt")
+        self.waveform_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.waveform_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.waveform_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.waveform_curve = self.waveform_plot.plot(pen=pg.mkPen(color="#FFFF99", width=2))
+        waveform_layout.addWidget(self.waveform_plot)
+        waveform_widget.setLayout(waveform_layout)
+        tab_widget.addTab(waveform_widget, "1")
+
+        # Spectrum Tab
+        spectrum_widget = QWidget()
+        spectrum_layout = QVBoxLayout()
+        self.spectrum_label = QLabel("SPECTRUM")
+        self.spectrum_label.setObjectName("led-label")
+        spectrum_layout.addWidget(self.spectrum_label)
+        self.spectrum_plot = pg.PlotWidget()
+        self.spectrum_plot.setBackground("#0A0A0A")
+        self.spectrum_plot.setTitle("Spectrum", color="#FFFF99", size="12pt")
+        self.spectrum_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.spectrum_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.spectrum_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.spectrum_curve = self.spectrum_plot.plot(pen=pg.mkPen(color="#FFFF99", width=2))
+        spectrum_layout.addWidget(self.spectrum_plot)
+        # Long records reach the curves decimated to the visible range and plot width
+        self.ac_trace = DecimatedCurve(self.ac_plot, self.ac_curve)
+        self.current_trace = DecimatedCurve(self.ac_plot, self.current_curve)
+        self.rect_trace = DecimatedCurve(self.rect_plot, self.rect_curve)
+        self.waveform_trace = DecimatedCurve(self.waveform_plot, self.waveform_curve)
+        self.spectrum_trace = DecimatedCurve(self.spectrum_plot, self.spectrum_curve, mode="peak")
+
+        self.snr_spectrum_label = QLabel("SNR SPECTRUM")
+        self.snr_spectrum_label.setObjectName("led-label")
+        spectrum_layout.addWidget(self.snr_spectrum_label)
+        self.snr_spectrum_plot = pg.PlotWidget()
+        self.snr_spectrum_plot.setBackground("#0A0A0A")
+        self.snr_spectrum_plot.setTitle("SNR vs. Frequency", color="#FFFF99", size="12pt")
+        self.snr_spectrum_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.snr_spectrum_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.snr_spectrum_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.snr_spectrum_plot.setLogMode(x=True, y=False)
+        self.snr_spectrum_curve = self.snr_spectrum_plot.plot(pen=pg.mkPen(color="#55FF55", width=2))
+        spectrum_layout.addWidget(self.snr_spectrum_plot)
+        spectrum_widget.setLayout(spectrum_layout)
+        tab_widget.addTab(spectrum_widget, "2")
+
+        # Analysis Tab
+        analysis_widget = QWidget()
+        analysis_layout = QVBoxLayout()
+        self.harmonic_bar_label = QLabel("HARMONIC ANALYSIS")
+        self.harmonic_bar_label.setObjectName("led-label")
+        analysis_layout.addWidget(self.harmonic_bar_label)
+        self.harmonic_bar_plot = pg.PlotWidget()
+        self.harmonic_bar_plot.setBackground("#0A0A0A")
+        self.harmonic_bar_plot.setTitle("Harmonic Amplitudes", color="#FFFF99", size="12pt")
+        self.harmonic_bar_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.harmonic_bar_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.harmonic_bar_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.harmonic_bar = pg.BarGraphItem(x=np.arange(2, 11), height=np.zeros(9), width=0.4, brush="#FFFF99")  # H2 to H10
+        self.harmonic_bar_plot.addItem(self.harmonic_bar)
+        self.harmonic_bar_plot.getAxis("bottom").setTicks([[(i, f"H{i}") for i in range(2, 11)]])
+        analysis_layout.addWidget(self.harmonic_bar_plot)
+
+        self.emi_spectrum_label = QLabel("EMI SPECTRUM")
+        self.emi_spectrum_label.setObjectName("led-label")
+        analysis_layout.addWidget(self.emi_spectrum_label)
+        self.emi_spectrum_plot = pg.PlotWidget()
+        self.emi_spectrum_plot.setBackground("#0A0A0A")
+        self.emi_spectrum_plot.setTitle("EMI Spectrum", color="#FFFF99", size="12pt")
+        self.emi_spectrum_plot.getAxis("left").setPen({"color": "#FFFF99", "width": 2})
+        self.emi_spectrum_plot.getAxis("bottom").setPen({"color": "#FFFF99", "width": 2})
+        self.emi_spectrum_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.emi_spectrum_plot.setLogMode(x=True, y=False)
+        self.emi_spectrum_curve = self.emi_spectrum_plot.plot(pen=pg.mkPen(color="#FF5555", width=2))
+        self.cispr_curve = self.emi_spectrum_plot.plot(pen=pg.mkPen(color="#55FF55", width=1, style=Qt.DashLine))
+        analysis_layout.addWidget(self.emi_spectrum_plot)
+        analysis_widget.setLayout(analysis_layout)
+        tab_widget.addTab(analysis_widget, "3")
+
+        plot_layout.addWidget(tab_widget)
+
+        plot_container.setLayout(plot_layout)
+        splitter.addWidget(plot_container)
+
+        analysis_container = QWidget()
+        analysis_layout = QVBoxLayout()
+        analysis_layout.addWidget(self.stability_analyzer.get_widget())
+        analysis_layout.addWidget(self.harmonic_analyzer.get_widget())
+        analysis_container.setLayout(analysis_layout)
+        splitter.addWidget(analysis_container)
+
+        splitter.setSizes([400, 600, 600])
+
+        self.setCentralWidget(splitter)
+
+        self.setStyleSheet("""
+            QMainWindow {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #4A4A4A, stop:1 #2E2E2E);
+            }
+            QLabel#led-label {
+                background: transparent;
+                color: #FFFFFF;
+                font: bold 12pt 'Courier New';
+            }
+        """)
+
+    def add_thermal_button(self):
+        self.thermal_button = QPushButton("Launch Thermal Analysis")
+        self.thermal_button.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
+                border: 3px outset #6C6C6C;
+                border-radius: 5px;
+                padding: 6px;
+                color: #FFFFFF;
+                font: bold 12pt 'Courier New';
+                min-width: 150px;
+                min-height: 30px;
+            }
+            QPushButton:checked, QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #3A3A3A, stop:1 #2E2E2E);
+                border: 3px inset #6C6C6C;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
+            }
+        """)
+        self.thermal_button.clicked.connect(self.launch_thermal_window)
+        self.control_panel.layout().insertWidget(self.control_panel.layout().count() - 1, self.thermal_button)
+
+    def add_magnetic_core_button(self):
+        self.magnetic_core_button = QPushButton("Launch Magnetic Core Analysis")
+        self.magnetic_core_button.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #5C5C5C, stop:1 #3A3A3A);
+                border: 3px outset #6C6C6C;
+                border-radius: 5px;
+                padding: 6px;
+                color: #FFFFFF;
+                font: bold 12pt 'Courier New';
+                min-width: 150px;
+                min-height: 30px;
+            }
+            QPushButton:checked, QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #3A3A3A, stop:1 #2E2E2E);
+                border: 3px inset #6C6C6C;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #6C6C6C, stop:1 #4A4A4A);
+            }
+        """)
+        self.magnetic_core_button.clicked.connect(self.launch_magnetic_core_window)
+
+    def launch_thermal_window(self):
+        if hasattr(self, 'thermal_analyzer'):
+            self.thermal_analyzer.close()  # Unsubscribes the previous window
+        self.thermal_analyzer = ThermalAnalyzer(self.model, self.orchestrator, self.worker.request_tick)
+        self.thermal_analyzer.show()
+
+    def launch_magnetic_core_window(self):
+        if hasattr(self, 'magnetic_core_analyzer'):
+            self.magnetic_core_analyzer.close()
+        self.magnetic_core_analyzer = MagneticCoreAnalyzer(self.magnetic_core_modeling)
+        self.magnetic_core_analyzer.show()
+
+    def get_settings(self):
+        """Parameter group -> value: the ReceiverConfig groups plus the analyzer settings the worker uses."""
+        settings = self.model.get_config().get_groups()
+        settings.update({
+            "pfc": (self.pfc.pfc_enabled, self.pfc.pfc_type),
+            "emi": self.emi_analyzer.emi_filter_enabled,
+            "noise": self.control_panel.noise_level,
+            "harmonics": self.harmonic_analyzer.max_harmonics,
+            "sampling": self.control_panel.auto_sampling,
+            "magnetic": (self.magnetic_core_modeling.core_material, self.magnetic_core_modeling.h_field_base)
+        })
+        return settings
+
+    def parameters_changed(self):
+        """Control callback: notify the parameter groups that changed; nothing is recomputed if none did."""
+        if self.model.power_on and self.control_panel.dynamic_mode:
+            if not self.timer.isActive():
+                self.timer.start(50)
+        else:
+            self.timer.stop()
+        self.bus.update(self.get_settings())
+
+    def submit_settings(self, dirty=None):
+        """Hand the current model and analyzer settings to the worker, waking it for a tick."""
+        sampling = {"sampling": "auto"} if self.control_panel.auto_sampling else {
+            "sampling": "fixed", "duration": 0.1, "n_samples": 1000}
+        self.worker.submit(
+            self.model.get_config(),
+            pfc={"enabled": self.pfc.pfc_enabled, "type": self.pfc.pfc_type},
+            emi_filter=self.emi_analyzer.emi_filter_enabled,
+            noise_level=self.control_panel.noise_level,
+            max_harmonics=self.harmonic_analyzer.max_harmonics,
+            **sampling)
+
+    def apply_dynamic_parameters(self):
+        """Dynamic-mode timer: vary frequency and gain over time."""
+        if self.model.power_on and self.control_panel.dynamic_mode and self.control_panel.dynamic_start_time is not None:
+            elapsed_time = time.time() - self.control_panel.dynamic_start_time
+            base_freq = int(self.control_panel.freq_value.text())
+            freq_variation = 0.1 * base_freq * np.sin(0.1 * elapsed_time)
+            dynamic_freq = max(100, min(10000, base_freq + freq_variation))
+            self.model.set_frequency(int(dynamic_freq))
+            self.control_panel.freq_value.setText(f"{int(dynamic_freq)}")
+
+            base_gain = int(self.control_panel.gain_value.text())
+            gain_variation = 5 * np.sin(0.05 * elapsed_time)
+            dynamic_gain = max(-20, min(20, base_gain + gain_variation))
+            self.model.set_gain(int(dynamic_gain))
+            self.control_panel.gain_value.setText(f"{int(dynamic_gain)}")
+        self.bus.update(self.get_settings())
+
+    def render_latest(self):
+        """Fan the worker's newest snapshot out to the subscribers; skipped snapshots were stale."""
+        snapshot = self.worker.buffer.take()
+        if snapshot is not None:
+            self.orchestrator.publish(snapshot)
+
+    def render_snapshot(self, snapshot):
+        """Draw a worker snapshot (GUI thread only); its arrays are read-only."""
+        # Other windows read the simulated receiver state from the GUI's model
+        self.model.set_state(snapshot["state"])
+        metrics = snapshot["metrics"]
+        # Curves and bars are created once in init_ui and updated in place
+        if "modulated" not in snapshot:
+            # Powered off
+            for trace in (self.ac_trace, self.current_trace, self.rect_trace, self.waveform_trace, self.spectrum_trace):
+                trace.clear()
+            for curve in (self.snr_spectrum_curve, self.emi_spectrum_curve, self.cispr_curve):
+                curve.setData([], [])
+            self.harmonic_bar.setOpts(height=np.zeros(9))
+        else:
+            t = snapshot["t"]
+
+            # Update waveform plots
+            self.ac_trace.set_data(t, snapshot["ac"])
+            self.current_trace.set_data(t, snapshot["corrected_current"] * 10)
+            self.rect_trace.set_data(t, snapshot["rectified"])
+            self.waveform_trace.set_data(t, snapshot["modulated"])
+            self.spectrum_trace.set_data(*snapshot["spectrum"])
+
+            # Update SNR spectrum plot
+            self.snr_spectrum_curve.setData(*snapshot["snr_spectrum"])
+
+            # Update harmonic bar plot (H2 to H10)
+            self.harmonic_bar.setOpts(height=snapshot["harmonics"])
+
+            # Update EMI spectrum plot
+            freqs_emi, emi_spectrum, cispr_limits = snapshot["emi_spectrum"]
+            self.emi_spectrum_curve.setData(freqs_emi, emi_spectrum)
+            self.cispr_curve.setData(freqs_emi, cispr_limits)
+
+        # Update analysis display
+        self.control_panel.ripple_label.setText(f"RIPPLE: {metrics['ripple_voltage']:.2f} V")
+        self.control_panel.avg_voltage_label.setText(f"AVG V: {metrics['avg_voltage']:.2f} V")
+        self.control_panel.thd_label.setText(f"THD: {metrics['thd_n']:.2f} %")
+        self.control_panel.thdp_label.setText(f"THD-P: {metrics['thd']:.2f} %")
+        self.control_panel.h2_h3_label.setText(f"H2/H3: {metrics['h2']:.2f}/{metrics['h3']:.2f} %")
+        self.control_panel.snr_label.setText(f"SNR: {metrics['snr']:.2f} dB")
+        self.control_panel.noise_floor_label.setText(f"NOISE FLOOR: {metrics['noise_floor']:.2f} dB")
+        self.control_panel.emi_conducted_label.setText(f"EMI COND: {metrics['emi_conducted']:.2f} dBµV")
+        self.control_panel.emi_radiated_label.setText(f"EMI RAD: {metrics['emi_radiated']:.2f} dBµV")
+        self.control_panel.phase_label.setText(f"PHASE: {metrics['phase']:.2f} °")
+        self.control_panel.power_label.setText(f"POWER: {metrics['power']:.2f} W")
+        self.control_panel.temp_label.setText(f"TEMP: {metrics['temperature']:.2f} °C")
+        self.control_panel.eff_label.setText(f"EFF: {metrics['efficiency']:.2f} %")
+        self.control_panel.pf_label.setText(f"PF: {metrics['power_factor']:.2f}")
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.worker.stop()
+        event.accept()
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec_())
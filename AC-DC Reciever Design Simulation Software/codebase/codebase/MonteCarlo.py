@@ -0,0 +1,205 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from scipy.stats import norm, qmc
+from ReceiverModel import ReceiverModel
+from ParameterSweep import ParameterSweep
+
+def run_chunk(config, values, t, stage, max_harmonics=10):
+    """Evaluate one chunk of samples as a vectorized sweep (module level so worker processes can run it)."""
+    sweep = ParameterSweep(ReceiverModel.from_config(config))
+    # Ripple from the configured mode, THD+N against the stage's own fundamental (not 60 Hz on the carrier)
+    ripple_mode = "transient" if config.analysis_mode == "frequency" else config.analysis_mode
+    return sweep.run(values, t, stage, analysis_modes=(ripple_mode,), max_harmonics=max_harmonics)
+
+class StreamingHistogram:
+    """Fixed-bin-count histogram whose range doubles, merging bin pairs, as values arrive outside it."""
+
+    def __init__(self, n_bins=50):
+        self.n_bins = n_bins + n_bins % 2  # Even, so bins merge in pairs
+        self.counts = None
+        self.lower = 0.0
+        self.width = 1.0
+
+    def add(self, values):
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return
+        low, high = np.min(values), np.max(values)
+        if self.counts is None:
+            self.counts = np.zeros(self.n_bins, dtype=np.int64)
+            self.lower = low
+            self.width = (high - low) / self.n_bins if high > low else max(abs(low), 1.0) * 1e-9
+        while low < self.lower or high > self.lower + self.width * self.n_bins:
+            # Double the range towards the new values; old bins merge pairwise into the new ones
+            merged = self.counts.reshape(-1, 2).sum(axis=1)
+            self.counts = np.zeros(self.n_bins, dtype=np.int64)
+            if low < self.lower:
+                self.lower -= self.width * self.n_bins
+                self.counts[self.n_bins // 2:] = merged
+            else:
+                self.counts[:self.n_bins // 2] = merged
+            self.width *= 2
+        index = np.minimum(((values - self.lower) / self.width).astype(int), self.n_bins - 1)
+        self.counts += np.bincount(index, minlength=self.n_bins)
+
+    def get_histogram(self):
+        """(counts, bin edges), or empty arrays before any finite value has arrived."""
+        if self.counts is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        return self.counts.copy(), self.lower + self.width * np.arange(self.n_bins + 1)
+
+class RunningStats:
+    """Count, mean, standard deviation and range of a stream of chunks (Chan's parallel update)."""
+
+    def __init__(self, n_bins=50):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+        self.n_invalid = 0  # NaN/inf results, left out of the statistics
+        self.histogram = StreamingHistogram(n_bins)
+
+    def add(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        finite = values[np.isfinite(values)]
+        self.n_invalid += len(values) - len(finite)
+        n = len(finite)
+        if n == 0:
+            return
+        mean = np.mean(finite)
+        m2 = np.sum((finite - mean) ** 2)
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, np.min(finite))
+        self.max = max(self.max, np.max(finite))
+        self.histogram.add(finite)
+
+    def get_summary(self):
+        counts, edges = self.histogram.get_histogram()
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count else np.nan,
+            "std": np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0,
+            "min": self.min,
+            "max": self.max,
+            "invalid": self.n_invalid,
+            "histogram": counts,
+            "bin_edges": edges
+        }
+
+class MonteCarloAnalysis:
+    """Component-tolerance Monte Carlo of ReceiverModel metrics with streamed statistics.
+
+    Each parameter is drawn around its nominal model value, uniformly within
+    ±tolerance or normally with tolerance = 3 sigma, from pseudo-random or
+    scrambled Sobol points. Chunks of samples run as vectorized ParameterSweep
+    batches, spread over a process pool, and statistics update as chunks finish.
+    Metrics are taken on stage, by default the receiver output, where filter
+    and load tolerances show; thd_n is its THD+N against the signal frequency,
+    as the harmonic analysis reports it.
+    """
+
+    default_tolerances = {
+        "filter_capacitance": 0.2,  # ±20 % electrolytic
+        "filter_inductance": 0.1,
+        "load_resistance": 0.05,
+        "diode_is": 0.5,  # Saturation current spreads widely between parts
+        "mosfet_vth": 0.1
+    }
+    metric_names = ("ripple_voltage", "thd_n", "efficiency", "temperature")
+
+    def __init__(self, model, tolerances=None, sampling="random", distribution="uniform", seed=None,
+                 n_workers=1, chunk_size=256, t=None, stage="modulated", limits=None, n_bins=50):
+        if sampling not in ("random", "sobol"):
+            raise ValueError(f"Unknown sampling method: {sampling}")
+        if distribution not in ("uniform", "normal"):
+            raise ValueError(f"Unknown tolerance distribution: {distribution}")
+        self.config = model.get_config()
+        self.tolerances = dict(self.default_tolerances if tolerances is None else tolerances)
+        self.nominal = {name: getattr(self.config, name) for name in self.tolerances}
+        self.sampling = sampling
+        self.distribution = distribution
+        self.n_workers = n_workers  # Worker processes (1 runs in this process; None uses every CPU)
+        self.chunk_size = chunk_size  # Samples per vectorized batch (a power of 2 keeps Sobol points balanced)
+        self.t = np.linspace(0, 0.1, 1000) if t is None else t
+        self.stage = stage
+        self.limits = limits or {}  # Metric -> (low, high) pass window for the yield estimate
+        self.n_bins = n_bins
+        self.rng = np.random.default_rng(seed)
+        self.sobol = qmc.Sobol(len(self.tolerances), scramble=True, seed=seed) if sampling == "sobol" else None
+        self.reset()
+
+    def reset(self):
+        self.stats = {name: RunningStats(self.n_bins) for name in self.metric_names}
+        self.n_done = 0
+        self.n_pass = 0
+
+    def get_samples(self, n):
+        """Draw n parameter sets as name -> array of n values."""
+        if self.sobol is not None:
+            u = self.sobol.random(n)
+        else:
+            u = self.rng.random((n, len(self.tolerances)))
+        samples = {}
+        for k, (name, tolerance) in enumerate(self.tolerances.items()):
+            if self.distribution == "uniform":
+                deviation = tolerance * (2 * u[:, k] - 1)
+            else:
+                deviation = tolerance / 3 * norm.ppf(np.clip(u[:, k], 1e-12, 1 - 1e-12))
+            samples[name] = self.nominal[name] * (1 + deviation)
+        return samples
+
+    def add_results(self, metrics):
+        for name in self.metric_names:
+            self.stats[name].add(metrics[name])
+        n = len(metrics[self.metric_names[0]])
+        passed = np.ones(n, dtype=bool)
+        for name, (low, high) in self.limits.items():
+            passed &= (metrics[name] >= low) & (metrics[name] <= high)
+        self.n_done += n
+        self.n_pass += int(np.sum(passed))
+
+    def get_summary(self):
+        summary = {name: stats.get_summary() for name, stats in self.stats.items()}
+        summary["samples"] = self.n_done
+        summary["yield"] = self.n_pass / self.n_done if self.n_done else np.nan
+        return summary
+
+    def stream(self, n_samples):
+        """Run n_samples and yield the updated summary after every finished chunk."""
+        self.reset()
+        sizes = [min(self.chunk_size, n_samples - start) for start in range(0, n_samples, self.chunk_size)]
+        if self.n_workers == 1:
+            for size in sizes:
+                self.add_results(run_chunk(self.config, self.get_samples(size), self.t, self.stage))
+                yield self.get_summary()
+            return
+        n_workers = self.n_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            max_pending = 2 * n_workers  # Bound the samples held in flight
+            pending = set()
+            chunks = iter(sizes)
+            while True:
+                for size in chunks:
+                    pending.add(pool.submit(run_chunk, self.config, self.get_samples(size), self.t, self.stage))
+                    if len(pending) >= max_pending:
+                        break
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.add_results(future.result())
+                    yield self.get_summary()
+
+    def run(self, n_samples, callback=None):
+        """Run n_samples, calling callback(summary) after each chunk; returns the final summary."""
+        summary = self.get_summary()
+        for summary in self.stream(n_samples):
+            if callback is not None:
+                callback(summary)
+        return summary
@@ -1,32 +1,125 @@
-import numpy as np
-
-class Diode:
-    def __init__(self, is_=1e-12, n=1.0, vt=0.0259):
-        self.is_ = is_  # Saturation current (A)
-        self.n = n      # Ideality factor
-        self.vt = vt    # Thermal voltage (V)
-
-    def current(self, vd):
-        """Calculate diode current given voltage across diode."""
-        # Avoid numerical overflow in exponential
-        vd = np.clip(vd, -100, 100)
-        return self.is_ * (np.exp(vd / (self.n * self.vt)) - 1)
-
-    def voltage_drop(self, current):
-        """Calculate voltage drop across diode given current."""
-        current = np.clip(current, 1e-15, 1e6)  # Prevent log of zero or negative
-        return self.n * self.vt * np.log(current / self.is_ + 1)
-
-class Transistor:
-    def __init__(self, beta=100, vbe=0.7, is_=1e-12, vt=0.0259):
-        self.beta = beta  # Current gain
-        self.vbe = vbe    # Base-emitter voltage
-        self.is_ = is_    # Saturation current
-        self.vt = vt      # Thermal voltage
-
-    def collector_current(self, vbe, vce):
-        """Calculate collector current for NPN transistor in active region."""
-        vbe = np.clip(vbe, -100, 100)
-        ib = self.is_ * (np.exp(vbe / self.vt) - 1)
-        ic = self.beta * ib
-        return ic if vce > 0.2 else 0  # Assume saturation if Vce < 0.2V
\ No newline at end of file
+import numpy as np
+from Kernels import kernels
+from ResultCache import ResultCache
+
+class Diode:
+    def __init__(self, is_=1e-12, n=1.0, vt=0.0259, table_tol=None):
+        self.is_ = is_  # Saturation current (A)
+        self.n = n      # Ideality factor
+        self.vt = vt    # Thermal voltage (V)
+        # Evaluate through an interpolated DiodeTable with this error bound (None: exact exp/log)
+        self.table = DiodeTable(is_, vt, n, table_tol) if table_tol is not None else None
+
+    def current(self, vd):
+        """Calculate diode current given voltage across diode."""
+        # Avoid numerical overflow in exponential
+        vd = np.clip(vd, -100, 100)
+        if self.table is not None:
+            return self.table.current(vd)
+        return self.is_ * (np.exp(vd / (self.n * self.vt)) - 1)
+
+    def voltage_drop(self, current):
+        """Calculate voltage drop across diode given current."""
+        current = np.clip(current, 1e-15, 1e6)  # Prevent log of zero or negative
+        if self.table is not None:
+            return self.table.voltage_drop(current)
+        return self.n * self.vt * np.log(current / self.is_ + 1)
+
+class Transistor:
+    def __init__(self, beta=100, vbe=0.7, is_=1e-12, vt=0.0259):
+        self.beta = beta  # Current gain
+        self.vbe = vbe    # Base-emitter voltage
+        self.is_ = is_    # Saturation current
+        self.vt = vt      # Thermal voltage
+
+    def collector_current(self, vbe, vce):
+        """Calculate collector current for NPN transistor in active region."""
+        vbe = np.clip(vbe, -100, 100)
+        ib = self.is_ * (np.exp(vbe / self.vt) - 1)
+        ic = self.beta * ib
+        return ic if vce > 0.2 else 0  # Assume saturation if Vce < 0.2V
+
+class DiodeTable:
+    """Diode I–V and V–I curves tabulated on a uniform grid and evaluated by linear interpolation.
+
+    The curves are stored in normalized units, x = v / (n vt) and I / is_, so one
+    table serves every (is_, vt, n); tables are built once per error bound and
+    kept in a least-recently-used cache. The grid step is halved until
+    interpolation at every interval midpoint is within tol: currents within
+    tol * (|I| + is_), voltages within tol * n * vt. Outside [x_min, x_max] the
+    curves hold their end values, like the exponent clip of ReceiverModel.diode_model.
+    """
+
+    x_min = -40.0  # exp(x) is below float64 resolution next to 1 from here down
+    x_max = 700.0  # Exponent clip of ReceiverModel.diode_model
+    min_step = 2.0 ** -20  # Finest grid step before tol is rejected as unreachable
+    tables = ResultCache(max_bytes=32 * 2**20)  # Normalized curves per error bound
+
+    def __init__(self, is_=1e-12, vt=0.0259, n=1.0, tol=1e-4):
+        if tol <= 0:
+            raise ValueError("Diode table tolerance must be positive")
+        self.is_ = is_  # Saturation current (A)
+        self.vt = vt  # Thermal voltage (V)
+        self.n = n  # Ideality factor
+        self.tol = tol
+        key = self.tables.get_key([("tol", float(tol))])
+        self.curves = self.tables.get(key)
+        if self.curves is None:
+            self.curves = self.build(tol)
+            n_bytes = sum(value.nbytes for value in self.curves.values() if isinstance(value, np.ndarray))
+            self.tables.put(key, self.curves, n_bytes)
+
+    @classmethod
+    def build(cls, tol):
+        """Normalized curves on the coarsest power-of-2 grid that meets tol."""
+        step = 0.25
+        while True:
+            x = np.arange(cls.x_min, cls.x_max + step / 2, step)  # x_max is a node
+            ratio = np.expm1(x)  # I / is_
+            softplus = np.logaddexp(0, x)  # ln(1 + e^x)
+            mid = x[:-1] + step / 2
+            ratio_mid = (ratio[:-1] + ratio[1:]) / 2
+            current_error = np.max(np.abs(ratio_mid - np.expm1(mid)) / (np.abs(np.expm1(mid)) + 1))
+            drop_error = np.max(np.abs((softplus[:-1] + softplus[1:]) / 2 - np.logaddexp(0, mid)))
+            # V–I by inverse lookup: voltage at the interpolated current between two nodes
+            forward = ratio_mid >= 0
+            voltage_error = np.max(np.abs(mid[forward] - np.log1p(ratio_mid[forward])))
+            if max(current_error, drop_error, voltage_error) <= tol:
+                break
+            if step <= cls.min_step:
+                raise ValueError(f"Diode table tolerance {tol} is below the reachable interpolation error")
+            step /= 2
+        return {
+            "step": step,
+            "x": x,
+            "ratio": ratio,
+            "ratio_slope": np.append(np.diff(ratio), 0.0),
+            "softplus": softplus,
+            "softplus_slope": np.append(np.diff(softplus), 0.0)
+        }
+
+    def interpolate(self, v, name, gain):
+        """gain times the table curve name at voltages v (V)."""
+        v = np.asarray(v, dtype=float)
+        step = self.curves["step"]
+        scale = 1 / (self.n * self.vt * step)
+        kernel = kernels.get("interpolate_uniform")
+        args = (-self.x_min / step, self.curves[name], self.curves[name + "_slope"])
+        if np.ndim(scale) or np.ndim(gain):
+            # Per-row parameters: the kernel takes scalars, so scale outside it
+            x = np.ascontiguousarray(v * scale)
+            return gain * kernel(x.ravel(), 1.0, *args, 1.0).reshape(x.shape)
+        return kernel(np.ascontiguousarray(v).ravel(), float(scale), *args, float(gain)).reshape(v.shape)
+
+    def current(self, v):
+        """Diode current (A) at voltage v (V)."""
+        return self.interpolate(v, "ratio", self.is_)
+
+    def voltage_drop(self, current):
+        """Diode voltage (V) at forward current (A), by inverse lookup in the I–V table."""
+        ratio = np.maximum(np.asarray(current) / self.is_, 0)
+        return self.n * self.vt * np.interp(ratio, self.curves["ratio"], self.curves["x"])
+
+    def forward_drop(self, v):
+        """n vt ln(1 + e^(v / (n vt))): the V–I voltage at current I(v) + is_ (V)."""
+        return self.interpolate(v, "softplus", self.n * self.vt)
@@ -0,0 +1,110 @@
+import copy
+import numpy as np
+from ReceiverModel import ReceiverModel
+from THD_Analysis import compute_thd_n
+
+class ParameterSweep:
+    """Evaluate many ReceiverModel configurations as [n_configs, n_samples] batches."""
+
+    # Parameters that select the circuit topology (or time step); configs sharing them run as one batch
+    group_params = ("rectifier_type", "filter_type", "regulator_type", "capacitor_solver",
+                    "diode_solver", "signal_mode", "modulation", "analysis_mode", "dt")
+    line_frequency = 60  # Hz, ReceiverModel's AC input
+
+    def __init__(self, model=None):
+        self.model = model if model is not None else ReceiverModel()
+
+    def run(self, params, t=None, stage="modulated", analysis_modes=None, max_harmonics=None):
+        """Sweep params (name -> value or array of values, one per config) and return metrics per config.
+
+        Returns a dict of analyze_waveform metrics (plus temperature and efficiency)
+        with one entry per configuration, computed on the chosen waveform stage
+        ("ac", "rectified" or "modulated"). analysis_modes analyzes the same
+        waveforms in several modes; a metric returned by more than one mode keeps
+        the value of the first. With max_harmonics, "thd_n" is the THD+N of each
+        row (compute_thd_n) against the stage's fundamental: the line frequency
+        for "ac", the ripple frequency (line frequency times pulses per line
+        cycle) for "rectified", the signal frequency for "modulated". The base
+        model is not modified.
+        """
+        if t is None:
+            t = np.linspace(0, 0.1, 1000)
+        if stage not in ("ac", "rectified", "modulated"):
+            raise ValueError(f"Unknown waveform stage: {stage}")
+        values = self.broadcast_params(params)
+        n_configs = len(next(iter(values.values()))) if values else 1
+
+        metrics = {}
+        for index in self.group_configs(values, n_configs).values():
+            batch = self.build_batch(values, index)
+            ac_voltage, rectified, modulated = batch.generate_waveform(t)
+            waveform = {"ac": ac_voltage, "rectified": rectified, "modulated": modulated}[stage]
+            result = {}
+            for mode in analysis_modes or (batch.analysis_mode,):
+                generated_mode, batch.analysis_mode = batch.analysis_mode, mode
+                for name, value in batch.analyze_waveform(waveform, t).items():
+                    result.setdefault(name, value)
+                batch.analysis_mode = generated_mode
+            if max_harmonics is not None:
+                result["thd_n"] = self.get_thd_n(batch, waveform, stage, max_harmonics)
+            result["temperature"] = batch.temperature
+            result["efficiency"] = batch.efficiency
+            for name, value in result.items():
+                if name not in metrics:
+                    metrics[name] = np.full(n_configs, np.nan)
+                # Scalars are shared by the group; arrays hold one value per config
+                metrics[name][index] = np.broadcast_to(np.reshape(value, -1), (len(index),))
+        return metrics
+
+    def get_thd_n(self, batch, waveform, stage, max_harmonics):
+        """THD+N (%) of each row of waveform, as the GUI's harmonic analysis computes it."""
+        rows = np.reshape(waveform, (-1, waveform.shape[-1]))
+        if stage == "ac":
+            fundamental = self.line_frequency
+        elif stage == "rectified":
+            fundamental = self.line_frequency * (1 if batch.rectifier_type == "half_wave" else 2)
+        else:
+            fundamental = batch.frequency
+        fundamental = np.broadcast_to(np.reshape(fundamental, -1), (len(rows),))
+        return np.array([compute_thd_n(row, 1 / batch.dt, f, max_harmonics)[0]
+                         for row, f in zip(rows, fundamental)])
+
+    def broadcast_params(self, params):
+        """Validate sweep parameters and broadcast them to a common number of configs."""
+        for name in params:
+            if not hasattr(self.model, name):
+                raise ValueError(f"Unknown model parameter: {name}")
+            current = getattr(self.model, name)
+            if name not in self.group_params and (isinstance(current, bool) or not isinstance(current, (int, float))):
+                raise ValueError(f"Parameter cannot be swept: {name}")
+        arrays = {name: np.atleast_1d(np.asarray(value)) for name, value in params.items()}
+        shape = np.broadcast_shapes(*[a.shape for a in arrays.values()]) if arrays else (1,)
+        if len(shape) != 1:
+            raise ValueError("Sweep values must be scalars or 1-D arrays")
+        return {name: np.broadcast_to(a, shape) for name, a in arrays.items()}
+
+    def group_configs(self, values, n_configs):
+        """Map each topology key to the indices of the configs that share it."""
+        groups = {}
+        for i in range(n_configs):
+            key = tuple(str(values[name][i]) for name in self.group_params if name in values)
+            if "filter_capacitance" in values:
+                # A zero capacitance removes the capacitor from the circuit
+                key += (bool(values["filter_capacitance"][i] > 0),)
+            groups.setdefault(key, []).append(i)
+        return {key: np.array(index) for key, index in groups.items()}
+
+    def build_batch(self, values, index):
+        """Copy the base model with per-config parameters as (n_configs, 1) columns."""
+        batch = copy.copy(self.model)
+        batch.power_on = True
+        batch.integration = "fixed"  # Batches use the vectorized fixed-step recurrences
+        for name, column in values.items():
+            column = column[index]
+            if name == "dt":
+                batch.dt = float(column[0])
+            elif name in self.group_params:
+                setattr(batch, name, str(column[0]).lower())
+            else:
+                setattr(batch, name, column.astype(float)[:, None])
+        return batch
@@ -0,0 +1,103 @@
+import numpy as np
+
+def get_view_slice(x, x_range=None):
+    """Index range of ascending x covering x_range, plus one sample past each edge so lines reach the border."""
+    if x_range is None:
+        return 0, len(x)
+    lo = max(int(np.searchsorted(x, x_range[0], side="right")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x_range[1], side="left")) + 1, len(x))
+    return lo, hi
+
+def minmax_envelope(x, y, n_pixels, x_range=None):
+    """Per-pixel min/max envelope of a uniformly sampled trace (x ascending): at most 2 * n_pixels points.
+
+    Each pixel column becomes a vertical segment from the minimum to the
+    maximum of its samples, so peaks and ripple survive any decimation ratio.
+    """
+    lo, hi = get_view_slice(x, x_range)
+    x, y = x[lo:hi], y[lo:hi]
+    n_pixels = max(int(n_pixels), 1)
+    if len(y) <= 2 * n_pixels:
+        return x, y
+    starts = np.linspace(0, len(y), n_pixels + 1).astype(np.int64)[:-1]  # First sample of each pixel
+    envelope = np.empty(2 * n_pixels, dtype=y.dtype)
+    envelope[0::2] = np.fmin.reduceat(y, starts)
+    envelope[1::2] = np.fmax.reduceat(y, starts)
+    return np.repeat(x[starts], 2), envelope
+
+def peak_hold(f, magnitude, n_bins, f_range=None, log_x=False):
+    """Largest magnitude in each of about n_bins frequency bins, at its own frequency (f ascending).
+
+    Bins are equal in log f when log_x (f <= 0 is dropped, as a log axis
+    cannot show it) and equal in f otherwise, so narrow spectral lines keep
+    their height and position however long the record is.
+    """
+    if log_x:
+        first = int(np.searchsorted(f, 0, side="right"))
+        f, magnitude = f[first:], magnitude[first:]
+    lo, hi = get_view_slice(f, f_range)
+    f, magnitude = f[lo:hi], magnitude[lo:hi]
+    n_bins = max(int(n_bins), 1)
+    if len(f) <= n_bins:
+        return f, magnitude
+    edges = np.geomspace(f[0], f[-1], n_bins + 1) if log_x else np.linspace(f[0], f[-1], n_bins + 1)
+    starts = np.unique(np.searchsorted(f, edges[:-1], side="left"))  # First sample of each non-empty bin
+    peaks = np.fmax.reduceat(magnitude, starts)
+    counts = np.diff(np.append(starts, len(f)))
+    hits = np.flatnonzero(magnitude == np.repeat(peaks, counts))
+    # First sample of each bin reaching its peak
+    _, first_hit = np.unique(np.searchsorted(starts, hits, side="right") - 1, return_index=True)
+    index = hits[first_hit]
+    return f[index], magnitude[index]
+
+class DecimatedCurve:
+    """A plot curve fed through minmax_envelope or peak_hold, sized to its plot's current view.
+
+    set_data() keeps the full arrays; the curve receives at most a few points
+    per pixel of the visible x range. Zooming, panning or resizing the plot
+    re-decimates the kept arrays, and while the x axis auto-ranges the whole
+    record is reduced, so autoscaling still sees all of it.
+    """
+
+    def __init__(self, plot, curve, mode="envelope"):
+        if mode not in ("envelope", "peak"):
+            raise ValueError(f"Unknown decimation mode: {mode}")
+        self.plot = plot  # pyqtgraph PlotWidget holding curve
+        self.curve = curve
+        self.mode = mode
+        self.x = None
+        self.y = None
+        self.key = None  # View of the last reduction of the current data
+        view = plot.getViewBox()
+        view.sigXRangeChanged.connect(self.refresh)
+        view.sigResized.connect(self.refresh)
+
+    def set_data(self, x, y):
+        self.x, self.y = x, y
+        self.key = None
+        self.refresh()
+
+    def clear(self):
+        self.x = self.y = self.key = None
+        self.curve.setData([], [])
+
+    def refresh(self, *args):
+        if self.x is None:
+            return
+        view = self.plot.getViewBox()
+        log_x = self.plot.getPlotItem().getAxis("bottom").logMode
+        x_range = None
+        if not view.autoRangeEnabled()[0]:
+            x_range = view.viewRange()[0]
+            if log_x:
+                x_range = [10 ** x_range[0], 10 ** x_range[1]]
+        n_pixels = max(int(view.width()), 1)
+        key = (None if x_range is None else tuple(x_range), n_pixels, log_x)
+        if key == self.key:
+            return
+        self.key = key
+        if self.mode == "envelope":
+            x, y = minmax_envelope(self.x, self.y, n_pixels, x_range)
+        else:
+            x, y = peak_hold(self.x, self.y, n_pixels, x_range, log_x)
+        self.curve.setData(x, y)
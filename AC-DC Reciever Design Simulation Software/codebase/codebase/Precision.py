@@ -0,0 +1,55 @@
+import numpy as np
+
+class PrecisionPolicy:
+    """Working floating-point precision of waveforms and spectra across the simulation pipeline.
+
+    "float64" (the default) keeps every array in double precision. "float32"
+    stores the waveform stages, analyzer inputs and spectra (complex64) in
+    single precision, halving the memory traffic of large sweeps and long
+    recordings. Steps that are not numerically safe in single precision stay
+    in float64: time bases and phases, the diode exponential, filter and
+    thermal recurrences with the state they carry between records, the
+    steady-state solver and accumulated power. tolerances bounds the
+    resulting metric differences; SimulationCore.compare_precision checks them.
+    Configurations without a stable orbit (the op-amp filter with
+    dt * 2π * f_c * gain > 2) amplify any rounding difference and are not covered.
+    """
+
+    modes = ("float64", "float32")
+    # Metric -> bound on |float32 - float64| / max(|float64|, 1); differences seen across
+    # filter, regulator, analysis-mode and integration settings stay below 2e-6
+    tolerances = {
+        "ripple_voltage": 1e-5,
+        "avg_voltage": 1e-5,
+        "power": 1e-5,
+        "thd_n": 1e-5,
+        "thd": 1e-5,
+        "snr": 1e-5,
+        "emi_conducted": 1e-5,
+        "emi_radiated": 1e-5,
+        "temperature": 1e-5,
+        "efficiency": 1e-5,
+        "diode_temp": 1e-5,
+        "mosfet_temp": 1e-5
+    }
+
+    def __init__(self):
+        self.mode = "float64"
+
+    def set_mode(self, mode):
+        mode = mode.lower()
+        if mode not in self.modes:
+            raise ValueError(f"Unknown precision mode: {mode}")
+        self.mode = mode
+
+    def get_dtype(self):
+        return np.float32 if self.mode == "float32" else np.float64
+
+    def get_complex_dtype(self):
+        return np.complex64 if self.mode == "float32" else np.complex128
+
+    def cast(self, x):
+        """x as a real array of the working dtype (no copy when it already is one)."""
+        return np.asarray(x).astype(self.get_dtype(), copy=False)
+
+precision = PrecisionPolicy()
@@ -0,0 +1,93 @@
+import numpy as np
+
+class FrozenRecord:
+    """Immutable, hashable record of named scalar fields (the names are the subclass's __slots__)."""
+
+    __slots__ = ()
+
+    def __init__(self, **values):
+        missing = set(self.__slots__) - set(values)
+        unknown = set(values) - set(self.__slots__)
+        if missing or unknown:
+            raise ValueError(f"{type(self).__name__} fields missing: {sorted(missing)}, unknown: {sorted(unknown)}")
+        for name in self.__slots__:
+            value = values[name]
+            if isinstance(value, np.ndarray) and value.ndim == 0:
+                value = value[()]
+            if isinstance(value, np.generic):
+                value = value.item()  # Plain Python scalars hash and compare by value
+            if not isinstance(value, (bool, int, float, str)):
+                raise ValueError(f"{type(self).__name__}.{name} must be a scalar, not {type(value).__name__}")
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable; use replace()")
+
+    def __getstate__(self):
+        return self.as_dict()
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def replace(self, **changes):
+        """Copy with some fields changed."""
+        values = self.as_dict()
+        values.update(changes)
+        return type(self)(**values)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and self.as_dict() == other.as_dict()
+
+    def __hash__(self):
+        return hash((type(self).__name__,) + tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class ReceiverConfig(FrozenRecord):
+    """Circuit, device and simulation parameters of the receiver; see ReceiverModel for units and defaults."""
+
+    __slots__ = (
+        # Signal parameters
+        "frequency", "gain", "modulation", "power_on", "signal_mode",
+        # Circuit parameters
+        "rectifier_type", "filter_type", "filter_capacitance", "filter_inductance", "active_filter_cutoff",
+        "regulator_type", "linear_vref", "switching_freq", "switching_model", "turns_ratio",
+        "coil_inductance", "load_resistance", "capacitor_solver", "input_voltage",
+        # Nonlinear device parameters
+        "diode_is", "diode_vt", "diode_solver", "mosfet_vth", "mosfet_k", "opamp_gain", "opamp_max_output", "switch_on_fraction",
+        # Passive component and thermal parameters
+        "parasitic_resistance", "thermal_resistance",
+        # Simulation parameters
+        "dt", "integration", "modulation_index", "digital_freq", "analysis_mode"
+    )
+    # Parameter groups for change notification (ChangeBus); every field is in exactly one
+    groups = {
+        "signal": ("frequency", "gain", "modulation", "power_on", "signal_mode"),
+        "circuit": ("rectifier_type", "filter_type", "filter_capacitance", "filter_inductance", "active_filter_cutoff",
+                    "regulator_type", "linear_vref", "switching_freq", "switching_model", "turns_ratio",
+                    "coil_inductance", "load_resistance", "capacitor_solver", "input_voltage"),
+        "devices": ("diode_is", "diode_vt", "diode_solver", "mosfet_vth", "mosfet_k", "opamp_gain", "opamp_max_output",
+                    "switch_on_fraction"),
+        "passive": ("parasitic_resistance", "thermal_resistance"),
+        "simulation": ("dt", "integration", "modulation_index", "digital_freq", "analysis_mode")
+    }
+
+    def get_groups(self):
+        """Group name -> tuple of the group's field values."""
+        return {group: tuple(getattr(self, name) for name in names) for group, names in self.groups.items()}
+
+class ReceiverState(FrozenRecord):
+    """Receiver state carried from one simulated record to the next."""
+
+    __slots__ = (
+        "dc_voltage",  # Capacitor voltage at the end of the record (V)
+        "temperature",  # °C
+        "efficiency",
+        "periodic_start"  # Record began on the periodic steady state
+    )
@@ -1,250 +1,623 @@
-import numpy as np
-from scipy import signal
-
-class ReceiverModel:
-    def __init__(self):
-        # Signal parameters
-        self.frequency = 1000  # Hz
-        self.gain = 0  # dB
-        self.modulation = "am"  # "am", "fm", "digital", "mixed"
-        self.power_on = False
-        self.signal_mode = "analog"  # "analog", "digital", "mixed"
-
-        # Circuit parameters
-        self.rectifier_type = "bridge"  # "half_wave", "full_wave", "bridge"
-        self.filter_type = "capacitive"  # "capacitive", "inductive", "active"
-        self.filter_capacitance = 100e-6  # Farads (100 µF)
-        self.filter_inductance = 10e-3  # Henries (10 mH)
-        self.active_filter_cutoff = 100  # Hz for active filter
-        self.regulator_type = "none"  # "none", "linear", "switching"
-        self.linear_vref = 5.0  # Reference voltage for linear regulator (V)
-        self.switching_freq = 10000  # Switching regulator frequency (Hz)
-        self.turns_ratio = 1.0  # Transformer turns ratio
-        self.coil_inductance = 1e-3  # Transformer leakage inductance (1 mH)
-        self.load_resistance = 100  # Ohms
-        self.dc_voltage = 0  # Initial DC voltage across capacitor
-        self.input_voltage = 120  # RMS input voltage (60 Hz)
-
-        # Nonlinear device parameters
-        self.diode_is = 1e-12  # Diode saturation current (A)
-        self.diode_vt = 0.025  # Thermal voltage (V) at 25°C
-        self.mosfet_vth = 2.0  # MOSFET threshold voltage (V)
-        self.mosfet_k = 0.1  # MOSFET gain factor (A/V^2)
-        self.opamp_gain = 1000  # Op-amp open-loop gain for active filter/regulator
-
-        # Passive component parameters
-        self.parasitic_resistance = 0.1  # Series resistance for inductors (Ohms)
-
-        # Thermal parameters
-        self.temperature = 25  # °C
-        self.thermal_resistance = 10  # °C/W
-        self.efficiency = 1.0
-
-        # Simulation parameters
-        self.dt = 0.1 / 1000  # Time step (0.1 s / 1000 samples)
-        self.modulation_index = 0.5  # AM/FM modulation index
-        self.digital_freq = 500  # Hz for digital signal
-
-        # Analysis mode
-        self.analysis_mode = "transient"  # "transient", "steady_state", "frequency"
-
-    def set_frequency(self, value):
-        self.frequency = value
-
-    def set_gain(self, value):
-        self.gain = value
-
-    def set_modulation(self, mod_type):
-        self.modulation = mod_type.lower()
-
-    def set_power(self, state):
-        self.power_on = state
-
-    def set_signal_mode(self, mode):
-        self.signal_mode = mode.lower()
-
-    def set_analysis_mode(self, mode):
-        self.analysis_mode = mode.lower()
-
-    def set_filter_type(self, f_type):
-        self.filter_type = f_type.lower()
-
-    def set_regulator_type(self, r_type):
-        self.regulator_type = r_type.lower()
-
-    def set_filter_inductance(self, value):
-        self.filter_inductance = value
-
-    def set_active_filter_cutoff(self, value):
-        self.active_filter_cutoff = value
-
-    def set_linear_vref(self, value):
-        self.linear_vref = value
-
-    def set_switching_freq(self, value):
-        self.switching_freq = value
-
-    def set_coil_inductance(self, value):
-        self.coil_inductance = value
-
-    def diode_model(self, v):
-        """Nonlinear diode model with exponent clipping to prevent overflow."""
-        max_exp = 700  # Maximum exponent to prevent overflow in np.exp
-        v_scaled = np.clip(v / self.diode_vt, -max_exp, max_exp)
-        return self.diode_is * (np.exp(v_scaled) - 1)
-
-    def mosfet_model(self, vgs, vds):
-        """Simple MOSFET model (square-law for saturation region)."""
-        if vgs < self.mosfet_vth:
-            return 0  # Cutoff
-        if vds < (vgs - self.mosfet_vth):
-            return self.mosfet_k * (vgs - self.mosfet_vth) * vds  # Linear region
-        return 0.5 * self.mosfet_k * (vgs - self.mosfet_vth)**2  # Saturation region
-
-    def opamp_model(self, v_in, v_out):
-        """Simple op-amp model for active filter/regulator with clipping."""
-        max_output = 1000  # Maximum output voltage to prevent overflow
-        output = self.opamp_gain * (v_in - v_out)
-        return np.clip(output, -max_output, max_output)
-
-    def generate_waveform(self, t):
-        if not self.power_on:
-            self.dc_voltage = 0
-            self.temperature = 25
-            self.efficiency = 1.0
-            return np.zeros_like(t), np.zeros_like(t), np.zeros_like(t)
-
-        # AC input (60 Hz)
-        ac_voltage = self.input_voltage * np.sqrt(2) * np.sin(2 * np.pi * 60 * t)
-
-        # Transformer with leakage inductance
-        max_voltage = 1000
-        transformed_voltage = ac_voltage * self.turns_ratio
-        if self.coil_inductance > 0:
-            # Model leakage inductance as a high-pass filter effect
-            di_dt = np.diff(ac_voltage) / self.dt
-            di_dt = np.append(di_dt, di_dt[-1])  # Pad last value
-            transformed_voltage -= self.coil_inductance * di_dt
-        transformed_voltage = np.clip(transformed_voltage, -max_voltage, max_voltage)
-
-        # Rectifier with nonlinear diode model
-        rectified = np.zeros_like(transformed_voltage)
-        if self.rectifier_type == "half_wave":
-            rectified = np.where(self.diode_model(transformed_voltage) > 0, transformed_voltage, 0)
-        elif self.rectifier_type == "full_wave":
-            rectified = np.where(self.diode_model(np.abs(transformed_voltage)) > 0, np.abs(transformed_voltage), 0)
-        else:  # bridge
-            v = np.abs(transformed_voltage)
-            diode_drop = 2 * self.diode_vt * np.log1p(self.diode_model(v) / self.diode_is + 1)
-            rectified = np.maximum(v - diode_drop, 0)
-
-        # Filter
-        filtered = np.zeros_like(rectified)
-        if self.filter_type == "capacitive":
-            for i in range(len(t)):
-                if self.filter_capacitance > 0:
-                    current = (rectified[i] - self.dc_voltage) / self.load_resistance
-                    self.dc_voltage += current * self.dt / self.filter_capacitance
-                    self.dc_voltage = max(self.dc_voltage, 0)
-                    filtered[i] = self.dc_voltage
-                else:
-                    filtered[i] = rectified[i]
-        elif self.filter_type == "inductive":
-            # Simple RL low-pass filter
-            tau = self.filter_inductance / (self.load_resistance + self.parasitic_resistance)
-            for i in range(1, len(t)):
-                filtered[i] = filtered[i-1] + self.dt / tau * (rectified[i] - filtered[i-1])
-            filtered[0] = rectified[0]
-        else:  # active
-            # First-order low-pass active filter using op-amp
-            tau = 1 / (2 * np.pi * self.active_filter_cutoff)
-            for i in range(1, len(t)):
-                v_in = rectified[i]
-                v_out = filtered[i-1]
-                filtered[i] = v_out + self.dt / tau * self.opamp_model(v_in, v_out)
-            filtered[0] = rectified[0]
-
-        # Regulator
-        regulated = filtered.copy()
-        if self.regulator_type == "linear":
-            # Simple linear regulator: clamp to reference voltage
-            regulated = np.clip(filtered, 0, self.linear_vref)
-        elif self.regulator_type == "switching":
-            # Basic buck converter model
-            duty_cycle = np.clip(self.linear_vref / (np.mean(filtered) + 1e-9), 0, 1)
-            switching_signal = np.sign(np.sin(2 * np.pi * self.switching_freq * t))
-            regulated = filtered * duty_cycle * (switching_signal > 0)
-
-        # Digital signal (square wave for mixed-signal or digital mode)
-        digital_signal = np.zeros_like(t)
-        if self.signal_mode in ["digital", "mixed"]:
-            digital_signal = np.sign(np.sin(2 * np.pi * self.digital_freq * t))
-
-        # Apply AM/FM modulation or digital/mixed signal
-        carrier = regulated * np.sin(2 * np.pi * self.frequency * t)
-        gain_linear = 10 ** (self.gain / 20)
-        if self.signal_mode == "digital":
-            modulated = gain_linear * digital_signal
-        elif self.signal_mode == "mixed":
-            modulated = gain_linear * (carrier + digital_signal)
-        elif self.modulation == "am":
-            modulating = self.modulation_index * np.sin(2 * np.pi * 100 * t)
-            modulated = gain_linear * carrier * (1 + modulating)
-        else:  # fm
-            modulating = self.modulation_index * np.sin(2 * np.pi * 100 * t)
-            phase = 2 * np.pi * self.frequency * t + self.modulation_index * np.cumsum(modulating) * self.dt
-            modulated = gain_linear * regulated * np.sin(phase)
-
-        # Update thermal model
-        max_amplitude = 1000  # Clip signal to prevent overflow in power calculation
-        regulated = np.clip(regulated, -max_amplitude, max_amplitude)
-        power = np.mean(regulated**2 / self.load_resistance)
-        self.update_thermal(power)
-
-        return ac_voltage, rectified, modulated
-
-    def update_thermal(self, power):
-        ambient_temp = 25
-        time_constant = 1.0  # seconds
-        self.temperature += (power * self.thermal_resistance - (self.temperature - ambient_temp)) * self.dt / time_constant
-        self.temperature = max(self.temperature, ambient_temp)
-        input_power = self.dc_voltage**2 / self.load_resistance + 1e-9
-        self.efficiency = 1 - (power / input_power) if input_power > 0 else 1.0
-        self.efficiency = min(max(self.efficiency, 0), 1)
-
-    def analyze_waveform(self, signal, t):
-        max_amplitude = 1000  # Clip signal to prevent overflow
-        signal = np.clip(signal, -max_amplitude, max_amplitude)
-        if self.analysis_mode == "transient":
-            steady_state = signal[len(signal)//2:]
-            ripple_voltage = np.max(steady_state) - np.min(steady_state) if len(steady_state) > 0 else 0
-            return {
-                "ripple_voltage": ripple_voltage,
-                "thd": 0,
-                "power": np.mean(signal**2 / self.load_resistance) if len(signal) > 0 else 0,
-                "transient_time": len(t) * self.dt / 2
-            }
-        elif self.analysis_mode == "steady_state":
-            steady_state = signal[len(signal)//2:]
-            avg_voltage = np.mean(steady_state) if len(steady_state) > 0 else 0
-            ripple_voltage = np.max(steady_state) - np.min(steady_state) if len(steady_state) > 0 else 0
-            return {
-                "ripple_voltage": ripple_voltage,
-                "avg_voltage": avg_voltage,
-                "power": np.mean(steady_state**2 / self.load_resistance) if len(steady_state) > 0 else 0
-            }
-        else:  # frequency
-            fft = np.fft.fft(signal)
-            freqs = np.fft.fftfreq(len(signal), self.dt)[:len(signal)//2]
-            fft = fft[:len(signal)//2]
-            fundamental_idx = np.argmin(np.abs(freqs - 60))
-            fundamental = np.abs(fft[fundamental_idx]) / len(signal) if len(signal) > 0 else 1e-9
-            harmonics = sum(np.abs(fft[2*fundamental_idx:11*fundamental_idx])**2) / len(signal) if len(signal) > 0 else 0
-            thd = np.sqrt(harmonics) / fundamental * 100 if fundamental > 0 else 0
-            phase = np.angle(fft[fundamental_idx], deg=True) if len(signal) > 0 else 0
-            return {
-                "thd": thd,
-                "fundamental_freq": freqs[fundamental_idx] if len(signal) > 0 else 0,
-                "phase": phase,
-                "power": np.mean(signal**2 / self.load_resistance) if len(signal) > 0 else 0
-            }
\ No newline at end of file
+import copy
+import numpy as np
+from scipy import signal
+from FilterEngine import FilterEngine
+from AdaptiveSolver import AdaptiveSolver
+from SteadyStateSolver import SteadyStateSolver
+from ResultCache import ResultCache
+from BufferArena import BufferArena
+from ReceiverConfig import ReceiverConfig, ReceiverState
+from NonlinearDevices import DiodeTable
+from Precision import precision
+
+class ReceiverModel:
+    # Waveforms of repeated configurations are served from one cache shared by every model
+    # (and copy) in the process
+    cache = ResultCache()
+    # Relative capacitor-voltage change over a record below which the record is settled: it is
+    # cached, and served again while the carried voltage stays this close to its start
+    settle_tolerance = 1e-9
+    # Solver settings that change results, included in the cache key
+    solver_settings = {
+        "filter_engine": ("min_segment", "block_size"),
+        "adaptive_solver": ("method", "rtol", "atol", "max_step", "scan_resolution"),
+        "steady_state_solver": ("tol", "max_iter", "max_line_cycles")
+    }
+
+    def __init__(self):
+        # Signal parameters
+        self.frequency = 1000  # Hz
+        self.gain = 0  # dB
+        self.modulation = "am"  # "am", "fm", "digital", "mixed"
+        self.power_on = False
+        self.signal_mode = "analog"  # "analog", "digital", "mixed"
+
+        # Circuit parameters
+        self.rectifier_type = "bridge"  # "half_wave", "full_wave", "bridge"
+        self.filter_type = "capacitive"  # "capacitive", "inductive", "active"
+        self.filter_capacitance = 100e-6  # Farads (100 µF)
+        self.filter_inductance = 10e-3  # Henries (10 mH)
+        self.active_filter_cutoff = 100  # Hz for active filter
+        self.regulator_type = "none"  # "none", "linear", "switching"
+        self.linear_vref = 5.0  # Reference voltage for linear regulator (V)
+        self.switching_freq = 10000  # Switching regulator frequency (Hz)
+        self.switching_model = "switched"  # "switched" (square-wave), "averaged" (cycle-averaged buck)
+        self.turns_ratio = 1.0  # Transformer turns ratio
+        self.coil_inductance = 1e-3  # Transformer leakage inductance (1 mH)
+        self.load_resistance = 100  # Ohms
+        self.dc_voltage = 0  # Initial DC voltage across capacitor
+        self.capacitor_solver = "euler"  # "euler" (RC through load), "analytic" (ideal-diode peak detector)
+        self.input_voltage = 120  # RMS input voltage (60 Hz)
+
+        # Nonlinear device parameters
+        self.diode_is = 1e-12  # Diode saturation current (A)
+        self.diode_vt = 0.025  # Thermal voltage (V) at 25°C
+        self.diode_solver = "exact"  # "exact" (exp/log per sample), "table" (interpolated DiodeTable)
+        self.mosfet_vth = 2.0  # MOSFET threshold voltage (V)
+        self.mosfet_k = 0.1  # MOSFET gain factor (A/V^2)
+        self.opamp_gain = 1000  # Op-amp open-loop gain for active filter/regulator
+        self.opamp_max_output = 1000  # Op-amp output clipping level (V)
+        self.switch_on_fraction = 0.5  # Fraction of each switching period with sign(sin) > 0
+
+        # Passive component parameters
+        self.parasitic_resistance = 0.1  # Series resistance for inductors (Ohms)
+
+        # Thermal parameters
+        self.temperature = 25  # °C
+        self.thermal_resistance = 10  # °C/W
+        self.efficiency = 1.0
+
+        # Simulation parameters
+        self.dt = 0.1 / 1000  # Time step (0.1 s / 1000 samples)
+        self.integration = "fixed"  # "fixed" (dt-step recurrences), "adaptive" (error-controlled ODE solver)
+        self.modulation_index = 0.5  # AM/FM modulation index
+        self.digital_freq = 500  # Hz for digital signal
+
+        # Analysis mode
+        self.analysis_mode = "transient"  # "transient", "steady_state", "frequency"
+
+        # Block evaluation of the filter recurrences
+        self.filter_engine = FilterEngine()
+        self.adaptive_solver = AdaptiveSolver(self)
+        self.steady_state_solver = SteadyStateSolver(self)
+        self.periodic_start = False  # Last waveform began on the periodic steady state
+        # Stage outputs of generate_waveform, reused from record to record
+        self.arena = BufferArena()
+
+        # Shared TimeBase set by the owner; records on its grid take their tones from its oscillator tables
+        self.time_base = None
+
+    def __copy__(self):
+        """Shallow copy whose solvers are bound to the copy instead of this model, with its own buffers."""
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.arena = BufferArena()
+        for name in ("adaptive_solver", "steady_state_solver"):
+            solver = copy.copy(getattr(self, name))
+            solver.model = clone
+            setattr(clone, name, solver)
+        return clone
+
+    @classmethod
+    def from_config(cls, config, state=None):
+        """New model with the parameters of a ReceiverConfig and, optionally, a ReceiverState."""
+        model = cls()
+        model.set_config(config)
+        if state is not None:
+            model.set_state(state)
+        return model
+
+    def get_config(self):
+        """Immutable, hashable snapshot of the current parameters."""
+        return ReceiverConfig(**{name: getattr(self, name) for name in ReceiverConfig.__slots__})
+
+    def set_config(self, config):
+        for name in ReceiverConfig.__slots__:
+            setattr(self, name, getattr(config, name))
+
+    def get_state(self):
+        return ReceiverState(**{name: getattr(self, name) for name in ReceiverState.__slots__})
+
+    def set_state(self, state):
+        for name in ReceiverState.__slots__:
+            setattr(self, name, getattr(state, name))
+
+    def set_frequency(self, value):
+        self.frequency = value
+
+    def set_gain(self, value):
+        self.gain = value
+
+    def set_modulation(self, mod_type):
+        self.modulation = mod_type.lower()
+
+    def set_power(self, state):
+        self.power_on = state
+
+    def set_signal_mode(self, mode):
+        self.signal_mode = mode.lower()
+
+    def set_analysis_mode(self, mode):
+        self.analysis_mode = mode.lower()
+
+    def set_filter_type(self, f_type):
+        self.filter_type = f_type.lower()
+
+    def set_regulator_type(self, r_type):
+        self.regulator_type = r_type.lower()
+
+    def set_integration(self, method):
+        self.integration = method.lower()
+
+    def set_capacitor_solver(self, solver):
+        self.capacitor_solver = solver.lower()
+
+    def set_diode_solver(self, solver):
+        self.diode_solver = solver.lower()
+
+    def set_filter_inductance(self, value):
+        self.filter_inductance = value
+
+    def set_active_filter_cutoff(self, value):
+        self.active_filter_cutoff = value
+
+    def set_linear_vref(self, value):
+        self.linear_vref = value
+
+    def set_switching_freq(self, value):
+        self.switching_freq = value
+
+    def set_switching_model(self, fidelity):
+        self.switching_model = fidelity.lower()
+
+    def set_coil_inductance(self, value):
+        self.coil_inductance = value
+
+    def diode_model(self, v, out=None):
+        """Nonlinear diode model with exponent clipping to prevent overflow; exact currents go into out when given."""
+        if self.diode_solver == "table":
+            return DiodeTable(self.diode_is, self.diode_vt).current(v)
+        max_exp = 700  # Maximum exponent to prevent overflow in np.exp (float64, whatever the working precision)
+        if out is None:
+            v_scaled = np.clip(np.asarray(v, dtype=np.float64) / self.diode_vt, -max_exp, max_exp)
+            return self.diode_is * (np.exp(v_scaled) - 1)
+        # Same steps, in place
+        np.divide(v, self.diode_vt, out=out, dtype=np.float64)
+        np.clip(out, -max_exp, max_exp, out=out)
+        np.exp(out, out=out)
+        np.subtract(out, 1, out=out)
+        return np.multiply(self.diode_is, out, out=out)
+
+    def mosfet_model(self, vgs, vds):
+        """Simple MOSFET model (square-law for saturation region)."""
+        if vgs < self.mosfet_vth:
+            return 0  # Cutoff
+        if vds < (vgs - self.mosfet_vth):
+            return self.mosfet_k * (vgs - self.mosfet_vth) * vds  # Linear region
+        return 0.5 * self.mosfet_k * (vgs - self.mosfet_vth)**2  # Saturation region
+
+    def opamp_model(self, v_in, v_out):
+        """Simple op-amp model for active filter/regulator with clipping."""
+        output = self.opamp_gain * (v_in - v_out)
+        return np.clip(output, -self.opamp_max_output, self.opamp_max_output)
+
+    def generate_waveform(self, t, state=None):
+        # Numeric parameters may be (n_configs, 1) columns; waveforms then broadcast to
+        # (n_configs, len(t)) and per-configuration state is kept as columns.
+        # With a StreamState, t continues the previous block and filter/FM/thermal state carries over.
+        # The waveforms are read-only: the cache's own arrays on a hit, otherwise views of the
+        # model's arena buffers, valid until the next call (copy them to keep them longer).
+        if not self.power_on:
+            self.dc_voltage = 0
+            self.temperature = 25
+            self.efficiency = 1.0
+            zeros = self.get_read_only(np.zeros(np.shape(t), dtype=precision.get_dtype()))
+            return zeros, zeros, zeros
+
+        # Streamed blocks are never repeated, so only standalone records are cached
+        key = self.get_cache_key(t) if state is None else None
+        entry = self.cache.get(key, self.is_reusable) if key is not None else None
+        if entry is None:
+            v_start = self.dc_voltage
+            waveforms, power = self.simulate_waveform(t, state)
+            if key is not None and self.cache.enabled and (
+                    self.is_start_fixed(self.periodic_start) or self.is_settled(v_start, self.dc_voltage)):
+                # The arena is overwritten by the next record; the cache keeps its own copies
+                waveforms = tuple(self.get_read_only(np.array(w)) for w in waveforms)
+                n_bytes = sum(w.nbytes for w in waveforms)
+                self.cache.put(key, (waveforms, power, v_start, self.dc_voltage, self.periodic_start), n_bytes)
+        else:
+            waveforms, power, _, self.dc_voltage, self.periodic_start = entry
+        # The thermal state is not part of the key; it advances on every call, cached or not
+        self.update_thermal(power, None if state is None else len(t) * self.dt)
+        return tuple(self.get_read_only(w) for w in waveforms)
+
+    def get_read_only(self, x):
+        """Read-only view of x, so callers cannot write into cached or arena arrays."""
+        view = x.view()
+        view.flags.writeable = False
+        return view
+
+    def get_buffer(self, arena, name, *operands, dtype=None):
+        """Output array for an operation on operands: their broadcast shape and result dtype.
+
+        Taken from the arena when one is given, so repeated records write into
+        the same memory; otherwise newly allocated.
+        """
+        # Broadcasting is only worked out when operands differ in shape (batches)
+        shapes = {np.shape(x) for x in operands} - {()}
+        shape = shapes.pop() if len(shapes) == 1 else np.broadcast_shapes((), *shapes)
+        dtype = np.result_type(*operands) if dtype is None else dtype
+        return np.empty(shape, dtype) if arena is None else arena.get(name, shape, dtype)
+
+    def cast(self, x, arena=None, name=None):
+        """x in the working precision; a conversion is written into the arena buffer name when an arena is given."""
+        dtype = precision.get_dtype()
+        if arena is None or x.dtype == dtype:
+            return precision.cast(x)
+        out = arena.get(name, x.shape, dtype)
+        np.copyto(out, x, casting="same_kind")
+        return out
+
+    def get_cache_key(self, t):
+        """Content hash of the configuration, solver settings, time base and precision (not the evolving state)."""
+        items = [(name, getattr(self, name)) for name in sorted(ReceiverConfig.__slots__)]
+        for solver, names in self.solver_settings.items():
+            items.extend((f"{solver}.{name}", getattr(getattr(self, solver), name)) for name in names)
+        items.append(("t", t))
+        items.append(("precision", precision.mode))
+        return self.cache.get_key(items)
+
+    def is_start_fixed(self, periodic_start):
+        """True when the configuration alone fixes the filter state a standalone record starts from.
+
+        Inductive and active filters restart from rest, and a steady-state record
+        that converged (periodic_start) starts on the periodic orbit of its
+        configuration; otherwise the capacitor starts from the carried dc_voltage.
+        """
+        if self.filter_type != "capacitive" or np.all(np.asarray(self.filter_capacitance) <= 0):
+            return True
+        return self.analysis_mode == "steady_state" and bool(np.all(periodic_start))
+
+    def is_settled(self, v_start, v_end):
+        """True when every row's capacitor voltage changed by at most settle_tolerance (relative) over a record."""
+        v_start, v_end = np.asarray(v_start, dtype=float), np.asarray(v_end, dtype=float)
+        return bool(np.all(np.abs(v_end - v_start) <= self.settle_tolerance * np.maximum(np.abs(v_start), 1.0)))
+
+    def is_reusable(self, entry):
+        """True when a cached record applies to the current carried state (the cache's validity check)."""
+        _, _, v_start, _, periodic_start = entry
+        if self.is_start_fixed(periodic_start):
+            return True
+        return np.shape(self.dc_voltage) == np.shape(v_start) and self.is_settled(v_start, self.dc_voltage)
+
+    def get_sine(self, frequency, t):
+        """sin(2π frequency t), from the shared time base's table when t is its grid."""
+        if self.time_base is not None and t is self.time_base.t and np.ndim(frequency) == 0:
+            return self.time_base.sine(frequency)
+        return np.sin(2 * np.pi * frequency * t)
+
+    def get_square(self, frequency, t):
+        """sign(sin(2π frequency t)), from the shared time base's table when t is its grid."""
+        if self.time_base is not None and t is self.time_base.t and np.ndim(frequency) == 0:
+            return self.time_base.square(frequency)
+        return np.sign(np.sin(2 * np.pi * frequency * t))
+
+    def simulate_waveform(self, t, state=None):
+        """Uncached simulation: returns ((ac, rectified, modulated), mean load power) without the thermal update."""
+        # The analytic peak detector is already exact between conduction events
+        if self.integration == "adaptive" and state is None and not (
+                self.filter_type == "capacitive" and self.capacitor_solver == "analytic"):
+            ac_voltage, rectified, modulated, power = self.adaptive_solver.simulate(t)
+            return tuple(precision.cast(w) for w in (ac_voltage, rectified, modulated)), power
+
+        arena = self.arena
+        ac_voltage, rectified = self.front_end(t, continuous=state is not None, arena=arena)
+
+        # Filter
+        # Steady-state records start on the periodic orbit found by the shooting method, when one exists
+        v_periodic = self.steady_state_solver.solve() if state is None and self.analysis_mode == "steady_state" else None
+        self.periodic_start = False if v_periodic is None else self.steady_state_solver.converged
+        if np.all(self.periodic_start):
+            filtered = self.apply_filter(rectified, v_periodic, arena)
+        elif self.filter_type == "capacitive":
+            filtered = self.apply_filter(rectified, self.dc_voltage, arena)
+        elif state is not None:
+            filtered = self.apply_filter(rectified, state.filter_output, arena)
+            state.filter_output = self.last_sample(filtered)
+        else:
+            # Inductive/active filters restart from rest
+            filtered = self.apply_filter(rectified, 0.0, arena, restart=True)
+        if np.any(self.periodic_start) and not np.all(self.periodic_start):
+            # Batch rows without a periodic orbit keep the settling start
+            periodic = self.apply_filter(rectified, np.where(self.periodic_start, v_periodic, 0.0))
+            filtered = np.where(self.periodic_start, periodic, filtered)
+        if self.filter_type == "capacitive" and np.any(np.asarray(self.filter_capacitance) > 0):
+            self.dc_voltage = self.last_sample(filtered)
+        # Carried filter state is taken above at full precision
+        filtered = self.cast(filtered, arena, "filtered_cast")
+
+        # Regulator
+        regulated = self.cast(self.regulate(filtered, t, arena=arena), arena, "regulated_cast")
+
+        # Modulation
+        modulated = self.cast(self.modulate(regulated, t, state, arena=arena), arena, "modulated_cast")
+
+        # Update thermal model
+        load_power = self.load_power(regulated, arena)
+        power = np.mean(load_power, axis=-1, keepdims=load_power.ndim > 1, dtype=np.float64)
+        return (ac_voltage, rectified, modulated), power
+
+    def front_end(self, t, continuous=False, arena=None):
+        """AC input and rectifier output; continuous records take di/dt from the next sample rather than padding.
+
+        Stage outputs are written into arena buffers when an arena is given.
+        """
+        # AC input (60 Hz); continuous records also evaluate the sample after t[-1]
+        t_ac = np.append(t, t[-1] + self.dt) if continuous else t
+        amplitude = self.input_voltage * np.sqrt(2)
+        sine = self.get_sine(60, t_ac)
+        ac_input = np.multiply(amplitude, sine, out=self.get_buffer(arena, "ac_input", amplitude, sine))
+        ac_voltage = self.cast(ac_input[..., :len(t)], arena, "ac")
+
+        # Transformer with leakage inductance
+        di_dt = None
+        if np.any(np.asarray(self.coil_inductance) > 0):
+            # Differenced at full precision: neighbouring samples are close
+            n = ac_input.shape[-1] - 1
+            di_dt = self.get_buffer(arena, "di_dt", ac_input[..., :len(t)])
+            np.subtract(ac_input[..., 1:], ac_input[..., :-1], out=di_dt[..., :n])
+            np.divide(di_dt[..., :n], self.dt, out=di_dt[..., :n])
+            if not continuous:
+                di_dt[..., -1] = di_dt[..., -2]  # Pad last value
+            di_dt = self.cast(di_dt, arena, "di_dt_cast")
+        transformed_voltage = self.transformer(ac_voltage, di_dt, arena)
+
+        # Rectifier with nonlinear diode model
+        return ac_voltage, self.cast(self.rectify(transformed_voltage, arena), arena, "rectified_cast")
+
+    def apply_filter(self, rectified, v0, arena=None, restart=False):
+        """Run the selected filter over rectified, starting from output (capacitor) voltage v0.
+
+        A restart shows the input on the first sample and starts the filter
+        from v0 on the next one. The output goes into an arena buffer when an
+        arena is given.
+        """
+        engine = self.filter_engine
+        if self.filter_type == "capacitive":
+            if np.all(np.asarray(self.filter_capacitance) <= 0):
+                filtered = self.get_buffer(arena, "filtered", rectified)
+                np.copyto(filtered, rectified)
+                return filtered
+            rc = self.load_resistance * self.filter_capacitance
+            alpha = self.dt / rc
+            if self.capacitor_solver == "analytic":
+                # Peak detector: charge while the diodes conduct, discharge exp(-dt/RC) otherwise
+                step, params = engine.peak_detector, (np.exp(-alpha),)
+            elif np.all(alpha <= 1) and np.min(rectified) >= 0 and np.all(np.asarray(v0) >= 0):
+                # Euler step cannot go negative here, so the clamp never applies
+                step, params = engine.first_order_lowpass, (alpha,)
+            else:
+                # Euler charge through the load, clamped at zero
+                step, params = engine.clamped_lowpass, (alpha,)
+        elif self.filter_type == "inductive":
+            # Simple RL low-pass filter
+            tau = self.filter_inductance / (self.load_resistance + self.parasitic_resistance)
+            step, params = engine.first_order_lowpass, (self.dt / tau,)
+        else:
+            # First-order low-pass active filter using op-amp
+            tau = 1 / (2 * np.pi * self.active_filter_cutoff)
+            # Same recurrence as stepping opamp_model sample by sample
+            step, params = engine.opamp_lowpass, (self.dt / tau, self.opamp_gain, self.opamp_max_output)
+        filtered = self.get_buffer(arena, "filtered", rectified, v0, *params, dtype=np.float64)
+        if not restart:
+            return step(rectified, *params, v0, out=filtered)
+        step(rectified[..., 1:], *params, v0, out=filtered[..., 1:])
+        filtered[..., :1] = rectified[..., :1]
+        return filtered
+
+    def transformer(self, ac_voltage, di_dt=None, arena=None):
+        """Transformer output for the given primary voltage and its time derivative (V/s)."""
+        max_voltage = 1000
+        operands = (ac_voltage, self.turns_ratio) if di_dt is None else (
+            ac_voltage, self.turns_ratio, self.coil_inductance, di_dt)
+        transformed_voltage = self.get_buffer(arena, "transformed", *operands)
+        np.multiply(ac_voltage, self.turns_ratio, out=transformed_voltage)
+        if di_dt is not None:
+            # Model leakage inductance as a high-pass filter effect
+            leakage = np.multiply(self.coil_inductance, di_dt,
+                                  out=self.get_buffer(arena, "leakage", self.coil_inductance, di_dt))
+            np.subtract(transformed_voltage, leakage, out=transformed_voltage)
+        return np.clip(transformed_voltage, -max_voltage, max_voltage, out=transformed_voltage)
+
+    def rectify(self, transformed_voltage, arena=None):
+        """Rectifier output using the nonlinear diode model."""
+        if self.rectifier_type == "bridge":
+            v = np.abs(transformed_voltage, out=self.get_buffer(arena, "magnitude", transformed_voltage))
+            drop = self.bridge_drop(v, arena)
+            rectified = np.subtract(v, drop, out=self.get_buffer(arena, "rectified", v, drop))
+            return np.maximum(rectified, 0, out=rectified)
+        v = transformed_voltage
+        if self.rectifier_type == "full_wave":
+            v = np.abs(transformed_voltage, out=self.get_buffer(arena, "magnitude", transformed_voltage))
+        # Half/full-wave: the input where the diode conducts, zero elsewhere
+        current = self.diode_model(
+            v, out=self.get_buffer(arena, "diode_current", v, self.diode_is, self.diode_vt, dtype=np.float64))
+        conducting = np.greater(current, 0, out=self.get_buffer(arena, "conducting", current, dtype=bool))
+        rectified = self.get_buffer(arena, "rectified", conducting, v)
+        rectified.fill(0)
+        np.copyto(rectified, v, where=conducting)
+        return rectified
+
+    def bridge_drop(self, v, arena=None):
+        """Forward drop (V) of the two conducting bridge diodes at rectifier input magnitude v."""
+        if self.diode_solver == "table":
+            return 2 * DiodeTable(self.diode_is, self.diode_vt).forward_drop(v)
+        drop = self.diode_model(
+            v, out=self.get_buffer(arena, "bridge_drop", v, self.diode_is, self.diode_vt, dtype=np.float64))
+        np.divide(drop, self.diode_is, out=drop)
+        np.add(drop, 1, out=drop)
+        np.log1p(drop, out=drop)
+        return np.multiply(2 * self.diode_vt, drop, out=drop)
+
+    def regulate(self, filtered, t, mean_filtered=None, arena=None):
+        """Regulator output; mean_filtered overrides the record mean used for the buck duty cycle."""
+        if self.regulator_type == "linear":
+            # Simple linear regulator: clamp to reference voltage
+            return np.clip(filtered, 0, self.linear_vref,
+                           out=self.get_buffer(arena, "regulated", filtered, self.linear_vref))
+        elif self.regulator_type == "switching":
+            # Basic buck converter model
+            if mean_filtered is None:
+                mean_filtered = np.mean(filtered, axis=-1, keepdims=True)
+            duty_cycle = np.clip(self.linear_vref / (mean_filtered + 1e-9), 0, 1)
+            if self.switching_model == "averaged":
+                # State-space average over a switching period: the switch is on for half of it
+                regulated = self.get_buffer(arena, "regulated", filtered, duty_cycle, self.switch_on_fraction)
+                np.multiply(filtered, duty_cycle, out=regulated)
+                return np.multiply(regulated, self.switch_on_fraction, out=regulated)
+            switching_signal = self.get_square(self.switching_freq, t)
+            # 1 while the switch is on, 0 otherwise; kept as floats so the product needs no cast
+            switch_on = np.maximum(switching_signal, 0, out=self.get_buffer(arena, "switch_on", switching_signal))
+            regulated = self.get_buffer(arena, "regulated", filtered, duty_cycle, switch_on,
+                                        dtype=np.result_type(filtered, duty_cycle))
+            np.multiply(filtered, duty_cycle, out=regulated)
+            return np.multiply(regulated, switch_on, out=regulated)
+        regulated = self.get_buffer(arena, "regulated", filtered)
+        np.copyto(regulated, filtered)
+        return regulated
+
+    def load_power(self, regulated, arena=None):
+        """Instantaneous load power (W) for a regulator output waveform."""
+        max_amplitude = 1000  # Clip signal to prevent overflow in power calculation
+        averaged = self.regulator_type == "switching" and self.switching_model == "averaged"
+        regulated = np.clip(regulated, -max_amplitude, max_amplitude,
+                            out=self.get_buffer(arena, "clipped_output", regulated))
+        np.square(regulated, out=regulated)
+        operands = (regulated, self.load_resistance) + ((self.switch_on_fraction,) if averaged else ())
+        load_power = np.divide(regulated, self.load_resistance, out=self.get_buffer(arena, "load_power", *operands))
+        if averaged:
+            # Cycle-averaged power of the switched waveform: (D * V)^2 while on, zero while off
+            np.divide(load_power, self.switch_on_fraction, out=load_power)
+        return load_power
+
+    def modulate(self, regulated, t, state=None, dt=None, arena=None):
+        """Apply AM/FM modulation or the digital/mixed signal to the regulated output (dt: grid spacing)."""
+        dt = self.dt if dt is None else dt
+        gain_linear = 10 ** (self.gain / 20)
+        if self.signal_mode == "digital":
+            # Square wave alone
+            digital_signal = self.get_square(self.digital_freq, t)
+            return np.multiply(gain_linear, digital_signal,
+                               out=self.get_buffer(arena, "modulated", gain_linear, digital_signal))
+
+        # Apply AM/FM modulation or digital/mixed signal
+        sine = self.get_sine(self.frequency, t)
+        if self.signal_mode == "mixed":
+            digital_signal = self.get_square(self.digital_freq, t)
+            carrier = np.multiply(regulated, sine, out=self.get_buffer(arena, "carrier", regulated, sine, digital_signal))
+            np.add(carrier, digital_signal, out=carrier)
+            return np.multiply(gain_linear, carrier, out=self.get_buffer(arena, "modulated", gain_linear, carrier))
+        tone = self.get_sine(100, t)
+        modulating = np.multiply(self.modulation_index, tone,
+                                 out=self.get_buffer(arena, "modulating", self.modulation_index, tone))
+        if self.modulation == "am":
+            carrier = np.multiply(regulated, sine, out=self.get_buffer(arena, "carrier", regulated, sine))
+            np.add(1, modulating, out=modulating)
+            modulated = self.get_buffer(arena, "modulated", gain_linear, carrier, modulating)
+            np.multiply(gain_linear, carrier, out=modulated)
+            return np.multiply(modulated, modulating, out=modulated)
+        # FM
+        integral = np.cumsum(modulating, axis=-1, out=self.get_buffer(arena, "fm_integral", modulating))
+        if state is not None:
+            integral = np.add(integral, state.fm_integral,
+                              out=self.get_buffer(arena, "fm_total", integral, state.fm_integral))
+            state.fm_integral = self.last_sample(integral)
+        omega = 2 * np.pi * self.frequency
+        phase = self.get_buffer(arena, "phase", omega, t, self.modulation_index, integral)
+        np.multiply(omega, t, out=phase)
+        deviation = np.multiply(self.modulation_index, integral,
+                                out=self.get_buffer(arena, "deviation", self.modulation_index, integral))
+        np.multiply(deviation, dt, out=deviation)
+        np.add(phase, deviation, out=phase)
+        np.sin(phase, out=phase)
+        modulated = self.get_buffer(arena, "modulated", gain_linear, regulated, phase)
+        np.multiply(gain_linear, regulated, out=modulated)
+        return np.multiply(modulated, phase, out=modulated)
+
+    def update_thermal(self, power, duration=None):
+        ambient_temp = 25
+        time_constant = 1.0  # seconds
+        if duration is None:
+            self.temperature += (power * self.thermal_resistance - (self.temperature - ambient_temp)) * self.dt / time_constant
+        else:
+            # Exact first-order response over a streamed block of the given length (s)
+            target = ambient_temp + power * self.thermal_resistance
+            self.temperature = target + (self.temperature - target) * np.exp(-duration / time_constant)
+        self.temperature = np.maximum(self.temperature, ambient_temp)
+        input_power = self.dc_voltage**2 / self.load_resistance + 1e-9
+        self.efficiency = np.where(input_power > 0, 1 - power / input_power, 1.0)
+        self.efficiency = np.clip(self.efficiency, 0, 1)
+
+    def last_sample(self, x):
+        """Final value of a waveform, as a column when x is a [n_configs, n_samples] batch.
+
+        Copied, so carried state does not change when x's buffer is reused.
+        """
+        return x[..., -1:].copy() if x.ndim > 1 else x[-1]
+
+    def analyze_waveform(self, signal, t):
+        # Metrics are taken along the last axis, so a [n_configs, n_samples] batch gives one value per row
+        max_amplitude = 1000  # Clip signal to prevent overflow
+        signal = np.clip(signal, -max_amplitude, max_amplitude)
+        n = signal.shape[-1]
+        if self.analysis_mode == "transient":
+            steady_state = signal[..., n//2:]
+            ripple_voltage = np.max(steady_state, axis=-1) - np.min(steady_state, axis=-1) if steady_state.shape[-1] > 0 else 0
+            return {
+                "ripple_voltage": ripple_voltage,
+                "thd": 0,
+                "power": np.mean(signal**2 / self.load_resistance, axis=-1) if n > 0 else 0,
+                "transient_time": len(t) * self.dt / 2
+            }
+        elif self.analysis_mode == "steady_state":
+            # Records started on the periodic steady state need no settling half (per batch row)
+            window = np.arange(n) >= np.where(self.periodic_start, 0, n//2)
+            count = np.sum(window, axis=-1)
+            if n == 0 or np.any(count == 0):
+                return {"ripple_voltage": 0, "avg_voltage": 0, "power": 0}
+            avg_voltage = np.sum(np.where(window, signal, 0), axis=-1) / count
+            ripple_voltage = (np.max(np.where(window, signal, -np.inf), axis=-1) -
+                              np.min(np.where(window, signal, np.inf), axis=-1))
+            return {
+                "ripple_voltage": ripple_voltage,
+                "avg_voltage": avg_voltage,
+                "power": np.sum(np.where(window, signal**2 / self.load_resistance, 0), axis=-1) / count
+            }
+        else:  # frequency
+            fft = np.fft.fft(signal, axis=-1)
+            freqs = np.fft.fftfreq(n, self.dt)[:n//2]
+            fft = fft[..., :n//2]
+            fundamental_idx = np.argmin(np.abs(freqs - 60))
+            fundamental = np.abs(fft[..., fundamental_idx]) / n if n > 0 else 1e-9
+            harmonics = np.sum(np.abs(fft[..., 2*fundamental_idx:11*fundamental_idx])**2, axis=-1) / n if n > 0 else 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                thd = np.where(fundamental > 0, np.sqrt(harmonics) / fundamental * 100, 0)
+            phase = np.angle(fft[..., fundamental_idx], deg=True) if n > 0 else 0
+            return {
+                "thd": thd,
+                "fundamental_freq": freqs[fundamental_idx] if n > 0 else 0,
+                "phase": phase,
+                "power": np.mean(signal**2 / self.load_resistance, axis=-1) if n > 0 else 0
+            }
+
+def simulate(config, state, t):
+    """Pure simulation of one record: returns ((ac, rectified, modulated), state after the record).
+
+    Neither config nor state is modified, so calls can be cached, reordered or
+    run in worker processes. ReceiverModel's setters and generate_waveform are
+    a stateful facade over the same computation.
+    """
+    model = ReceiverModel.from_config(config, state)
+    waveforms = model.generate_waveform(t)
+    return waveforms, model.get_state()
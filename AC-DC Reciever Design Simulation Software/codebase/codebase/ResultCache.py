@@ -0,0 +1,64 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+
+class ResultCache:
+    """Least-recently-used cache of simulation results keyed by a content hash, under a memory cap."""
+
+    def __init__(self, max_bytes=64 * 2**20):
+        self.max_bytes = max_bytes  # Memory cap for cached arrays (bytes)
+        self.enabled = True
+        self.entries = OrderedDict()  # Key -> (value, size in bytes), least recently used first
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_key(self, items):
+        """SHA-1 digest of (name, value) pairs; arrays are hashed by dtype, shape and contents."""
+        digest = hashlib.sha1()
+        for name, value in items:
+            digest.update(name.encode())
+            if isinstance(value, str):
+                digest.update(b"str:" + value.encode())
+            else:
+                value = np.ascontiguousarray(value)
+                digest.update(f"{value.dtype.str}{value.shape}".encode())
+                digest.update(memoryview(value).cast("B"))  # Hashes the array's memory without copying it
+        return digest.hexdigest()
+
+    def get(self, key, valid=None):
+        """Cached value for key, or None on a miss; a value failing valid(value) counts as a miss."""
+        if self.enabled and key in self.entries and (valid is None or valid(self.entries[key][0])):
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key][0]
+        self.misses += 1
+        return None
+
+    def put(self, key, value, n_bytes):
+        if not self.enabled or n_bytes > self.max_bytes:
+            return
+        if key in self.entries:
+            self.n_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (value, n_bytes)
+        self.n_bytes += n_bytes
+        while self.n_bytes > self.max_bytes:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.n_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.n_bytes = 0
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.n_bytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,159 @@
+import argparse
+import json
+import sys
+import numpy as np
+from SimulationCore import SimulationCore, compare_grid, compare_integration, compare_precision
+from Kernels import kernels
+from Precision import precision
+
+def load_scenarios(path):
+    """Load one scenario (object) or several (list of objects) from a JSON file."""
+    with open(path) as f:
+        data = json.load(f)
+    scenarios = data if isinstance(data, list) else [data]
+    for i, scenario in enumerate(scenarios):
+        scenario.setdefault("name", f"{path}[{i}]")
+    return scenarios
+
+def to_builtin(value):
+    """Convert NumPy scalars/arrays to JSON-serializable Python values."""
+    if isinstance(value, dict):
+        return {key: to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtin(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def run_scenario(scenario, ticks=1, sampling="fixed"):
+    core = SimulationCore()
+    # Headless runs default to a powered receiver
+    core.model.set_power(True)
+    core.set_sampling(sampling)
+    core.configure(scenario)
+    result = core.run(ticks)
+    return {"name": scenario["name"], "metrics": to_builtin(result["metrics"])}
+
+def get_precision_scenarios():
+    """Every filter type (and capacitor solver) under each regulator (--check-precision default).
+
+    The op-amp gain is lowered to 10: the default active filter has no stable orbit (see PrecisionPolicy).
+    """
+    filters = [{"filter_type": "capacitive", "capacitor_solver": "euler"},
+               {"filter_type": "capacitive", "capacitor_solver": "analytic"},
+               {"filter_type": "inductive"},
+               {"filter_type": "active", "opamp_gain": 10}]
+    scenarios = []
+    for parameters in filters:
+        for regulator in ("none", "linear", "switching"):
+            name = "/".join(str(value) for value in parameters.values())
+            scenarios.append({"name": f"{name}/{regulator}", "model": dict(parameters, regulator_type=regulator)})
+    return scenarios
+
+def get_integration_scenarios():
+    """Every rectifier type with each filter, with and without leakage inductance (--check-integration default).
+
+    The op-amp gain is lowered to 10 so the fixed-step active filter has a stable orbit to compare against.
+    """
+    scenarios = []
+    for rectifier in ("half_wave", "full_wave", "bridge"):
+        for filter_type in ("capacitive", "inductive", "active"):
+            for inductance in (0.0, 1e-3):
+                scenarios.append({"name": f"{rectifier}/{filter_type}/L={inductance:g}",
+                                  "model": {"rectifier_type": rectifier, "filter_type": filter_type,
+                                            "coil_inductance": inductance, "opamp_gain": 10}})
+    return scenarios
+
+def get_grid_scenarios():
+    """Every filter type under each regulator on the default grid (--check-grid default).
+
+    The switching regulator's ripple aliases on the 1000-sample grid, so its scenarios start from 4000 samples.
+    """
+    scenarios = get_precision_scenarios()
+    for scenario in scenarios:
+        if scenario["model"]["regulator_type"] == "switching":
+            scenario["n_samples"] = 4000
+    return scenarios
+
+def check(compare, scenarios, ticks=1, seed=0):
+    """Print compare(scenario, ticks, seed) for each scenario; returns 1 if any bound is exceeded."""
+    status = 0
+    for scenario in scenarios:
+        print(scenario["name"])
+        for metric, (reference, value, error, bound) in compare(scenario, ticks, seed).items():
+            passed = error <= bound
+            status = status if passed else 1
+            print(f"  {metric:<16} {reference:>14.6g} {value:>14.6g} {error:9.1e} <= {bound:.0e} "
+                  f"{'ok' if passed else 'FAIL'}")
+    return status
+
+def check_precision(paths, ticks=1, seed=0):
+    """Print the float32/float64 metric comparison of each scenario (built-in set without paths)."""
+    scenarios = [scenario for path in paths for scenario in load_scenarios(path)] or get_precision_scenarios()
+    return check(compare_precision, scenarios, ticks, seed)
+
+def check_integration(paths, ticks=1, seed=0):
+    """Print the adaptive/fixed-step metric comparison of each scenario (built-in set without paths)."""
+    scenarios = [scenario for path in paths for scenario in load_scenarios(path)] or get_integration_scenarios()
+    return check(compare_integration, scenarios, ticks, seed)
+
+def check_grid(paths, ticks=1, seed=0):
+    """Print the metric comparison of each scenario on its grid and a twice as fine one (built-in set without paths)."""
+    scenarios = [scenario for path in paths for scenario in load_scenarios(path)] or get_grid_scenarios()
+    return check(compare_grid, scenarios, ticks, seed)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run AC/DC receiver scenarios without the GUI.")
+    parser.add_argument("scenarios", nargs="*", help="JSON scenario file(s)")
+    parser.add_argument("-o", "--output", help="Write metrics to this JSON file (default: stdout)")
+    parser.add_argument("--ticks", type=int, default=1, help="Simulation ticks per scenario (default: 1)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for noise and PFC distortion")
+    parser.add_argument("--kernels", choices=kernels.backends, default="auto",
+                        help="Numeric kernel backend: auto (JIT when Numba is installed), numpy or jit")
+    parser.add_argument("--precision", choices=precision.modes, default="float64",
+                        help="Working precision of waveforms and spectra (default: float64)")
+    parser.add_argument("--sampling", choices=("fixed", "auto"), default="fixed",
+                        help="fixed: the scenario's duration/n_samples grid; auto: plan the minimum coherent "
+                             "sample rate and record length per configuration (scenarios may set \"sampling\")")
+    parser.add_argument("--check-precision", action="store_true",
+                        help="Compare float32 against float64 metrics instead (every filter type and regulator "
+                             "when no scenario is given); exit status 1 if a bound is exceeded")
+    parser.add_argument("--check-integration", action="store_true",
+                        help="Compare adaptive against fixed-step metrics instead (every rectifier and filter type "
+                             "when no scenario is given); exit status 1 if a bound is exceeded")
+    parser.add_argument("--check-grid", action="store_true",
+                        help="Compare metrics on the scenario's grid and on twice as many samples over the same "
+                             "duration instead (every filter type and regulator when no scenario is given); exit "
+                             "status 1 if a bound is exceeded")
+    args = parser.parse_args(argv)
+    if not args.scenarios and not (args.check_precision or args.check_integration or args.check_grid):
+        parser.error("the following arguments are required: scenarios")
+
+    kernels.set_backend(args.kernels)
+    precision.set_mode(args.precision)
+    if args.check_precision:
+        return check_precision(args.scenarios, args.ticks, 0 if args.seed is None else args.seed)
+    if args.check_integration:
+        return check_integration(args.scenarios, args.ticks, 0 if args.seed is None else args.seed)
+    if args.check_grid:
+        return check_grid(args.scenarios, args.ticks, 0 if args.seed is None else args.seed)
+    if args.seed is not None:
+        np.random.seed(args.seed)
+
+    results = []
+    for path in args.scenarios:
+        for scenario in load_scenarios(path):
+            results.append(run_scenario(scenario, args.ticks, args.sampling))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,121 @@
+import math
+from fractions import Fraction
+import numpy as np
+from scipy import fft
+
+class SamplingPlanner:
+    """Minimum sample rate and coherent record length for a receiver configuration.
+
+    The tones of the configuration set the highest frequency of interest:
+    harmonics of the 60 Hz line from the rectifier, the carrier with its
+    harmonics and ±100 Hz modulation sidebands, and the odd harmonics of the
+    digital and switching square waves. The sample rate is oversampling times
+    that, and at least what keeps the fixed-step filter recurrence monotone
+    (dt / tau <= max_alpha). The record spans a whole number of periods of the
+    rational greatest common divisor of the tones (at least min_duration), so
+    every tone, integer or not, lies exactly on an FFT bin and no leakage
+    window is needed. The sample count is the next FFT-friendly length
+    reaching the sample rate. A plan whose tones still lie more than
+    max_bin_offset bins off the grid is rejected.
+    """
+
+    line_freq = 60  # Hz, AC input
+    modulating_freq = 100  # Hz, AM/FM modulating tone
+
+    def __init__(self, harmonics=10, oversampling=2.5, min_duration=0.1, resolution=1e-3,
+                 max_alpha=1.0, max_samples=2**22, max_bin_offset=0.01):
+        if oversampling <= 2:
+            raise ValueError(f"Oversampling must exceed the Nyquist factor 2, not {oversampling}")
+        if harmonics < 1 or resolution <= 0 or min_duration < 0:
+            raise ValueError("harmonics must be >= 1, resolution > 0 and min_duration >= 0")
+        self.harmonics = harmonics  # Harmonics of each tone to resolve (odd ones for square waves)
+        self.oversampling = oversampling  # Sample rate / highest tone
+        self.min_duration = min_duration  # s; 0.1 s keeps the settling half of transient analysis
+        self.resolution = resolution  # Hz; tones are taken as fractions with denominator up to 1 / resolution
+        self.max_alpha = max_alpha  # Largest dt / tau of the fixed-step filter recurrence
+        self.max_samples = max_samples
+        self.max_bin_offset = max_bin_offset  # Bins; largest accepted distance of a tone from its FFT bin
+
+    def get_tones(self, model, stage="modulated"):
+        """Frequencies (Hz) a record of the waveform stage must resolve; batch columns are pooled."""
+        if stage not in ("ac", "rectified", "modulated"):
+            raise ValueError(f"Unknown waveform stage: {stage}")
+        h = np.arange(1, self.harmonics + 1)
+        odd = h[h % 2 == 1]
+        if stage == "ac":
+            return np.array([float(self.line_freq)])
+        tones = [self.line_freq * h]  # Rectifier distortion of the line
+        if stage == "modulated":
+            if model.regulator_type == "switching" and model.switching_model != "averaged":
+                tones.append(np.multiply.outer(np.ravel(model.switching_freq), odd).ravel())
+            if model.signal_mode in ("digital", "mixed"):
+                tones.append(np.multiply.outer(np.ravel(model.digital_freq), odd).ravel())
+            if model.signal_mode != "digital":
+                carrier = np.ravel(model.frequency)
+                tones.append(np.multiply.outer(carrier, h).ravel())
+                tones.append(np.add.outer(carrier, [-self.modulating_freq, self.modulating_freq]).ravel())
+        tones = np.unique(np.abs(np.concatenate(tones).astype(float)))
+        return tones[tones > 0]
+
+    def get_common_frequency(self, tones):
+        """Largest frequency (Hz, a Fraction) of which every tone is a whole multiple: their rational GCD.
+
+        Each tone is taken as the nearest fraction with denominator at most 1 / resolution.
+        """
+        max_denominator = max(int(round(1 / self.resolution)), 1)
+        fractions = [Fraction(float(tone)).limit_denominator(max_denominator) for tone in tones]
+        fractions = [f for f in fractions if f > 0]
+        if not fractions:
+            return Fraction(1)
+        denominator = math.lcm(*[f.denominator for f in fractions])
+        return Fraction(math.gcd(*[int(f * denominator) for f in fractions]), denominator)
+
+    def get_max_dt(self, model):
+        """Longest time step (s) the fixed-step filter allows; inf when the filter is exact or adaptive."""
+        if model.integration == "adaptive":
+            return np.inf
+        if model.filter_type == "capacitive":
+            if model.capacitor_solver == "analytic" or np.all(np.asarray(model.filter_capacitance) <= 0):
+                return np.inf
+            tau = model.load_resistance * np.asarray(model.filter_capacitance)
+            tau = tau[tau > 0]
+        elif model.filter_type == "inductive":
+            tau = model.filter_inductance / (model.load_resistance + model.parasitic_resistance)
+        else:
+            # Op-amp loop: the linear region contracts while dt * gain / tau <= 1
+            tau = 1 / (2 * np.pi * np.asarray(model.active_filter_cutoff)) / model.opamp_gain
+        return self.max_alpha * float(np.min(tau))
+
+    def plan(self, model, stage="modulated"):
+        """Sample rate, record length and time step for the configuration of model."""
+        tones = self.get_tones(model, stage)
+        period = 1 / self.get_common_frequency(tones)  # s (exact); a whole number of periods of every tone
+        n_periods = max(1, math.ceil(self.min_duration / period - 1e-9))
+        duration = float(n_periods * period)
+        f_max = float(np.max(tones)) if len(tones) else self.line_freq
+        fs_min = max(self.oversampling * f_max, 1 / self.get_max_dt(model))
+        n_samples = fft.next_fast_len(int(np.ceil(fs_min * duration)))
+        if n_samples > self.max_samples:
+            raise ValueError(f"Planned record of {n_samples} samples exceeds max_samples ({self.max_samples}); "
+                             "lower harmonics or coarsen resolution")
+        bins = tones * duration
+        max_bin_offset = float(np.max(np.abs(bins - np.rint(bins)))) if len(bins) else 0.0
+        if max_bin_offset > self.max_bin_offset:
+            raise ValueError(f"Planned tones lie up to {max_bin_offset:.3g} bins off the FFT grid "
+                             f"(limit {self.max_bin_offset}); refine resolution")
+        return {
+            "fs": n_samples / duration,
+            "n_samples": n_samples,
+            "duration": duration,
+            "dt": duration / n_samples,
+            "bin_width": 1 / duration,
+            "f_max": f_max,
+            "tones": tones,
+            "max_bin_offset": max_bin_offset  # Bins off-grid
+        }
+
+    def apply(self, plan, model, time_base):
+        """Put model and time_base on a plan's grid (t excludes the endpoint, so the record repeats seamlessly)."""
+        model.dt = plan["dt"]
+        if not time_base.matches(plan["duration"], plan["n_samples"], endpoint=False):
+            time_base.set_grid(plan["duration"], plan["n_samples"], endpoint=False)
@@ -0,0 +1,317 @@
+import numpy as np
+from ReceiverModel import ReceiverModel
+from AdaptiveSolver import AdaptiveSolver
+from PowerFactorCorrection import PowerFactorCorrection
+from SNR_Analysis import SNRAnalyzer
+from THD_Analysis import THDAnalyzer, compute_thd_n
+from EMI_Analysis import EMIAnalyzer
+from StabilityModel import StabilityModel
+from ThermalModel import ComponentThermalModel
+from MagneticCoreModel import MagneticCoreModel
+from Precision import precision
+from TimeBase import TimeBase
+from SamplingPlanner import SamplingPlanner
+from TickOrchestrator import TickOrchestrator
+
+class SimulationCore:
+    """Qt-free simulation tick: receiver model plus all compute analyzers."""
+
+    # Largest relative change of a metric when the fixed grid is refined at the same duration (compare_grid);
+    # the dt-step recurrences converge to first order, so these bound discretization, not a wrong dt
+    grid_tolerances = {"ripple_voltage": 0.03, "power": 0.03, "efficiency": 0.03, "diode_temp": 0.01}
+
+    def __init__(self, model=None):
+        self.model = model if model is not None else ReceiverModel()
+        self.pfc = PowerFactorCorrection(self.model)
+        self.snr_analyzer = SNRAnalyzer(self.model)
+        self.thd_analyzer = THDAnalyzer(self.model)
+        self.emi_analyzer = EMIAnalyzer(self.model)
+        self.stability_model = StabilityModel(self.model)
+        self.thermal_model = ComponentThermalModel()
+        self.magnetic_core_model = MagneticCoreModel(self.model)
+        self.noise_level = 0.0
+        self.max_harmonics = 10
+        self.duration = 0.1  # s
+        self.n_samples = 1000
+        self.time_base = TimeBase(self.duration, self.n_samples)
+        self.model.time_base = self.time_base
+        self.sampling_planner = None  # SamplingPlanner choosing fs and record length per tick, or None for the fixed grid
+        # The waveforms are generated once per tick and shared by every analyzer, in this order
+        self.orchestrator = TickOrchestrator(self.simulate)
+        self.orchestrator.subscribe("harmonic", self.update_harmonic)
+        self.orchestrator.subscribe("snr", self.update_snr)
+        self.orchestrator.subscribe("thd", self.update_thd)
+        self.orchestrator.subscribe("emi", self.update_emi)
+        self.orchestrator.subscribe("pfc", self.update_pfc)
+        self.orchestrator.subscribe("thermal", self.update_thermal)
+        self.orchestrator.subscribe("magnetic", self.update_magnetic)
+
+    def configure(self, scenario):
+        """Apply a scenario dictionary to the model and analyzers."""
+        for name, value in scenario.items():
+            if name == "name":
+                continue
+            elif name == "model":
+                self.set_model_parameters(value)
+            elif name == "pfc":
+                self.pfc.set_pfc(value.get("enabled", True), value.get("type", "none"))
+            elif name == "emi_filter":
+                self.emi_analyzer.toggle_emi_filter(bool(value))
+            elif name == "noise_level":
+                self.noise_level = float(value)
+            elif name == "max_harmonics":
+                self.max_harmonics = int(value)
+            elif name == "duration":
+                self.duration = float(value)
+            elif name == "n_samples":
+                self.n_samples = int(value)
+            elif name == "sampling":
+                self.set_sampling(value)
+            elif name == "thermal":
+                for key, param in value.items():
+                    if not hasattr(self.thermal_model, key):
+                        raise ValueError(f"Unknown thermal parameter: {key}")
+                    setattr(self.thermal_model, key, param)
+                self.thermal_model.reset()
+            elif name == "magnetic":
+                if "core_material" in value:
+                    self.magnetic_core_model.set_core_material(value["core_material"])
+                if "h_field" in value:
+                    self.magnetic_core_model.set_magnetic_field(float(value["h_field"]))
+            else:
+                raise ValueError(f"Unknown scenario entry: {name}")
+
+    def set_model_parameters(self, params):
+        """Set ReceiverModel parameters, using the model's setters where available."""
+        for key, value in params.items():
+            if not hasattr(self.model, key):
+                raise ValueError(f"Unknown model parameter: {key}")
+            setter = getattr(self.model, f"set_{key}", None)
+            if setter is not None:
+                setter(value)
+            else:
+                setattr(self.model, key, value)
+
+    def set_sampling(self, sampling):
+        """"fixed" (duration/n_samples grid), "auto" (SamplingPlanner defaults) or a dict of SamplingPlanner options."""
+        if sampling == "fixed":
+            self.sampling_planner = None
+        elif sampling == "auto":
+            self.sampling_planner = SamplingPlanner()
+        elif isinstance(sampling, dict):
+            self.sampling_planner = SamplingPlanner(**sampling)
+        else:
+            raise ValueError(f"Unknown sampling: {sampling}")
+
+    def get_time_base(self):
+        """(t, fs) of the shared TimeBase, rebuilt when the scenario or the sampling plan changed the grid."""
+        if self.sampling_planner is not None:
+            # The planned grid also sets the model's time step
+            plan = self.sampling_planner.plan(self.model)
+            self.sampling_planner.apply(plan, self.model, self.time_base)
+            self.duration, self.n_samples = plan["duration"], plan["n_samples"]
+        else:
+            # Samples are duration / n_samples apart; this also undoes a planned dt after leaving auto sampling
+            self.model.dt = self.duration / self.n_samples
+            if not self.time_base.matches(self.duration, self.n_samples):
+                self.time_base.set_grid(self.duration, self.n_samples)
+        return self.time_base.t, self.time_base.fs
+
+    def simulate(self):
+        """Generate the tick's waveforms (PFC-corrected, with noise) once for all analyzers."""
+        t, fs = self.time_base.t, self.time_base.fs
+        ac_signal, rectified_signal, modulated_signal = self.model.generate_waveform(t)
+
+        # Simulate input current
+        input_current = self.time_base.sine(self.model.frequency, -np.pi / 6) * np.max(np.abs(ac_signal)) / 10
+
+        # Apply PFC
+        corrected_current = self.pfc.apply_pfc(t, ac_signal, input_current)
+        if self.pfc.pfc_enabled:
+            modulation_factor = np.abs(corrected_current) / (np.max(np.abs(input_current)) + 1e-6)
+            modulated_signal = precision.cast(modulated_signal * modulation_factor)
+
+        # Store clean signal for analysis
+        clean_signal = modulated_signal
+
+        # Add environmental noise
+        if self.noise_level > 0:
+            noise = np.random.normal(0, self.noise_level * np.std(modulated_signal), len(modulated_signal))
+            modulated_signal = precision.cast(modulated_signal + noise)
+
+        return {
+            "t": t,
+            "fs": fs,
+            "ac": ac_signal,
+            "rectified": rectified_signal,
+            "modulated": modulated_signal,
+            "clean": clean_signal,
+            "corrected_current": corrected_current
+        }
+
+    def update_harmonic(self, result):
+        thd_n, harmonic_indices, harmonic_amps = compute_thd_n(
+            result["clean"], result["fs"], self.model.frequency, self.max_harmonics)
+        result["thd_n"] = thd_n
+        result["harmonic_spectrum"] = (harmonic_indices, harmonic_amps)
+
+    def update_snr(self, result):
+        self.snr_analyzer.update(result["clean"], self.noise_level, result["fs"])
+        result["snr_spectrum"] = self.snr_analyzer.get_snr_spectrum()
+
+    def update_thd(self, result):
+        self.thd_analyzer.update(result["clean"], result["fs"])
+        result["harmonics"] = self.thd_analyzer.get_harmonics()
+
+    def update_emi(self, result):
+        self.emi_analyzer.update(result["t"], result["modulated"])
+        result["emi_spectrum"] = self.emi_analyzer.get_emi_spectrum()
+
+    def update_pfc(self, result):
+        result["efficiency"] = self.pfc.adjust_efficiency(self.model.efficiency) * 100
+        result["power_factor"] = self.pfc.get_power_factor()
+
+    def update_thermal(self, result):
+        self.thermal_model.update(result["rectified"], result["modulated"])
+
+    def update_magnetic(self, result):
+        self.magnetic_core_model.step()
+
+    def step(self):
+        """Run one simulation tick and return waveforms and metrics."""
+        t, fs = self.get_time_base()
+        if not self.model.power_on:
+            self.thermal_model.reset()
+            return {"t": t, "metrics": self.idle_metrics()}
+
+        result = self.orchestrator.tick()
+        modulated_signal = result["modulated"]
+
+        # Analyze waveform for metrics
+        analysis = self.model.analyze_waveform(modulated_signal, t)
+
+        spectrum = np.abs(np.fft.fft(modulated_signal))[:len(modulated_signal)//2]
+        spectrum_freqs = self.time_base.fft_freqs
+
+        harmonics = result["harmonics"]
+        metrics = {
+            "ripple_voltage": analysis.get("ripple_voltage", 0),
+            "avg_voltage": analysis.get("avg_voltage", 0),
+            "phase": analysis.get("phase", 0),
+            "power": analysis.get("power", 0),
+            "thd_n": result["thd_n"],
+            "thd": self.thd_analyzer.get_thd(),
+            "h2": harmonics[0],
+            "h3": harmonics[1],
+            "snr": self.snr_analyzer.get_snr(),
+            "noise_floor": self.snr_analyzer.get_noise_floor(),
+            "emi_conducted": self.emi_analyzer.get_conducted_emi(),
+            "emi_radiated": self.emi_analyzer.get_radiated_emi(),
+            "temperature": self.model.temperature,
+            "efficiency": result["efficiency"],
+            "power_factor": result["power_factor"]
+        }
+        metrics.update(self.thermal_model.get_metrics())
+        metrics.update(self.magnetic_core_model.get_metrics())
+        metrics.update(self.stability_model.compute_metrics())
+
+        return {
+            "t": t,
+            "ac": result["ac"],
+            "rectified": result["rectified"],
+            "modulated": modulated_signal,
+            "clean": result["clean"],
+            "corrected_current": result["corrected_current"],
+            "spectrum": (spectrum_freqs, spectrum),
+            "snr_spectrum": result["snr_spectrum"],
+            "harmonics": harmonics,
+            "harmonic_spectrum": result["harmonic_spectrum"],
+            "emi_spectrum": result["emi_spectrum"],
+            "metrics": metrics
+        }
+
+    def idle_metrics(self):
+        """Metrics reported while the receiver is powered off."""
+        return {
+            "ripple_voltage": 0.0, "avg_voltage": 0.0, "phase": 0.0, "power": 0.0,
+            "thd_n": 0.0, "thd": 0.0, "h2": 0.0, "h3": 0.0,
+            "snr": 0.0, "noise_floor": 0.0,
+            "emi_conducted": 0.0, "emi_radiated": 0.0,
+            "temperature": 25.0, "efficiency": 100.0, "power_factor": 1.0
+        }
+
+    def run(self, ticks=1):
+        """Run several ticks and return the result of the last one."""
+        result = None
+        for _ in range(max(int(ticks), 1)):
+            result = self.step()
+        return result
+
+def compare_integration(scenario=None, ticks=1, seed=0):
+    """Run a scenario with fixed-step and adaptive integration and compare the metrics bounded by AdaptiveSolver.tolerances.
+
+    Returns metric -> (fixed value, adaptive value, error, bound), where error
+    is relative to max(|fixed value|, 1). Both runs draw the same noise. The
+    scenario must have a stable fixed-step orbit (see PrecisionPolicy).
+    """
+    metrics = {}
+    for name in ("fixed", "adaptive"):
+        np.random.seed(seed)
+        core = SimulationCore()
+        core.model.set_power(True)
+        core.configure(scenario or {})
+        core.model.integration = name
+        metrics[name] = core.run(ticks)["metrics"]
+    comparison = {}
+    for metric, bound in AdaptiveSolver.tolerances.items():
+        reference, adaptive = float(metrics["fixed"][metric]), float(metrics["adaptive"][metric])
+        comparison[metric] = (reference, adaptive, abs(adaptive - reference) / max(abs(reference), 1.0), bound)
+    return comparison
+
+def compare_grid(scenario=None, ticks=1, seed=0, refinement=2):
+    """Run a scenario on its fixed grid and on refinement times as many samples over the same duration.
+
+    Returns metric -> (scenario grid value, refined grid value, error, bound)
+    for the metrics bounded by SimulationCore.grid_tolerances, where error is
+    relative to max(|scenario grid value|, 1). Both runs draw the same noise.
+    """
+    metrics = []
+    n_samples = None
+    for _ in range(2):
+        np.random.seed(seed)
+        core = SimulationCore()
+        core.model.set_power(True)
+        core.configure(scenario or {})
+        if n_samples is not None:
+            core.configure({"n_samples": n_samples * refinement})
+        n_samples = core.n_samples
+        metrics.append(core.run(ticks)["metrics"])
+    comparison = {}
+    for metric, bound in SimulationCore.grid_tolerances.items():
+        reference, refined = float(metrics[0][metric]), float(metrics[1][metric])
+        comparison[metric] = (reference, refined, abs(refined - reference) / max(abs(reference), 1.0), bound)
+    return comparison
+
+def compare_precision(scenario=None, ticks=1, seed=0):
+    """Run a scenario in float64 and in float32 and compare the metrics bounded by PrecisionPolicy.tolerances.
+
+    Returns metric -> (float64 value, float32 value, error, bound), where error
+    is relative to max(|float64 value|, 1). Both runs draw the same noise.
+    """
+    metrics = {}
+    mode = precision.mode
+    try:
+        for name in ("float64", "float32"):
+            precision.set_mode(name)
+            np.random.seed(seed)
+            core = SimulationCore()
+            core.model.set_power(True)
+            core.configure(scenario or {})
+            metrics[name] = core.run(ticks)["metrics"]
+    finally:
+        precision.set_mode(mode)
+    comparison = {}
+    for metric, bound in precision.tolerances.items():
+        reference, single = float(metrics["float64"][metric]), float(metrics["float32"][metric])
+        comparison[metric] = (reference, single, abs(single - reference) / max(abs(reference), 1.0), bound)
+    return comparison
\ No newline at end of file
@@ -0,0 +1,170 @@
+import threading
+import time
+from types import MappingProxyType
+import numpy as np
+from SimulationCore import SimulationCore
+
+def freeze(value):
+    """Read-only copy of a tick result: arrays copied and write-protected, dicts made read-only mappings."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        value = value.copy()
+        value.flags.writeable = False
+    return value
+
+class SnapshotBuffer:
+    """Double buffer between a producer thread and a consumer: the snapshot being shown, and the newest one.
+
+    publish() replaces the pending snapshot (a snapshot never taken is dropped
+    as stale); take() hands the pending one to the consumer, which keeps it as
+    the front snapshot until it takes the next.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.front = None  # Snapshot the consumer took last
+        self.back = None  # Newest published snapshot not yet taken
+        self.published = 0
+        self.dropped = 0
+
+    def publish(self, snapshot):
+        with self.lock:
+            if self.back is not None:
+                self.dropped += 1
+            self.back = snapshot
+            self.published += 1
+
+    def take(self):
+        """Newest snapshot not taken yet, or None when nothing new was published."""
+        with self.lock:
+            snapshot, self.back = self.back, None
+            if snapshot is not None:
+                self.front = snapshot
+            return snapshot
+
+    def get_stats(self):
+        with self.lock:
+            return {"published": self.published, "dropped": self.dropped, "pending": self.back is not None}
+
+class SimulationWorker:
+    """SimulationCore ticks on a background thread, published as frozen snapshots through a SnapshotBuffer.
+
+    The worker owns its model: the GUI thread only submits settings (a
+    ReceiverConfig plus SimulationCore scenario entries), and the first tick
+    after a submit applies them before stepping. Snapshots hold the tick result, the
+    stability response, the model state after the tick and the settings
+    generation they were computed from.
+
+    Once the receiver state stops changing between ticks (within
+    settle_tolerance) and no new settings arrive, the worker is settled and
+    sleeps until the next submit() or request_tick() instead of ticking
+    every interval.
+    """
+
+    def __init__(self, core=None, interval=0.05, on_publish=None, settle_tolerance=1e-6):
+        self.core = SimulationCore() if core is None else core
+        self.buffer = SnapshotBuffer()
+        self.interval = interval  # s between tick starts
+        self.on_publish = on_publish  # Called (from the worker thread) after each snapshot is published
+        self.settle_tolerance = settle_tolerance  # Relative change of the receiver state counted as settled
+        self.lock = threading.Lock()
+        self.settings = None
+        self.generation = 0  # Number of submitted settings
+        self.stop_event = threading.Event()
+        self.wake_event = threading.Event()  # Set by submit() or request_tick() to end an idle wait
+        self.settled = False
+        self.last_generation = None  # Settings generation of the last tick
+        self.thread = None
+        self.error = None  # Last exception raised by a tick
+        self.stability_key = None
+        self.stability_response = None
+        self.tick_time = 0.0  # s, last tick
+
+    def submit(self, config, **options):
+        """Settings for the next tick; options are SimulationCore scenario entries (pfc, noise_level, ...)."""
+        with self.lock:
+            self.settings = (config, options)
+            self.generation += 1
+        self.wake_event.set()
+
+    def request_tick(self):
+        """One more tick with the current settings, also when settled (for views still settling on its results)."""
+        self.wake_event.set()
+
+    def get_stability_response(self):
+        """Bode/Nyquist/root-locus data, recomputed only when the loop transfer function changes."""
+        system = self.core.stability_model.get_system()
+        key = (tuple(np.ravel(system.num)), tuple(np.ravel(system.den)))
+        if key != self.stability_key:
+            try:
+                response = self.core.stability_model.compute_response()
+            except Exception as e:
+                print(f"Root locus calculation failed: {e}")
+                response = self.core.stability_model.compute_response(root_locus=False)
+            self.stability_response = freeze(response)  # Frozen once; later snapshots share it
+            self.stability_key = key
+        return self.stability_response
+
+    def is_settled(self, before, after):
+        """True when no receiver state field moved by more than settle_tolerance (relative) over a tick."""
+        for name in before.__slots__:
+            a, b = getattr(before, name), getattr(after, name)
+            if abs(b - a) > self.settle_tolerance * max(abs(a), 1.0):
+                return False
+        return True
+
+    def step(self):
+        """Apply the latest settings, run one tick and publish its snapshot (also usable without the thread)."""
+        start = time.perf_counter()
+        with self.lock:
+            settings, generation = self.settings, self.generation
+        if settings is not None and generation != self.last_generation:
+            # New settings only; re-applying unchanged ones would reset analyzer state every tick
+            config, options = settings
+            self.core.model.set_config(config)
+            self.core.configure(options)
+        before = self.core.model.get_state()
+        result = self.core.step()
+        if self.core.model.power_on:
+            result["stability"] = self.get_stability_response()
+        result["state"] = self.core.model.get_state()
+        result["generation"] = generation
+        snapshot = freeze(result)
+        self.settled = generation == self.last_generation and self.is_settled(before, result["state"])
+        self.last_generation = generation
+        self.tick_time = time.perf_counter() - start
+        self.buffer.publish(snapshot)
+        if self.on_publish is not None:
+            self.on_publish()
+        return snapshot
+
+    def run(self):
+        while not self.stop_event.is_set():
+            start = time.perf_counter()
+            self.wake_event.clear()
+            try:
+                self.step()
+            except Exception as e:  # Keep the thread alive; a bad setting should not end the simulation
+                self.error = e
+                self.settled = True  # Wait for new settings instead of retrying the failing tick
+                print(f"Simulation tick failed: {e}")
+            if self.settled:
+                self.wake_event.wait()  # Idle until new settings, a tick request (or stop) arrive
+            # Requested ticks keep the interval pacing too
+            self.stop_event.wait(max(self.interval - (time.perf_counter() - start), 0.0))
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, name="SimulationWorker", daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout=1.0):
+        self.stop_event.set()
+        self.wake_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
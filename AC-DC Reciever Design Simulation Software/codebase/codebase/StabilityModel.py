@@ -0,0 +1,93 @@
+import numpy as np
+from scipy import signal
+
+try:
+    import control
+    from control import TransferFunction as ControlTF
+except ImportError:  # python-control is only needed for the root locus
+    control = None
+
+class StabilityModel:
+    def __init__(self, model):
+        self.model = model
+
+    def get_system(self):
+        """Return the transfer function of the system based on filter and regulator."""
+        # Ensure non-zero and stable parameters
+        R = max(self.model.load_resistance + self.model.parasitic_resistance, 1e-6)
+        C = max(self.model.filter_capacitance, 1e-9)
+        L = max(self.model.filter_inductance, 1e-6)
+        cutoff = max(self.model.active_filter_cutoff, 1.0)
+        opamp_gain = min(self.model.opamp_gain, 1e6)  # Cap opamp gain to avoid instability
+
+        if self.model.filter_type == "capacitive":
+            # RC low-pass filter
+            num = [1]
+            den = [R * C, 1]
+        elif self.model.filter_type == "inductive":
+            # RL low-pass filter
+            num = [1]
+            den = [L / R, 1]
+        else:  # active
+            # First-order active low-pass filter
+            tau = 1 / (2 * np.pi * cutoff)
+            num = [opamp_gain]
+            den = [tau, 1]
+            # Include regulator effect if active
+            if self.model.regulator_type == "linear":
+                vref = max(self.model.linear_vref, 1e-3)
+                num = [opamp_gain * vref]
+            elif self.model.regulator_type == "switching":
+                # Simplified buck converter model (average)
+                input_v = max(self.model.input_voltage * self.model.turns_ratio * np.sqrt(2), 1e-3)
+                duty_cycle = min(self.model.linear_vref / input_v, 1)
+                num = [opamp_gain * duty_cycle]
+        # Ensure non-zero coefficients
+        num = [max(n, 1e-6) for n in num]
+        den = [max(d, 1e-6) for d in den]
+        return signal.TransferFunction(num, den)
+
+    def compute_response(self, w=None, root_locus=True):
+        """Compute Bode, Nyquist and root locus data for the current system."""
+        system = self.get_system()
+        if w is None:
+            w = np.logspace(0, 5, 1000)  # Frequency range: 1 Hz to 100 kHz
+
+        # Bode Plot
+        w, mag, phase = signal.bode(system, w)
+
+        # Nyquist Plot
+        w, H = signal.freqresp(system, w)
+
+        # Root Locus
+        poles = None
+        if root_locus and control is not None:
+            # Convert scipy.signal.TransferFunction to control.TransferFunction
+            control_system = ControlTF(system.num, system.den)
+            rl_map = control.root_locus_map(control_system, gains=np.linspace(0, 100, 1000))
+            poles = rl_map.poles
+
+        return {
+            "w": w,
+            "magnitude": mag,
+            "phase": phase,
+            "real": H.real,
+            "imag": H.imag,
+            "root_locus": poles
+        }
+
+    def compute_metrics(self):
+        """Summarize the loop response as scalar stability metrics."""
+        system = self.get_system()
+        w = np.logspace(0, 5, 1000)
+        w, mag, phase = signal.bode(system, w)
+        dc_gain = mag[0]
+        below = np.where(mag <= dc_gain - 3)[0]
+        bandwidth = w[below[0]] if len(below) > 0 else w[-1]
+        poles = np.roots(system.den)
+        return {
+            "dc_gain_db": dc_gain,
+            "bandwidth": bandwidth,
+            "phase_at_bandwidth": np.interp(bandwidth, w, phase),
+            "stable": bool(np.all(poles.real < 0))
+        }
\ No newline at end of file
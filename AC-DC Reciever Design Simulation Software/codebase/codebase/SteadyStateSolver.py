@@ -0,0 +1,79 @@
+import numpy as np
+
+class SteadyStateSolver:
+    """Periodic steady state of the rectifier/filter/regulator chain by the shooting method.
+
+    The only state that settles is the filter output, and the rectified input
+    repeats every line cycle, so the steady state is the fixed point v = P(v) of
+    the map P taking the filter state at t = 0 to the state one period later.
+    P(v) - v = 0 is solved with secant (finite-difference Newton) iterations,
+    which are exact after one step for the linear RC/RL filters.
+    """
+
+    def __init__(self, model, tol=1e-9, max_iter=30, max_line_cycles=100):
+        self.model = model
+        self.tol = tol  # Relative tolerance on the periodicity error P(v) - v
+        self.max_iter = max_iter
+        self.max_line_cycles = max_line_cycles  # Longest period searched for a whole number of steps
+        self.converged = False  # Per-configuration flags for batches
+        self.iterations = 0
+        self.residual = np.inf  # Largest |P(v) - v| of the last solve (V)
+
+    def get_period(self):
+        """Smallest whole number of line cycles spanning a whole number of time steps: (samples, cycles)."""
+        samples_per_cycle = 1 / (60 * self.model.dt)
+        for cycles in range(1, self.max_line_cycles + 1):
+            samples = samples_per_cycle * cycles
+            if abs(samples - round(samples)) < 1e-6:
+                return int(round(samples)), cycles
+        # No exact period within the search; the nearest one-cycle record is approximately periodic
+        return max(int(round(samples_per_cycle)), 1), 1
+
+    def period_map(self, v0, rectified):
+        """Filter state after one period of rectified input, starting from v0."""
+        return self.model.last_sample(self.model.apply_filter(rectified, v0))
+
+    def solve(self):
+        """Filter state at t = 0 that repeats after one period."""
+        m = self.model
+        n, _ = self.get_period()
+        t = np.arange(n) * m.dt
+        _, rectified = m.front_end(t, continuous=True)
+        v_prev = 0.0
+        f_prev = self.period_map(v_prev, rectified) - v_prev
+        v = v_prev + f_prev  # First step: one period from rest
+        # Unstable fixed-step filters diverge; their rows are reported as not converged
+        with np.errstate(over="ignore", invalid="ignore"):
+            for self.iterations in range(1, self.max_iter + 1):
+                f = self.period_map(v, rectified) - v
+                self.residual = float(np.max(np.abs(f)))
+                self.converged = np.abs(f) <= self.tol * (1 + np.abs(v))
+                if np.all(self.converged):
+                    break
+                slope = f - f_prev
+                flat = slope == 0
+                # Secant step on P(v) - v; fall back to a plain period step where it is flat
+                v_next = np.where(flat, v + f, v - f * (v - v_prev) / np.where(flat, 1, slope))
+                if m.filter_type == "capacitive":
+                    v_next = np.maximum(v_next, 0)  # The capacitor cannot hold a negative voltage
+                # Converged configurations of a batch stay put while the others iterate
+                v_prev, f_prev, v = v, f, np.where(self.converged, v, v_next)
+        return v
+
+    def simulate(self, n_periods=1):
+        """Steady-state waveforms over n_periods periods; model thermal state is left unchanged."""
+        m = self.model
+        n, _ = self.get_period()
+        t = np.arange(n * n_periods) * m.dt
+        ac_voltage, rectified = m.front_end(t, continuous=True)
+        filtered = m.apply_filter(rectified, self.solve())
+        regulated = m.regulate(filtered, t)
+        modulated = m.modulate(regulated, t)
+        return {
+            "t": t,
+            "ac": ac_voltage,
+            "rectified": rectified,
+            "filtered": filtered,
+            "regulated": regulated,
+            "modulated": modulated
+        }
@@ -1,74 +1,136 @@
-import numpy as np
-
-class THDAnalyzer:
-    def __init__(self, model):
-        self.model = model
-        self.thd = 0.0
-        self.harmonics = np.zeros(9)  # H2 to H10
-        self.thd_freq = []
-        self.freq_bands = np.linspace(100, 10000, 20)  # 100 Hz to 10 kHz
-
-    def compute_thd(self, signal, fs):
-        """Compute THD and individual harmonics."""
-        if len(signal) == 0:
-            self.thd = 0.0
-            self.harmonics = np.zeros(9)
-            return
-        fft = np.fft.fft(signal)
-        freqs = np.fft.fftfreq(len(signal), 1/fs)
-        fft_magnitude = np.abs(fft)[:len(fft)//2]
-        freqs = freqs[:len(fft)//2]
-        fundamental_idx = np.argmin(np.abs(freqs - self.model.frequency))
-        fundamental_power = fft_magnitude[fundamental_idx] ** 2
-        harmonic_power = 0
-        harmonics = []
-        for harmonic in range(2, 11):
-            harmonic_freq = self.model.frequency * harmonic
-            harmonic_idx = np.argmin(np.abs(freqs - harmonic_freq))
-            h_power = fft_magnitude[harmonic_idx] ** 2
-            harmonic_power += h_power
-            harmonics.append(fft_magnitude[harmonic_idx] / (fft_magnitude[fundamental_idx] + 1e-6) * 100)
-        self.harmonics = np.array(harmonics)
-        if fundamental_power == 0:
-            self.thd = 0.0
-        else:
-            self.thd = np.sqrt(harmonic_power / fundamental_power) * 100
-            self.thd = min(self.thd, 100.0)
-
-    def compute_thd_freq(self, signal, fs):
-        """Compute THD across frequency bands."""
-        if len(signal) == 0:
-            self.thd_freq = np.zeros(len(self.freq_bands))
-            return
-        fft = np.fft.fft(signal)
-        fft_magnitude = np.abs(fft)[:len(fft)//2]
-        freqs = np.fft.fftfreq(len(signal), 1/fs)[:len(fft)//2]
-        thd_freq = []
-        for f in self.freq_bands:
-            fundamental_idx = np.argmin(np.abs(freqs - f))
-            fundamental_power = fft_magnitude[fundamental_idx] ** 2
-            harmonic_power = 0
-            for harmonic in range(2, 11):
-                harmonic_freq = f * harmonic
-                harmonic_idx = np.argmin(np.abs(freqs - harmonic_freq))
-                harmonic_power += fft_magnitude[harmonic_idx] ** 2
-            thd = 0.0 if fundamental_power == 0 else np.sqrt(harmonic_power / fundamental_power) * 100
-            thd_freq.append(min(thd, 100.0))
-        self.thd_freq = np.array(thd_freq)
-
-    def update(self, signal, fs):
-        """Update THD, harmonics, and THD vs. frequency."""
-        self.compute_thd(signal, fs)
-        self.compute_thd_freq(signal, fs)
-
-    def get_thd(self):
-        """Return overall THD."""
-        return self.thd
-
-    def get_harmonics(self):
-        """Return individual harmonic amplitudes."""
-        return self.harmonics
-
-    def get_thd_freq(self):
-        """Return THD vs. frequency data."""
+import numpy as np
+from scipy import fft
+from Precision import precision
+from BufferArena import BufferArena
+
+def compute_thd_n(signal, fs, fundamental_freq, max_harmonics=10):
+    """Compute THD+N and the harmonic amplitudes H1..Hmax of a signal."""
+    signal = precision.cast(signal)
+    N = len(signal)
+    fft_vals = fft.fft(signal)
+    freqs = fft.fftfreq(N, 1 / fs)
+    fft_vals = fft_vals[:N//2]
+    freqs = freqs[:N//2]
+    amplitudes = np.abs(fft_vals) / N
+
+    # Find fundamental frequency
+    fundamental_idx = np.argmin(np.abs(freqs - fundamental_freq))
+    fundamental_amp = amplitudes[fundamental_idx] if fundamental_idx < len(amplitudes) else 0
+
+    # Compute harmonics
+    harmonic_indices = []
+    harmonic_amps = []
+    for n in range(1, max_harmonics + 1):
+        harmonic_freq = fundamental_freq * n
+        idx = np.argmin(np.abs(freqs - harmonic_freq))
+        if idx < len(amplitudes):
+            harmonic_indices.append(n)
+            harmonic_amps.append(amplitudes[idx])
+
+    # Estimate noise (non-harmonic components)
+    harmonic_mask = np.zeros(len(amplitudes), dtype=bool)
+    for n in range(1, max_harmonics + 1):
+        idx = np.argmin(np.abs(freqs - fundamental_freq * n))
+        if idx < len(amplitudes):
+            harmonic_mask[idx] = True
+    noise_amps = amplitudes[~harmonic_mask]
+    noise_power = np.sum(noise_amps ** 2)
+
+    # Calculate THD+N
+    if fundamental_amp > 1e-6:
+        harmonic_power = sum(amp ** 2 for amp in harmonic_amps[1:])  # Exclude fundamental
+        total_distortion_power = harmonic_power + noise_power
+        thd_n = 100 * np.sqrt(total_distortion_power) / fundamental_amp
+    else:
+        thd_n = 0.0
+    return thd_n, harmonic_indices, harmonic_amps
+
+class THDAnalyzer:
+    max_bin_sets = 256  # Cached harmonic bin sets before the cache is cleared (the frequency dial moves continuously)
+
+    def __init__(self, model):
+        self.model = model
+        self.thd = 0.0
+        self.harmonics = np.zeros(9)  # H2 to H10
+        self.thd_freq = []
+        self.freq_bands = np.linspace(100, 10000, 20)  # 100 Hz to 10 kHz
+        self.arena = BufferArena()
+        self.freqs = {}  # (n, fs) -> positive FFT bin frequencies
+        self.bins = {}  # (n, fs, fundamental) -> bins nearest to H1..H10
+
+    def get_spectrum(self, signal, fs):
+        """Magnitudes and frequencies of the positive-frequency half of the FFT of signal."""
+        n = len(signal)
+        fft = np.fft.fft(precision.cast(signal))
+        magnitude = self.arena.get("magnitude", n // 2, fft.real.dtype)
+        np.abs(fft[:n//2], out=magnitude)
+        if (n, fs) not in self.freqs:
+            self.freqs[(n, fs)] = np.fft.fftfreq(n, 1/fs)[:n//2]
+        return magnitude, self.freqs[(n, fs)]
+
+    def get_harmonic_bins(self, freqs, fs, fundamental):
+        """Indices of the bins nearest to each harmonic 1..10 of fundamental."""
+        key = (len(freqs), fs, fundamental)
+        if key not in self.bins:
+            if len(self.bins) >= self.max_bin_sets:
+                self.bins.clear()
+            self.bins[key] = [int(np.argmin(np.abs(freqs - fundamental * harmonic))) for harmonic in range(1, 11)]
+        return self.bins[key]
+
+    def compute_thd(self, signal, fs, spectrum=None):
+        """Compute THD and individual harmonics (spectrum: get_spectrum result to reuse)."""
+        if len(signal) == 0:
+            self.thd = 0.0
+            self.harmonics = np.zeros(9)
+            return
+        fft_magnitude, freqs = self.get_spectrum(signal, fs) if spectrum is None else spectrum
+        bins = self.get_harmonic_bins(freqs, fs, self.model.frequency)
+        fundamental_idx = bins[0]
+        fundamental_power = fft_magnitude[fundamental_idx] ** 2
+        harmonic_power = 0
+        harmonics = []
+        for harmonic_idx in bins[1:]:
+            h_power = fft_magnitude[harmonic_idx] ** 2
+            harmonic_power += h_power
+            harmonics.append(fft_magnitude[harmonic_idx] / (fft_magnitude[fundamental_idx] + 1e-6) * 100)
+        self.harmonics = np.array(harmonics)
+        if fundamental_power == 0:
+            self.thd = 0.0
+        else:
+            self.thd = np.sqrt(harmonic_power / fundamental_power) * 100
+            self.thd = min(self.thd, 100.0)
+
+    def compute_thd_freq(self, signal, fs, spectrum=None):
+        """Compute THD across frequency bands (spectrum: get_spectrum result to reuse)."""
+        if len(signal) == 0:
+            self.thd_freq = np.zeros(len(self.freq_bands))
+            return
+        fft_magnitude, freqs = self.get_spectrum(signal, fs) if spectrum is None else spectrum
+        thd_freq = []
+        for f in self.freq_bands:
+            bins = self.get_harmonic_bins(freqs, fs, f)
+            fundamental_power = fft_magnitude[bins[0]] ** 2
+            harmonic_power = 0
+            for harmonic_idx in bins[1:]:
+                harmonic_power += fft_magnitude[harmonic_idx] ** 2
+            thd = 0.0 if fundamental_power == 0 else np.sqrt(harmonic_power / fundamental_power) * 100
+            thd_freq.append(min(thd, 100.0))
+        self.thd_freq = np.array(thd_freq)
+
+    def update(self, signal, fs):
+        """Update THD, harmonics, and THD vs. frequency from one FFT of the signal."""
+        spectrum = self.get_spectrum(signal, fs) if len(signal) else None
+        self.compute_thd(signal, fs, spectrum)
+        self.compute_thd_freq(signal, fs, spectrum)
+
+    def get_thd(self):
+        """Return overall THD."""
+        return self.thd
+
+    def get_harmonics(self):
+        """Return individual harmonic amplitudes."""
+        return self.harmonics
+
+    def get_thd_freq(self):
+        """Return THD vs. frequency data."""
         return self.freq_bands, self.thd_freq
\ No newline at end of file
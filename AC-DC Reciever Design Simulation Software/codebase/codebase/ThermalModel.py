@@ -0,0 +1,75 @@
+import numpy as np
+from Kernels import kernels
+from BufferArena import BufferArena
+from Precision import precision
+
+class ComponentThermalModel:
+    def __init__(self, n_samples=1000):
+        self.n_samples = n_samples  # Match ReceiverModel's 0.1s waveform
+        self.arena = BufferArena()  # Power and temperature traces, reused every window
+        self.init_thermal_model()
+        self.reset()
+
+    def init_thermal_model(self):
+        # Thermal parameters (default values)
+        self.ambient_temp = 25.0  # °C
+        self.thermal_resistance_diode = 2.0  # °C/W
+        self.thermal_resistance_mosfet = 1.5  # °C/W
+        self.thermal_capacitance_diode = 0.1  # J/°C
+        self.thermal_capacitance_mosfet = 0.08  # J/°C
+        self.thermal_coupling = 0.2  # Thermal coupling factor between diode and MOSFET
+
+    def reset(self):
+        """Reset junction temperatures and traces to ambient."""
+        self.diode_temp = self.ambient_temp
+        self.mosfet_temp = self.ambient_temp
+        self.system_temp = self.ambient_temp
+        dtype = precision.get_dtype()
+        self.diode_power_data = self.arena.get("diode_power", self.n_samples, dtype, fill=0)
+        self.mosfet_power_data = self.arena.get("mosfet_power", self.n_samples, dtype, fill=0)
+        self.diode_temp_data = self.arena.get("diode_temp", self.n_samples, dtype, fill=self.ambient_temp)
+        self.mosfet_temp_data = self.arena.get("mosfet_temp", self.n_samples, dtype, fill=self.ambient_temp)
+        self.system_temp_data = self.arena.get("system_temp", self.n_samples, dtype, fill=self.ambient_temp)
+
+    def update(self, rectified_signal, modulated_signal):
+        """Advance junction temperatures over one waveform window."""
+        self.n_samples = n = len(rectified_signal)
+        dtype = precision.get_dtype()
+
+        # Simulate component currents and voltages
+        # Diode: Assume it conducts during rectification, use rectified signal
+        diode_voltage_drop = 0.7  # V (typical for a diode)
+        self.diode_power_data = diode_power = self.arena.get("diode_power", n, dtype)
+        np.divide(rectified_signal, 100.0, out=diode_power)
+        np.maximum(diode_power, 0, out=diode_power)  # Simplified current (A)
+        diode_power *= diode_voltage_drop  # Power dissipation (W)
+
+        # MOSFET: Assume it switches in the regulator, use modulated signal
+        mosfet_rds_on = 0.1  # Ω (on-resistance)
+        self.mosfet_power_data = mosfet_power = self.arena.get("mosfet_power", n, dtype)
+        np.divide(modulated_signal, 50.0, out=mosfet_power)
+        np.abs(mosfet_power, out=mosfet_power)  # Simplified current (A)
+        np.square(mosfet_power, out=mosfet_power)
+        mosfet_power *= mosfet_rds_on  # Power dissipation (W)
+
+        # Update temperatures using RC thermal model (the recurrence accumulates in float64)
+        delta_t = 0.05  # Update interval (50ms)
+        traces = tuple(self.arena.get(name, n) for name in ("diode_temp", "mosfet_temp", "system_temp"))
+        kernels.get("thermal_rc")(
+            np.asarray(self.diode_power_data, dtype=np.float64), np.asarray(self.mosfet_power_data, dtype=np.float64),
+            float(self.diode_temp), float(self.mosfet_temp),
+            float(self.ambient_temp), float(self.thermal_resistance_diode), float(self.thermal_resistance_mosfet),
+            float(self.thermal_capacitance_diode), float(self.thermal_capacitance_mosfet),
+            float(self.thermal_coupling), delta_t, *traces)
+        if self.n_samples:
+            # Carried temperatures come from the full-precision traces
+            self.diode_temp, self.mosfet_temp, self.system_temp = (float(trace[-1]) for trace in traces)
+        self.diode_temp_data, self.mosfet_temp_data, self.system_temp_data = (precision.cast(trace) for trace in traces)
+
+    def get_metrics(self):
+        """Return the current junction temperatures."""
+        return {
+            "diode_temp": self.diode_temp,
+            "mosfet_temp": self.mosfet_temp,
+            "system_temp": self.system_temp
+        }
\ No newline at end of file
@@ -0,0 +1,58 @@
+import time
+
+class TickOrchestrator:
+    """One simulation per tick, fanned out to every subscribed analyzer.
+
+    simulate() produces the tick result (a dict of waveform arrays); each
+    subscriber callback receives that same dict, in subscription order, and
+    may add its own outputs to it for later subscribers and the caller.
+    Subscribers must not modify the arrays in place. Without a simulate
+    callable, results produced elsewhere (e.g. worker snapshots) are fanned
+    out with publish(). Per-subscriber call counts and timings are kept.
+    """
+
+    def __init__(self, simulate=None):
+        self.simulate = simulate
+        self.subscribers = {}  # Name -> callback(result)
+        self.stats = {}  # Name -> call count and times (s)
+        self.ticks = 0
+
+    def subscribe(self, name, callback):
+        if name in self.subscribers:
+            raise ValueError(f"Subscriber already registered: {name}")
+        self.subscribers[name] = callback
+        self.stats[name] = {"calls": 0, "total_time": 0.0, "last_time": 0.0, "max_time": 0.0}
+
+    def unsubscribe(self, name):
+        self.subscribers.pop(name, None)
+        self.stats.pop(name, None)
+
+    def record(self, name, elapsed):
+        stats = self.stats.setdefault(name, {"calls": 0, "total_time": 0.0, "last_time": 0.0, "max_time": 0.0})
+        stats["calls"] += 1
+        stats["total_time"] += elapsed
+        stats["last_time"] = elapsed
+        stats["max_time"] = max(stats["max_time"], elapsed)
+
+    def publish(self, result):
+        """Hand one tick result to every subscriber."""
+        for name, callback in list(self.subscribers.items()):
+            start = time.perf_counter()
+            callback(result)
+            self.record(name, time.perf_counter() - start)
+        self.ticks += 1
+        return result
+
+    def tick(self):
+        """Run the simulation once and publish its result."""
+        if self.simulate is None:
+            raise ValueError("No simulate callable; use publish()")
+        start = time.perf_counter()
+        result = self.simulate()
+        self.record("simulate", time.perf_counter() - start)
+        return self.publish(result)
+
+    def get_stats(self):
+        """Name -> calls, total/last/max/mean time (s); "simulate" is the shared simulation itself."""
+        return {name: dict(stats, mean_time=stats["total_time"] / max(stats["calls"], 1))
+                for name, stats in self.stats.items()}
@@ -0,0 +1,64 @@
+import numpy as np
+from ResultCache import ResultCache
+
+class TimeBase:
+    """Record time grid shared by the model, the analyzers and the GUI.
+
+    Owns t, the sampling frequency and the FFT frequency grid of one record
+    length, plus oscillator tables (sin(2π f t + phase) and its square wave)
+    cached per frequency. A tick only evaluates tones whose frequency has not
+    been seen on this grid; t and the tables are read-only and shared, so
+    callers must not modify them in place.
+    """
+
+    def __init__(self, duration=0.1, n_samples=1000, max_table_bytes=16 * 2**20, endpoint=True):
+        # (kind, frequency[, phase]) -> oscillator table; plain tuple keys, as hashing them costs more than a short sine
+        self.tables = ResultCache(max_table_bytes)
+        self.set_grid(duration, n_samples, endpoint)
+
+    def set_grid(self, duration, n_samples, endpoint=True):
+        """Rebuild t and the frequency grids; cached tables belong to the old grid and are dropped.
+
+        endpoint=False spaces samples duration / n_samples apart, ending one step
+        before duration, so coherent records (SamplingPlanner) repeat seamlessly.
+        """
+        if duration <= 0 or n_samples < 2:
+            raise ValueError(f"Invalid time base: {n_samples} samples over {duration} s")
+        self.duration = duration  # s
+        self.n_samples = n_samples
+        self.endpoint = endpoint
+        self.t = np.linspace(0, duration, n_samples, endpoint=endpoint)
+        self.t.flags.writeable = False
+        self.fs = n_samples / duration  # Sampling frequency
+        self.fft_freqs = np.fft.fftfreq(n_samples, duration / n_samples)[:n_samples//2]
+        self.fft_freqs.flags.writeable = False
+        self.tables.clear()
+
+    def matches(self, duration, n_samples, endpoint=True):
+        return duration == self.duration and n_samples == self.n_samples and endpoint == self.endpoint
+
+    def sine(self, frequency, phase=0.0):
+        """sin(2π frequency t + phase) on the grid."""
+        key = ("sine", float(frequency), float(phase))
+        table = self.tables.get(key)
+        if table is None:
+            table = 2 * np.pi * frequency * self.t
+            if phase != 0:
+                table = table + phase
+            table = np.sin(table)
+            table.flags.writeable = False
+            self.tables.put(key, table, table.nbytes)
+        return table
+
+    def square(self, frequency):
+        """sign(sin(2π frequency t)): the ±1 square wave on the grid."""
+        key = ("square", float(frequency))
+        table = self.tables.get(key)
+        if table is None:
+            table = np.sign(self.sine(frequency))
+            table.flags.writeable = False
+            self.tables.put(key, table, table.nbytes)
+        return table
+
+    def get_stats(self):
+        return self.tables.get_stats()
@@ -0,0 +1,112 @@
+import json
+import os
+import numpy as np
+from WaveformStream import WaveformStream
+
+class WaveformRecorder:
+    """Record streamed waveforms to chunked, memory-mapped .npy files under a RAM budget."""
+
+    stages = ("ac", "rectified", "modulated")
+
+    def __init__(self, model, path, block_size=10000, ram_budget=64 * 2**20, dtype=np.float64):
+        self.stream = WaveformStream(model, block_size)
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        # Only the current chunk of each stage is mapped, so chunks share the budget
+        self.chunk_samples = int(ram_budget // (self.dtype.itemsize * len(self.stages)))
+        if self.chunk_samples < block_size:
+            raise ValueError("RAM budget is too small for one block of every stage")
+        self.n_samples = 0
+        self.chunks = {}  # Stage -> currently mapped chunk
+        os.makedirs(path, exist_ok=True)
+
+    def record(self, n_blocks=None, duration=None):
+        """Stream blocks from the model and append them to disk; returns total samples recorded."""
+        for block in self.stream.blocks(n_blocks, duration):
+            self.write_block(block)
+        self.write_metadata()
+        return self.n_samples
+
+    def write_block(self, block):
+        start = 0
+        n = len(block["t"])
+        while start < n:
+            offset = self.n_samples % self.chunk_samples
+            count = min(n - start, self.chunk_samples - offset)
+            for stage in self.stages:
+                chunk = self.get_chunk(stage, self.n_samples // self.chunk_samples)
+                chunk[offset:offset + count] = block[stage][start:start + count]
+            start += count
+            self.n_samples += count
+            if self.n_samples % self.chunk_samples == 0:
+                self.release_chunks()
+
+    def get_chunk(self, stage, index):
+        if stage not in self.chunks:
+            filename = os.path.join(self.path, f"{stage}_{index:06d}.npy")
+            self.chunks[stage] = np.lib.format.open_memmap(
+                filename, mode="w+", dtype=self.dtype, shape=(self.chunk_samples,))
+        return self.chunks[stage]
+
+    def release_chunks(self):
+        """Flush the mapped chunks to disk and unmap them."""
+        for chunk in self.chunks.values():
+            chunk.flush()
+        self.chunks = {}
+        self.write_metadata()
+
+    def write_metadata(self):
+        for chunk in self.chunks.values():
+            chunk.flush()
+        metadata = {
+            "dt": self.stream.model.dt,
+            "n_samples": self.n_samples,
+            "chunk_samples": self.chunk_samples,
+            "dtype": self.dtype.str,
+            "stages": list(self.stages)
+        }
+        with open(os.path.join(self.path, "metadata.json"), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    def close(self):
+        self.release_chunks()
+
+class WaveformRecording:
+    """Random-access readback of a run written by WaveformRecorder."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "metadata.json")) as f:
+            metadata = json.load(f)
+        self.dt = metadata["dt"]
+        self.n_samples = metadata["n_samples"]
+        self.chunk_samples = metadata["chunk_samples"]
+        self.dtype = np.dtype(metadata["dtype"])
+        self.stages = tuple(metadata["stages"])
+
+    def __len__(self):
+        return self.n_samples
+
+    def read(self, stage, start=0, stop=None):
+        """Return samples [start, stop) of one stage, touching only the chunks that overlap."""
+        if stage not in self.stages:
+            raise ValueError(f"Unknown waveform stage: {stage}")
+        start, stop, _ = slice(start, stop).indices(self.n_samples)
+        out = np.empty(max(stop - start, 0), dtype=self.dtype)
+        position = start
+        while position < stop:
+            index = position // self.chunk_samples
+            offset = position % self.chunk_samples
+            count = min(stop - position, self.chunk_samples - offset)
+            chunk = np.load(os.path.join(self.path, f"{stage}_{index:06d}.npy"), mmap_mode="r")
+            out[position - start:position - start + count] = chunk[offset:offset + count]
+            position += count
+        return out
+
+    def read_time(self, stage, t_start, t_stop):
+        """Return the samples of one stage between two simulation times (s)."""
+        return self.read(stage, int(round(t_start / self.dt)), int(round(t_stop / self.dt)))
+
+    def get_time(self, start=0, stop=None):
+        start, stop, _ = slice(start, stop).indices(self.n_samples)
+        return np.arange(start, stop) * self.dt
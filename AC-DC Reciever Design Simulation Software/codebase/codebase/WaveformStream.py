@@ -0,0 +1,56 @@
+import numpy as np
+
+class StreamState:
+    """State carried by ReceiverModel.generate_waveform from one streamed block to the next."""
+
+    def __init__(self):
+        self.sample = 0  # Index of the first sample of the next block
+        self.filter_output = 0.0  # Last inductive/active filter output (V)
+        self.fm_integral = 0.0  # Running sum of the FM modulating signal
+
+class WaveformStream:
+    """Consecutive fixed-size waveform blocks with continuous time, filter, oscillator and thermal state."""
+
+    def __init__(self, model, block_size=1000):
+        self.model = model
+        self.block_size = block_size  # Samples per block
+        self.reset()
+
+    def reset(self):
+        """Restart at t = 0 with discharged filters and the receiver at ambient temperature."""
+        self.state = StreamState()
+        self.model.dc_voltage = 0
+        self.model.temperature = 25
+        self.model.efficiency = 1.0
+
+    def get_time(self):
+        """Simulated time at the start of the next block (s)."""
+        return self.state.sample * self.model.dt
+
+    def next_block(self):
+        """Generate the next block and advance the stream."""
+        # Absolute sample times keep every oscillator phase continuous across blocks
+        t = (self.state.sample + np.arange(self.block_size)) * self.model.dt
+        ac_voltage, rectified, modulated = self.model.generate_waveform(t, self.state)
+        self.state.sample += self.block_size
+        # The model reuses its buffers for the next block; each block owns its arrays
+        return {
+            "t": t,
+            "ac": ac_voltage.copy(),
+            "rectified": rectified.copy(),
+            "modulated": modulated.copy(),
+            "temperature": self.model.temperature,
+            "efficiency": self.model.efficiency
+        }
+
+    def blocks(self, n_blocks=None, duration=None):
+        """Yield blocks until n_blocks or duration (s) is reached, or indefinitely if neither is given."""
+        if duration is not None:
+            n_blocks = int(np.ceil(duration / (self.block_size * self.model.dt)))
+        count = 0
+        while n_blocks is None or count < n_blocks:
+            yield self.next_block()
+            count += 1
+
+    def __iter__(self):
+        return self.blocks()